@@ -1,5 +1,5 @@
 from flask import Flask,request, jsonify, render_template
-from .extensions import db, migrate
+from .extensions import db, migrate, result_cache, job_queue, report_cache, render_pool, hash_pool, token_cache, revocation_list
 from .config import get_config
 import os
 from app.utils.auth_exceptions import *
@@ -7,6 +7,9 @@ from pydantic import ValidationError
 from app.utils.transaction_exceptions import *
 from app.utils.category_exceptions import *
 from app.utils.summary_exceptions import *
+from app.utils.export_exceptions import *
+from app.utils.job_exceptions import *
+from app.utils.csv_exceptions import *
 from flask_cors import CORS
 
 def create_app():
@@ -29,9 +32,23 @@ def create_app():
 
     db.init_app(app)
     migrate.init_app(app, db)
+    result_cache.init_app(app)
+    report_cache.init_app(app)
+    render_pool.init_app(app)
+    job_queue.init_app(app)
+    hash_pool.init_app(app)
+    token_cache.init_app(app)
+    revocation_list.init_app(app)
 
     # Import models
-    from app.models import user, category, transaction
+    from app.models import user, category, transaction, monthly_rollup, import_session, refresh_token, revoked_token
+    # Registers the ORM hooks that keep monthly_rollups in sync
+    from app.services import rollup_service
+    # Registers the session hooks that bump per-user cache versions on commit
+    from app.services import cache_service
+
+    from app.commands import rollups_cli
+    app.cli.add_command(rollups_cli)
     
     # Register all routes
     from app.routes import api_bp
@@ -48,17 +65,36 @@ def create_app():
         TokenInvalidFormatError: (401, "Invalid authorization header format."),
         TokenExpiredError: (401, "Token expired."),
         TokenInvalidError: (401, "Invalid token."),
+        TokenRevokedError: (401, "Token has been revoked."),
+        PasswordHashingBusyError: (503, "Too many sign-ins in progress. Please retry shortly."),
         SecretKeyMissingError: (500, "Internal configuration missing."),
         CategoryNotFoundError: (404, "Category not found."),
         TransactionNotFoundError: (404, "Transaction not found."),
         TransactionDatabaseError: (500, "Transaction database error."),
+        ConcurrentImportError: (409, "Rows were imported concurrently; please retry."),
         CategoryAlreadyExistsError: (400, "Category already exists."),
         CategoryDatabaseError: (500, "Database error occurred while processing category."),
         SummaryError: (500, "An error occurred while processing the summary."),
         MissingParameterError: (400, "Required query parameters are missing."),
         InvalidPeriodTypeError: (400, "Unsupported period_type provided."),
         SummaryNotFoundError: (404, "No transactions found for the selected period."),
-        SummaryDatabaseError: (500, "Unexpected database or computation error.")
+        SummaryDatabaseError: (500, "Unexpected database or computation error."),
+        ExportError: (500, "An error occurred while generating the export."),
+        DateFormatError: (400, "Invalid date format. Expected YYYY-MM-DD."),
+        UnsupportedExportFormatError: (400, "Unsupported export format."),
+        PDFGenerationError: (500, "PDF generation failed."),
+        CSVGenerationError: (500, "CSV generation failed."),
+        ColumnarExportUnavailableError: (501, "Parquet and Arrow exports are not available on this server."),
+        RenderTimeoutError: (503, "Report rendering timed out. Try a shorter period or an export job."),
+        JobNotFoundError: (404, "Job not found or expired."),
+        JobNotReadyError: (409, "Job has not finished yet."),
+        JobQueueFullError: (503, "Too many background jobs in progress."),
+        CSVImportError: (400, "CSV import failed."),
+        CSVFileTooLargeError: (413, "CSV file is too large."),
+        CSVEncodingError: (400, "CSV file must be UTF-8 encoded."),
+        CSVImportSessionNotFoundError: (404, "Import session not found."),
+        CSVImportSessionStateError: (409, "Import session cannot be resumed in its current state."),
+        UnsupportedImportFormatError: (400, "Unsupported import format."),
     }
 
 
@@ -0,0 +1,20 @@
+import click
+from flask.cli import with_appcontext
+
+from app.services.rollup_service import rebuild_rollups
+
+
+@click.group("rollups")
+def rollups_cli():
+    """Maintain the monthly_rollups summary table."""
+    pass
+
+
+@rollups_cli.command("rebuild")
+@click.option("--user-id", type=int, default=None, help="Only rebuild rollups for this user.")
+@with_appcontext
+def rebuild(user_id):
+    """Recompute monthly_rollups from the transactions table."""
+    written = rebuild_rollups(user_id)
+    scope = f"user {user_id}" if user_id is not None else "all users"
+    click.echo(f"Rebuilt monthly rollups for {scope}: {written} rows written.")
@@ -7,6 +7,67 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY')
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Serve month-aligned summaries from the monthly_rollups table
+    SUMMARY_USE_ROLLUPS = os.environ.get('SUMMARY_USE_ROLLUPS', 'true').lower() == 'true'
+    # Summary result cache: 'lru' (in-process), 'redis' (shared) or 'none';
+    # redis by default once CACHE_REDIS_URL is set
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND') or ('redis' if os.environ.get('CACHE_REDIS_URL') else 'lru')
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 1024))
+    CACHE_TTL = int(os.environ.get('CACHE_TTL', 300))
+    # lru entries miss other workers' writes, so they expire sooner than CACHE_TTL
+    CACHE_LOCAL_TTL = int(os.environ.get('CACHE_LOCAL_TTL', 15))
+    # bcrypt cost for new hashes; logins rehash stored passwords with a different cost
+    BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))
+    # Password hashing threads, calls allowed to wait for one, and seconds to wait (503 beyond)
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 2))
+    PASSWORD_HASH_MAX_PENDING = int(os.environ.get('PASSWORD_HASH_MAX_PENDING', 16))
+    PASSWORD_HASH_TIMEOUT = float(os.environ.get('PASSWORD_HASH_TIMEOUT', 5))
+    # Access token lifetime, and refresh token lifetime (each refresh rotates the refresh token)
+    JWT_ACCESS_EXPIRES = int(os.environ.get('JWT_ACCESS_EXPIRES', 3600))
+    REFRESH_TOKEN_EXPIRES = int(os.environ.get('REFRESH_TOKEN_EXPIRES', 30 * 24 * 3600))
+    # Revoked access tokens: 'db' (revoked_tokens table, shared) or 'memory' (this process only);
+    # each process re-reads new revocations at most this often
+    TOKEN_REVOCATION_STORE = os.environ.get('TOKEN_REVOCATION_STORE', 'db')
+    TOKEN_REVOCATION_SYNC_SECONDS = float(os.environ.get('TOKEN_REVOCATION_SYNC_SECONDS', 5))
+    # Verified JWT claims kept per process (0 = verify every request); entries end at exp or TTL
+    JWT_CACHE_MAX_ENTRIES = int(os.environ.get('JWT_CACHE_MAX_ENTRIES', 4096))
+    JWT_CACHE_TTL = int(os.environ.get('JWT_CACHE_TTL', 60))
+    BULK_TRANSACTIONS_MAX_ITEMS = int(os.environ.get('BULK_TRANSACTIONS_MAX_ITEMS', 10000))
+    # Largest accepted CSV import upload (whole multipart request body)
+    CSV_IMPORT_MAX_BYTES = int(os.environ.get('CSV_IMPORT_MAX_BYTES', 20 * 1024 * 1024))
+    # Rows per committed chunk in background (async) CSV imports
+    CSV_IMPORT_CHUNK_ROWS = int(os.environ.get('CSV_IMPORT_CHUNK_ROWS', 1000))
+    # Stored uploads of resumable (async) imports; use a persistent volume in production
+    IMPORT_SESSION_DIR = os.environ.get('IMPORT_SESSION_DIR')
+    # A running import session whose job has not committed a chunk for this long can be resumed elsewhere
+    IMPORT_SESSION_LEASE_SECONDS = int(os.environ.get('IMPORT_SESSION_LEASE_SECONDS', 300))
+    # Rows per pandas read_csv chunk in the vectorized import engine / dry runs
+    CSV_IMPORT_FRAME_CHUNK_ROWS = int(os.environ.get('CSV_IMPORT_FRAME_CHUNK_ROWS', 50000))
+    # Rows fetched per round trip when streaming exports
+    EXPORT_YIELD_PER = int(os.environ.get('EXPORT_YIELD_PER', 1000))
+    # Parquet row group / Arrow record batch size, and in-memory limit of their temp file
+    EXPORT_ROW_GROUP_ROWS = int(os.environ.get('EXPORT_ROW_GROUP_ROWS', 10000))
+    EXPORT_SPOOL_MAX_BYTES = int(os.environ.get('EXPORT_SPOOL_MAX_BYTES', 8 * 1024 * 1024))
+    # Background jobs: worker threads, queued+running cap, seconds results are kept
+    JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 2))
+    JOB_MAX_PENDING = int(os.environ.get('JOB_MAX_PENDING', 20))
+    JOB_RESULT_TTL = int(os.environ.get('JOB_RESULT_TTL', 3600))
+    JOB_ARTIFACT_DIR = os.environ.get('JOB_ARTIFACT_DIR')
+    # Rendered PDF/CSV reports, keyed by the user's data version; size-bounded LRU on disk
+    REPORT_CACHE_ENABLED = os.environ.get('REPORT_CACHE_ENABLED', 'true').lower() == 'true'
+    REPORT_CACHE_DIR = os.environ.get('REPORT_CACHE_DIR')
+    REPORT_CACHE_MAX_BYTES = int(os.environ.get('REPORT_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+    # Capped at CACHE_LOCAL_TTL unless the cache backend shares versions (redis)
+    REPORT_CACHE_TTL = int(os.environ.get('REPORT_CACHE_TTL', 300))
+    # PDF layout: 'process' renders in a worker process pool, 'inline' in the request thread
+    PDF_RENDER_MODE = os.environ.get('PDF_RENDER_MODE', 'process')
+    PDF_RENDER_WORKERS = int(os.environ.get('PDF_RENDER_WORKERS', 2))
+    PDF_RENDER_TIMEOUT = float(os.environ.get('PDF_RENDER_TIMEOUT', 60))
+    # Reports above this many rows are laid out page by page from a streaming query
+    # into a temp file that stays in memory up to PDF_SPOOL_MAX_BYTES
+    PDF_LARGE_REPORT_ROWS = int(os.environ.get('PDF_LARGE_REPORT_ROWS', 5000))
+    PDF_SPOOL_MAX_BYTES = int(os.environ.get('PDF_SPOOL_MAX_BYTES', 8 * 1024 * 1024))
 
 
 class DevelopmentConfig(Config):
@@ -22,6 +83,9 @@ class ProductionConfig(Config):
 class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///budgetwise_dev.db"
+    PDF_RENDER_MODE = "inline"
+    # Process-local fake, so request statement counts do not include revocation syncs
+    TOKEN_REVOCATION_STORE = "memory"
 
 def get_config(env_name):
     """Return the correct config class based on environment name."""
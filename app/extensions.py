@@ -1,7 +1,21 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
+from app.utils.hash_pool import HashPool
+from app.utils.job_queue import JobQueue
+from app.utils.render_pool import RenderPool
+from app.utils.report_cache import ReportCache
+from app.utils.result_cache import ResultCache
+from app.utils.revocation_list import RevocationList
+from app.utils.token_cache import TokenCache
 
 db = SQLAlchemy()
 migrate = Migrate()
-jwt = JWTManager()
\ No newline at end of file
+jwt = JWTManager()
+result_cache = ResultCache()
+job_queue = JobQueue()
+report_cache = ReportCache()
+render_pool = RenderPool()
+hash_pool = HashPool()
+token_cache = TokenCache()
+revocation_list = RevocationList()
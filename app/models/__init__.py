@@ -2,5 +2,9 @@
 from .user import User
 from .transaction import Transaction
 from .category import Category
+from .monthly_rollup import MonthlyRollup
+from .import_session import ImportSession
+from .refresh_token import RefreshToken
+from .revoked_token import RevokedToken
 
-__all__ = ["User", "Transaction", "Category"]
+__all__ = ["User", "Transaction", "Category", "MonthlyRollup", "ImportSession", "RefreshToken", "RevokedToken"]
@@ -2,6 +2,9 @@ from app.extensions import db
 
 class Category(db.Model):
     __tablename__ = "categories"
+    __table_args__ = (
+        db.UniqueConstraint("user_id", "name", "type", name="uq_categories_user_name_type"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -10,4 +13,8 @@ class Category(db.Model):
 
     
 
-    transactions = db.relationship("Transaction", backref="category", lazy=True)
+    # Every transaction read path renders category.name, so the many-to-one side
+    # is joined-loaded instead of issuing one SELECT per transaction row.
+    transactions = db.relationship(
+        "Transaction", backref=db.backref("category", lazy="joined"), lazy=True
+    )
@@ -0,0 +1,59 @@
+from app.extensions import db
+from datetime import datetime
+
+
+class ImportSession(db.Model):
+    """
+    A resumable CSV import: the stored upload plus a checkpoint (byte offset
+    and row number after the last committed chunk) and running totals. The
+    checkpoint is written in the same DB transaction as the chunk's rows.
+
+    A job owns the session while status is "running" and job_id is its id;
+    it renews heartbeat_at with every chunk. A running session whose
+    heartbeat is older than IMPORT_SESSION_LEASE_SECONDS (the job crashed)
+    can be claimed again.
+    """
+
+    __tablename__ = "import_sessions"
+
+    id = db.Column(db.String(32), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
+    filename = db.Column(db.String(255))
+    format = db.Column(db.String(20), nullable=False, default="csv")  # app.services.importers name
+    path = db.Column(db.String(500), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default="pending")  # pending / running / completed / failed
+    job_id = db.Column(db.String(32))  # background job that last ran (or is running) this session
+    heartbeat_at = db.Column(db.DateTime)  # last sign of life from the job holding the session
+    error = db.Column(db.Text)
+
+    byte_offset = db.Column(db.BigInteger, nullable=False, default=0)
+    rows_committed = db.Column(db.Integer, nullable=False, default=0)
+    inserted = db.Column(db.Integer, nullable=False, default=0)
+    duplicates = db.Column(db.Integer, nullable=False, default=0)
+    failed = db.Column(db.Integer, nullable=False, default=0)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @property
+    def failures_path(self) -> str:
+        return f"{self.path}.failures.ndjson"
+
+    def to_dict(self) -> dict:
+        return {
+            "session_id": self.id,
+            "filename": self.filename,
+            "format": self.format,
+            "status": self.status,
+            "job_id": self.job_id,
+            "error": self.error,
+            "rows_committed": self.rows_committed,
+            "inserted": self.inserted,
+            "duplicates": self.duplicates,
+            "failed": self.failed,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+    def __repr__(self):
+        return f"<ImportSession {self.id} {self.status} row {self.rows_committed}>"
@@ -0,0 +1,19 @@
+from app.extensions import db
+
+
+class MonthlyRollup(db.Model):
+    """Per-user monthly count/sum of transactions, grouped by category and type."""
+
+    __tablename__ = "monthly_rollups"
+
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), primary_key=True)
+    year = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    month = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    category_id = db.Column(db.Integer, db.ForeignKey("categories.id"), primary_key=True, autoincrement=False)
+    type = db.Column(db.String(50), primary_key=True)  # transaction type: 'income' or 'expense'
+
+    transaction_count = db.Column(db.Integer, nullable=False, default=0)
+    total_amount = db.Column(db.Numeric(14, 2), nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<MonthlyRollup {self.user_id} {self.year}-{self.month:02d} {self.type}: {self.total_amount}>"
@@ -0,0 +1,25 @@
+from app.extensions import db
+from datetime import datetime
+
+
+class RefreshToken(db.Model):
+    """
+    A refresh token, stored as the sha256 of the opaque value sent to the
+    client. Each refresh marks the token used and issues a successor in the
+    same family; presenting a used token again revokes the whole family.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
+    token_hash = db.Column(db.String(64), unique=True, nullable=False)
+    family_id = db.Column(db.String(32), nullable=False, index=True)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    expires_at = db.Column(db.DateTime, nullable=False)
+    used_at = db.Column(db.DateTime)      # rotated: exchanged for a successor
+    revoked_at = db.Column(db.DateTime)   # logout or reuse detected
+
+    def __repr__(self):
+        return f"<RefreshToken {self.id} user {self.user_id} family {self.family_id}>"
@@ -0,0 +1,18 @@
+from app.extensions import db
+
+
+class RevokedToken(db.Model):
+    """
+    Access token ids (jti) revoked before their exp. Processes copy new rows
+    into their in-memory RevocationList by id; rows past expires_at no longer
+    matter and are purged.
+    """
+
+    __tablename__ = "revoked_tokens"
+
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(32), unique=True, nullable=False)
+    expires_at = db.Column(db.BigInteger, nullable=False, index=True)  # the token's exp (unix seconds)
+
+    def __repr__(self):
+        return f"<RevokedToken {self.jti}>"
@@ -4,6 +4,14 @@ from datetime import datetime
 
 class Transaction(db.Model):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Listing / cursor pagination, date-range summaries and exports
+        db.Index("ix_transactions_user_date_id", "user_id", "created_date", "id"),
+        # Per-type totals and top-N by amount on the dashboard
+        db.Index("ix_transactions_user_type_amount", "user_id", "type", "amount"),
+        # Import deduplication (NULL for rows created through the API)
+        db.Index("ux_transactions_fingerprint", "fingerprint", unique=True),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
@@ -15,6 +23,8 @@ class Transaction(db.Model):
     
     created_date = db.Column(db.Date, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Import dedup key: transaction_service.transaction_fingerprint (bulk imports hash via the same helper)
+    fingerprint = db.Column(db.String(64), nullable=True)
 
     user = db.relationship("User", back_populates="transactions")
 
@@ -1,4 +1,5 @@
 from flask import Blueprint, jsonify
+from app.extensions import result_cache
 from app.routes.auth_routes import auth_bp
 from app.routes.transaction_routes import transaction_bp
 from app.routes.category_routes import category_bp
@@ -14,7 +15,10 @@ api_bp = Blueprint("api", __name__)
 # 🧩 Health check / root route
 @api_bp.route("/health", methods=["GET"])
 def index():
-    return jsonify({"message": "BudgetWise API running successfully 🚀"}), 200
+    return jsonify({
+        "message": "BudgetWise API running successfully 🚀",
+        "result_cache": result_cache.stats(),
+    }), 200
 
 # Register sub-blueprints with prefixes
 api_bp.register_blueprint(auth_bp, url_prefix="/auth")
@@ -7,10 +7,13 @@ from app.schemas.auth_schema import (
     RegisterResponse,
     LoginResponse,
     LogoutResponse,
+    TokenResponse,
     UserDetailResponse,
 )
 from app.utils.protected import auth_required
-from app.schemas.auth_schema import RegisterSchema, LoginSchema  # your request schemas
+from app.utils.security import decode_jwt_token
+from app.utils.auth_exceptions import AuthBaseError
+from app.schemas.auth_schema import RegisterSchema, LoginSchema, RefreshSchema, LogoutSchema  # your request schemas
 
 
 auth_bp = Blueprint("auth", __name__)
@@ -76,12 +79,43 @@ def get_current_user():
     return jsonify(validated_response.model_dump()), status
 
     
+# -----------------------------
+# REFRESH
+# -----------------------------
+@auth_bp.route("/refresh", methods=["POST"])
+def refresh():
+    """Exchange a refresh token for a new access token and a new refresh token."""
+    try:
+        validated_data = RefreshSchema(**(request.get_json(silent=True) or {}))
+    except ValidationError as ve:
+        return jsonify({"message": "Invalid input", "errors": ve.errors()}), 400
+
+    response, status = AuthService.refresh_tokens(validated_data.refresh_token)
+    return jsonify(TokenResponse(**response).model_dump()), status
+
+
 # -----------------------------
 # LOGOUT
 # -----------------------------
 @auth_bp.route("/logout", methods=["POST"])
 def logout():
-    
-    response, status = AuthService.logout()
+    """
+    Revoke the bearer access token (if any, and still valid) and the
+    refresh token sent as {"refresh_token": ...} (if any).
+    """
+    try:
+        validated_data = LogoutSchema(**(request.get_json(silent=True) or {}))
+    except ValidationError as ve:
+        return jsonify({"message": "Invalid input", "errors": ve.errors()}), 400
+
+    access_claims = None
+    parts = request.headers.get("Authorization", "").split(" ")
+    if len(parts) == 2 and parts[0].lower() == "bearer":
+        try:
+            access_claims = decode_jwt_token(parts[1])
+        except AuthBaseError:
+            pass  # an expired or invalid token needs no revoking
+
+    response, status = AuthService.logout(access_claims, validated_data.refresh_token)
     return jsonify(LogoutResponse(**response).model_dump()), status
     
\ No newline at end of file
@@ -1,36 +1,183 @@
-from flask import Blueprint, Response, jsonify, request
+import math
+import uuid
+from flask import Blueprint, Response, current_app, jsonify, request, url_for
+from werkzeug.exceptions import RequestEntityTooLarge
 from app.models import Category, Transaction, User
 from app.schemas.transaction_schemas import TransactionCreateSchema
-from app.services.csv_services import import_transactions_via_route
+from app.services.csv_services import (
+    claim_import_session,
+    create_import_session,
+    get_import_session,
+    import_transactions,
+    import_transactions_frame,
+    open_csv_upload,
+    release_import_session,
+    run_import_session,
+)
+from app.services.importers import importer_for
 from app.services.transaction_service import create_transaction
 from app.utils.protected import auth_required
-from app.extensions import db
+from app.utils.csv_exceptions import (
+    CSVFileTooLargeError,
+    CSVImportError,
+    CSVImportSessionStateError,
+    UnsupportedImportFormatError,
+)
+from app.utils.job_exceptions import JobNotReadyError
+from app.utils.transaction_exceptions import ConcurrentImportError
+from app.extensions import db, job_queue
 from pydantic import ValidationError
 from sqlalchemy import func
 
 csv_bp = Blueprint('csv', __name__)
 
+
+def _flag(name: str) -> bool:
+    return request.args.get(name, "").lower() in ("1", "true", "yes")
+
+
+def _submit_import_session(session):
+    """
+    Claim the session for a new background job and queue that job, which
+    imports the session's upload from its checkpoint. The claim is one
+    conditional UPDATE, so only one worker can start (or resume) a session.
+    """
+    previous_status = session.status
+    job_id = uuid.uuid4().hex
+    if not claim_import_session(session.id, job_id):
+        db.session.refresh(session)
+        if session.status == "completed":
+            raise CSVImportSessionStateError("Import session has already completed.")
+        raise CSVImportSessionStateError("Import session is already running.")
+    try:
+        job = job_queue.submit(
+            current_app._get_current_object(), session.user_id, "import.csv", run_import_session,
+            session.id, job_id=job_id, chunk_rows=current_app.config["CSV_IMPORT_CHUNK_ROWS"],
+        )
+    except Exception:
+        release_import_session(session.id, job_id, previous_status)
+        raise
+
+    status_url = url_for("api.csv.import_job_status", job_id=job.id)
+    return jsonify({
+        **job.to_dict(),
+        "status_url": status_url,
+        "failures_url": url_for("api.csv.import_job_failures", job_id=job.id),
+        "session_id": session.id,
+        "session_url": url_for("api.csv.import_session_status", session_id=session.id),
+        "resume_url": url_for("api.csv.resume_import_session", session_id=session.id),
+    }), 202, {"Location": status_url}
+
+
 @csv_bp.route("/import", methods=["POST"])
 @auth_required
 def import_data():
     """
-    Upload a CSV file and import transactions by calling the /log-transaction API for each row.
+    Upload a CSV file and import its transactions in one bulk DB transaction.
+    OFX/QFX, QIF and NDJSON files are read by the importers registered in
+    app.services.importers, picked by ?format= or the file extension.
+    The upload is decoded straight from its request stream, so concurrent
+    imports never share a file on disk. With ?async=true the file is stored
+    in a resumable import session and imported by a background job instead;
+    the job and session ids are returned (202).
+
+    ?engine=pandas validates with vectorized column operations and reports
+    only failed rows; ?dry_run=true runs that validation without touching
+    the database.
     """
-    if "file" not in request.files:
+    max_bytes = current_app.config["CSV_IMPORT_MAX_BYTES"]
+    # Checked by werkzeug while the multipart body is read, chunked uploads included
+    request.max_content_length = max_bytes
+    try:
+        files = request.files
+    except RequestEntityTooLarge:
+        raise CSVFileTooLargeError(f"CSV file is too large (limit {max_bytes} bytes).")
+
+    if "file" not in files:
         return jsonify({"error": "CSV file is required"}), 400
 
-    file = request.files["file"]
+    file = files["file"]
     user_id = request.user_id
+    importer = importer_for(file.filename, request.args.get("format"))
+
+    dry_run = _flag("dry_run")
+    frame_engine = dry_run or request.args.get("engine") == "pandas"
+    if frame_engine and importer.name != "csv":
+        raise UnsupportedImportFormatError("dry_run and engine=pandas are only available for CSV uploads.")
+    if _flag("async") and not dry_run:
+        return _submit_import_session(create_import_session(user_id, file, importer.name))
 
     try:
-        # Save uploaded CSV temporarily
-        temp_path = f"transactions.csv"
-        file.save(temp_path)
+        if frame_engine:
+            response = import_transactions_frame(
+                file.stream, user_id, dry_run=dry_run,
+                chunk_rows=current_app.config["CSV_IMPORT_FRAME_CHUNK_ROWS"],
+            )
+            return jsonify(response), 200 if dry_run else 201
 
-        # Call your import logic
-        response = import_transactions_via_route(temp_path,user_id)
+        with open_csv_upload(file.stream) as csvfile:
+            response = import_transactions(csvfile, user_id, importer=importer)
 
         return jsonify(response), 201
 
+    except (CSVImportError, ConcurrentImportError):
+        raise
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file
+        return jsonify({"error": str(e)}), 500
+
+
+@csv_bp.route("/import/jobs/<job_id>", methods=["GET"])
+@auth_required
+def import_job_status(job_id):
+    """Progress (lines read, rows parsed / inserted / failed) and, once finished, the import totals."""
+    job = job_queue.get(job_id, request.user_id)
+    response = job.to_dict()
+    if job.result is not None:
+        response["result"] = {k: v for k, v in job.result.items() if k != "failures"}
+    response["failures_url"] = url_for("api.csv.import_job_failures", job_id=job.id)
+    return jsonify(response), 200
+
+
+@csv_bp.route("/import/jobs/<job_id>/failures", methods=["GET"])
+@auth_required
+def import_job_failures(job_id):
+    """Failed rows of a finished import job, page / per_page at a time."""
+    job = job_queue.get(job_id, request.user_id)
+
+    if job.status == "failed":
+        raise CSVImportError(f"Import job failed: {job.error}")
+    if job.status != "finished":
+        raise JobNotReadyError(f"Import job is still {job.status}.")
+
+    page = max(request.args.get("page", 1, type=int), 1)
+    per_page = min(max(request.args.get("per_page", 50, type=int), 1), 500)
+    failures = job.result["failures"]
+
+    return jsonify({
+        "job_id": job.id,
+        "page": page,
+        "per_page": per_page,
+        "total_pages": math.ceil(len(failures) / per_page),
+        "total_items": len(failures),
+        "failures": failures[(page - 1) * per_page:page * per_page],
+    }), 200
+
+
+@csv_bp.route("/import/sessions/<session_id>", methods=["GET"])
+@auth_required
+def import_session_status(session_id):
+    """Checkpoint and running totals of an import session; they survive restarts, unlike job status."""
+    session = get_import_session(session_id, request.user_id)
+    return jsonify(session.to_dict()), 200
+
+
+@csv_bp.route("/import/sessions/<session_id>/resume", methods=["POST"])
+@auth_required
+def resume_import_session(session_id):
+    """
+    Restart an interrupted import from its last committed chunk. Rows before
+    the checkpoint are not re-imported, so nothing is processed twice. A
+    session still held by a live job, on any worker, is refused with 409
+    until that job's lease (IMPORT_SESSION_LEASE_SECONDS) lapses.
+    """
+    return _submit_import_session(get_import_session(session_id, request.user_id))
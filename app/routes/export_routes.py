@@ -1,18 +1,146 @@
-from flask import jsonify, send_file, request, Blueprint
+from flask import jsonify, send_file, request, Blueprint, Response, current_app, stream_with_context, url_for
+import os
 from io import BytesIO
+from tempfile import SpooledTemporaryFile
 from datetime import datetime, date
-from app.models.transaction import Transaction
+from app.extensions import db, job_queue, render_pool, report_cache
 from app.models.user import User
-from app.services.export_services import generate_csv_report, generate_pdf_report
+from app.services.export_services import (
+    COLUMNAR_FORMATS,
+    EXPORT_FORMATS,
+    export_pdf_rows,
+    export_totals,
+    export_transactions_query,
+    iter_csv_report,
+    iter_pdf_rows,
+    render_pdf_rows,
+    require_pyarrow,
+    run_export_job,
+    write_columnar_report,
+    write_pdf_report,
+)
 from app.utils.protected import auth_required
-from datetime import datetime, date
-from app.utils.export_exceptions import DateFormatError
+from app.utils.export_exceptions import DateFormatError, ExportError, UnsupportedExportFormatError
 from app.utils.export_exceptions import PDFGenerationError
-from app.utils.export_exceptions import CSVGenerationError
+from app.utils.job_exceptions import JobNotReadyError
 
 
 export_bp = Blueprint("export", __name__)
 
+
+def _export_period(params):
+    """(start_date, end_date, type) from request params; defaults to month-to-date."""
+    try:
+        start_date_str = params.get("start_date")
+        end_date_str = params.get("end_date")
+
+        if start_date_str:
+            start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
+        else:
+            start_date = date.today().replace(day=1)
+
+        if end_date_str:
+            end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
+        else:
+            end_date = date.today()
+
+    except (TypeError, ValueError):
+        raise DateFormatError("Invalid date format. Expected YYYY-MM-DD.")
+
+    if start_date > end_date:
+        raise DateFormatError("start_date cannot be after end_date.")
+
+    return start_date, end_date, params.get("type", "all")
+
+
+def _send_report(file, fmt, etag=None):
+    """send_file for a report; with an ETag it also answers conditional and Range requests."""
+    mimetype, download_name = EXPORT_FORMATS[fmt]
+    if etag is None:
+        return send_file(file, mimetype=mimetype, as_attachment=True, download_name=download_name)
+
+    response = send_file(
+        file, mimetype=mimetype, as_attachment=True, download_name=download_name,
+        conditional=True, etag=etag,
+    )
+    response.cache_control.private = True
+    return response
+
+
+def _send_rendered(path, fmt, cache_key):
+    """
+    Send a report just rendered and cached under cache_key. Without shared
+    versions the client's copy may carry the same ETag yet predate another
+    worker's write, so the fresh render goes out in full instead of as a 304.
+    """
+    if report_cache.versions.versions_shared:
+        return _send_report(path, fmt, etag=cache_key)
+
+    mimetype, download_name = EXPORT_FORMATS[fmt]
+    response = send_file(path, mimetype=mimetype, as_attachment=True, download_name=download_name)
+    response.set_etag(cache_key)
+    response.cache_control.private = True
+    return response
+
+
+def _cached_report(cache_key, fmt):
+    """304 or the cached file for this report key, or None on a cache miss."""
+    if cache_key is None:
+        return None
+
+    path = report_cache.get(cache_key)
+
+    # With shared (redis) versions the key covers the user's current data
+    # version, so a matching ETag is current even if the file has since been
+    # evicted. Process-local versions only see this worker's writes: trust the
+    # ETag only while the file is cached here and within REPORT_CACHE_TTL.
+    if path is None and report_cache.versions.versions_shared and request.if_none_match.contains(cache_key):
+        response = Response(status=304)
+        response.set_etag(cache_key)
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        return response
+
+    if path is None:
+        return None
+    try:
+        return _send_report(path, fmt, etag=cache_key)
+    except FileNotFoundError:
+        # Evicted by another request between lookup and send; render it again
+        return None
+
+
+def _send_spooled(spooled, fmt):
+    """send_file for a temp file object, adding the Content-Length and Range handling it only does for paths."""
+    size = spooled.seek(0, os.SEEK_END)
+    spooled.seek(0)
+    response = _send_report(spooled, fmt)
+    response.content_length = size
+    return response.make_conditional(request, accept_ranges=True, complete_length=size)
+
+
+def _large_pdf_report(query, report, cache_key):
+    """
+    Large-report mode: rows stream from a yield_per query and page tables are
+    built only as reportlab reaches them, written to a SpooledTemporaryFile.
+    The rows come from this request's DB cursor, so layout runs in-process
+    rather than in the render pool.
+    """
+    spooled = SpooledTemporaryFile(max_size=current_app.config["PDF_SPOOL_MAX_BYTES"])
+    try:
+        write_pdf_report(spooled, iter_pdf_rows(query, current_app.config["EXPORT_YIELD_PER"]), **report)
+    except Exception as e:
+        spooled.close()
+        raise PDFGenerationError(str(e))
+
+    if cache_key is not None:
+        with spooled:
+            path = report_cache.put_file(cache_key, spooled)
+        return _send_rendered(path, "pdf", cache_key)
+
+    return _send_spooled(spooled, "pdf")
+
+
 @export_bp.route('/', methods=['GET'])
 @auth_required
 def test():
@@ -29,73 +157,41 @@ def download_pdf():
     if not user:
         return jsonify({"message": "User not found"}), 404
 
-    # optional date filters
-    start_date_str = request.args.get("start_date")
-    end_date_str = request.args.get("end_date")
-    type = request.args.get("type", "all")
+    start_date, end_date, type = _export_period(request.args)
+    cache_key = report_cache.key_for(user_id, "pdf", start_date, end_date, type)
+    cached = _cached_report(cache_key, "pdf")
+    if cached is not None:
+        return cached
 
-    try:
-        if start_date_str:
-            start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-            print(start_date)
-        else:
-            start_date = date.today().replace(day=1)
+    query = export_transactions_query(user_id, start_date, end_date, type)
+    row_count = query.order_by(None).count()
 
-        if end_date_str:
-            end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
-            print(end_date)
-        else:
-            end_date = date.today()
+    if not row_count:
+        return jsonify({"message": "No transactions found for this period."}), 404
 
-        if start_date > end_date:
-            raise DateFormatError("start_date cannot be after end_date.")
-        
-        if type in ["income", "expense"]:
-            transactions = (
-            Transaction.query
-            .filter(Transaction.user_id == user_id)
-            .filter(Transaction.created_date >= start_date)
-            .filter(Transaction.created_date <= end_date)
-            .filter(Transaction.type == type)
-            .all()
-            )
-        else:
-            transactions = (
-            Transaction.query
-            .filter(Transaction.user_id == user_id)
-            .filter(Transaction.created_date >= start_date)
-            .filter(Transaction.created_date <= end_date)
-            .all()
-            )
-
-    except ValueError:
-        raise DateFormatError("Invalid date format. Expected YYYY-MM-DD.")
+    report = dict(
+        user_id=user_id,
+        user_name=user.username,
+        user_email=user.email,
+        start_date=start_date,
+        end_date=end_date,
+        totals=export_totals(query)
+    )
 
-    if not transactions:
-        return jsonify({"message": "No transactions found for this period."}), 404
+    if row_count > current_app.config["PDF_LARGE_REPORT_ROWS"]:
+        return _large_pdf_report(query, report, cache_key)
 
     try:
-        pdf_bytes = BytesIO(
-            generate_pdf_report(
-                user_id=user_id,
-                user_name=user.username,
-                user_email=user.email,
-                transactions=transactions,
-                start_date=start_date,
-                end_date=end_date
-            )
-        )
+        pdf = render_pool.run(render_pdf_rows, export_pdf_rows(query), **report)
+    except PDFGenerationError:
+        raise
     except Exception as e:
         raise PDFGenerationError(str(e))
 
-    pdf_bytes.seek(0)
+    if cache_key is not None:
+        return _send_rendered(report_cache.put(cache_key, pdf), "pdf", cache_key)
 
-    return send_file(
-        pdf_bytes,
-        mimetype='application/pdf',
-        as_attachment=True,
-        download_name='budgetwise_report.pdf'
-    )
+    return _send_report(BytesIO(pdf), "pdf")
 
 
 @export_bp.route('/csv', methods=['GET'])
@@ -105,70 +201,142 @@ def download_csv():
 
     user_id = request.user_id
     user = User.query.get(user_id)
-    type = request.args.get("type", "all")
 
     if not user:
         return jsonify({"message": "User not found"}), 404
 
-    # optional date filters
-    start_date_str = request.args.get("start_date")
-    end_date_str = request.args.get("end_date")
+    start_date, end_date, type = _export_period(request.args)
+    cache_key = report_cache.key_for(user_id, "csv", start_date, end_date, type)
+    cached = _cached_report(cache_key, "csv")
+    if cached is not None:
+        return cached
 
-    try:
-        if start_date_str:
-            start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-        else:
-            start_date = date.today().replace(day=1)
+    transactions = export_transactions_query(user_id, start_date, end_date, type)
 
-        if end_date_str:
-            end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
-        else:
-            end_date = date.today()
+    if not db.session.query(transactions.exists()).scalar():
+        return jsonify({"message": "No transactions found for this period."}), 404
 
-        if start_date > end_date:
-            raise DateFormatError("start_date cannot be after end_date.")
-        
-        if type in ["income", "expense"]:
-            transactions = (
-            Transaction.query
-            .filter(Transaction.user_id == user_id)
-            .filter(Transaction.created_date >= start_date)
-            .filter(Transaction.created_date <= end_date)
-            .filter(Transaction.type == type)
-            .all()
-            )
-        else:
-            transactions = (
-            Transaction.query
-            .filter(Transaction.user_id == user_id)
-            .filter(Transaction.created_date >= start_date)
-            .filter(Transaction.created_date <= end_date)
-            .all()
-            )
-
-    except ValueError:
-        raise DateFormatError("Invalid date format. Expected YYYY-MM-DD.")
+    # Rows are fetched in yield_per batches and written straight to the response,
+    # so the export never holds the full result set in memory. Headers are sent
+    # before the first row, so failures past this point abort the download.
+    csv_stream = iter_csv_report(
+        user_id=user_id,
+        user_name=user.username,
+        user_email=user.email,
+        transactions=transactions.yield_per(current_app.config["EXPORT_YIELD_PER"])
+    )
+    # The streamed copy is committed to the report cache once the last row is sent
+    if cache_key is not None:
+        csv_stream = report_cache.put_stream(cache_key, csv_stream)
+
+    response = Response(
+        stream_with_context(csv_stream),
+        mimetype='text/csv',
+        headers={"Content-Disposition": "attachment; filename=budgetwise_report.csv"}
+    )
+    if cache_key is not None:
+        response.set_etag(cache_key)
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+    return response
+
+
+@export_bp.route('/parquet', methods=['GET'], defaults={"fmt": "parquet"})
+@export_bp.route('/arrow', methods=['GET'], defaults={"fmt": "arrow"})
+@auth_required
+def download_columnar(fmt):
+    """Transactions as a Parquet or Arrow IPC file, for loading straight into pandas/pyarrow"""
+
+    require_pyarrow()
+    user_id = request.user_id
+
+    if not User.query.get(user_id):
+        return jsonify({"message": "User not found"}), 404
+
+    start_date, end_date, type = _export_period(request.args)
+    cache_key = report_cache.key_for(user_id, fmt, start_date, end_date, type)
+    cached = _cached_report(cache_key, fmt)
+    if cached is not None:
+        return cached
 
-    if not transactions:
+    query = export_transactions_query(user_id, start_date, end_date, type)
+    if not db.session.query(query.exists()).scalar():
         return jsonify({"message": "No transactions found for this period."}), 404
 
+    spooled = SpooledTemporaryFile(max_size=current_app.config["EXPORT_SPOOL_MAX_BYTES"])
     try:
-        csv_data = generate_csv_report(
-            user_id=user_id,
-            user_name=user.username,
-            user_email=user.email,
-            transactions=transactions
-        )
+        write_columnar_report(spooled, query, fmt, current_app.config["EXPORT_ROW_GROUP_ROWS"])
     except Exception as e:
-        raise CSVGenerationError(str(e))
+        spooled.close()
+        raise ExportError(f"{fmt.capitalize()} export failed: {e}")
 
-    csv_bytes = BytesIO()
-    csv_bytes.write(csv_data.encode("utf-8"))
-    csv_bytes.seek(0)
+    if cache_key is not None:
+        with spooled:
+            path = report_cache.put_file(cache_key, spooled)
+        return _send_rendered(path, fmt, cache_key)
 
-    return send_file(
-        csv_bytes,
-        mimetype='text/csv',
-        as_attachment=True,
-        download_name='budgetwise_report.csv'
-    )
\ No newline at end of file
+    return _send_spooled(spooled, fmt)
+
+
+# =========================
+# BACKGROUND EXPORT JOBS
+# =========================
+@export_bp.route('/jobs', methods=['POST'])
+@auth_required
+def create_export_job():
+    """Queue a PDF/CSV/Parquet/Arrow export and return its job id right away (202)."""
+
+    user_id = request.user_id
+    params = request.get_json(silent=True) or request.args
+    fmt = (params.get("format") or "pdf").lower()
+
+    if fmt not in EXPORT_FORMATS:
+        raise UnsupportedExportFormatError(
+            f"Unsupported format '{fmt}'. Use one of: {', '.join(EXPORT_FORMATS)}."
+        )
+    if fmt in COLUMNAR_FORMATS:
+        require_pyarrow()
+
+    if not User.query.get(user_id):
+        return jsonify({"message": "User not found"}), 404
+
+    start_date, end_date, type = _export_period(params)
+    query = export_transactions_query(user_id, start_date, end_date, type)
+    if not db.session.query(query.exists()).scalar():
+        return jsonify({"message": "No transactions found for this period."}), 404
+
+    job = job_queue.submit(
+        current_app._get_current_object(), user_id, f"export.{fmt}", run_export_job,
+        user_id, fmt, start_date, end_date, type,
+        yield_per=current_app.config["EXPORT_YIELD_PER"],
+    )
+
+    status_url = url_for("api.export.export_job_status", job_id=job.id)
+    return jsonify({
+        **job.to_dict(),
+        "status_url": status_url,
+        "download_url": url_for("api.export.download_export_job", job_id=job.id),
+    }), 202, {"Location": status_url}
+
+
+@export_bp.route('/jobs/<job_id>', methods=['GET'])
+@auth_required
+def export_job_status(job_id):
+    """Status and progress (rows processed / total) of an export job."""
+    job = job_queue.get(job_id, request.user_id)
+    return jsonify(job.to_dict()), 200
+
+
+@export_bp.route('/jobs/<job_id>/download', methods=['GET'])
+@auth_required
+def download_export_job(job_id):
+    """Serve the finished artifact of an export job."""
+    job = job_queue.get(job_id, request.user_id)
+
+    if job.status == "failed":
+        raise ExportError(f"Export job failed: {job.error}")
+    if job.status != "finished":
+        raise JobNotReadyError(f"Export job is still {job.status}.")
+
+    path, mimetype, download_name = job.artifact
+    return send_file(path, mimetype=mimetype, as_attachment=True, download_name=download_name)
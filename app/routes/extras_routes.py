@@ -1,6 +1,8 @@
 from flask import Blueprint, Response, jsonify, request
 from app.services.extras import Extras
 from app.utils.protected import auth_required
+from app.extensions import result_cache
+from datetime import datetime
 
 extras_bp = Blueprint('extras', __name__)
 
@@ -9,6 +11,10 @@ extras_bp = Blueprint('extras', __name__)
 def get_extras():
     user_id = request.user_id
 
-    result = Extras.calculateDifference(user_id)
+    # The comparison is always "this month vs last month", so the month is part of the key
+    result = result_cache.get_or_compute(
+        user_id, "extras.getdifference", {"month": datetime.now().strftime("%Y-%m")},
+        lambda: Extras.calculateDifference(user_id),
+    )
 
     return jsonify(result)
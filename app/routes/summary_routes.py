@@ -4,7 +4,7 @@ from app.models import Category, Transaction, User
 from app.schemas.transaction_schemas import TransactionCreateSchema
 from app.services.transaction_service import create_transaction
 from app.utils.protected import auth_required
-from app.extensions import db
+from app.extensions import db, result_cache
 from app.services.summary_services import SummaryService
 from pydantic import ValidationError
 from sqlalchemy import func
@@ -22,7 +22,10 @@ def test():
 @auth_required
 def getdashboard():
     user_id = request.user_id
-    res = SummaryService.get_dashboard_data(user_id)
+    res = result_cache.get_or_compute(
+        user_id, "summary.dashboard", {},
+        lambda: SummaryService.get_dashboard_data(user_id),
+    )
     return jsonify(res), 200
 
 
@@ -66,9 +69,13 @@ def summary_by_period():
         end = f"{current_year}-12-31"
 
     try:
-        result = SummaryService.get_summary_by_period(user_id, period_type, tx_type, start, end)
+        result = result_cache.get_or_compute(
+            user_id, "summary.period",
+            {"period_type": period_type, "type": tx_type, "start": start, "end": end},
+            lambda: SummaryService.get_summary_by_period(user_id, period_type, tx_type, start, end).model_dump(),
+        )
         # ✅ Flask can directly jsonify dicts
-        return jsonify(result.model_dump()), 200
+        return jsonify(result), 200
     except SummaryError as e:
         return jsonify({"error": str(e)}), 400
 
@@ -89,8 +96,14 @@ def summary_by_subcategory():
         end = f"{current_year}-12-31"
 
     try:
-        result = SummaryService.get_summary_by_subcategory(user_id, period_type, tx_type, start, end, subcategory)
+        result = result_cache.get_or_compute(
+            user_id, "summary.subcategory",
+            {"period_type": period_type, "type": tx_type, "start": start, "end": end, "subcategory": subcategory},
+            lambda: SummaryService.get_summary_by_subcategory(
+                user_id, period_type, tx_type, start, end, subcategory
+            ).model_dump(),
+        )
         # ✅ Flask can directly jsonify dicts
-        return jsonify(result.model_dump()), 200
+        return jsonify(result), 200
     except SummaryError as e:
         return jsonify({"error": str(e)}), 400
\ No newline at end of file
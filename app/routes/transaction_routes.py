@@ -1,10 +1,12 @@
-from flask import Blueprint, Response, request, jsonify
+from flask import Blueprint, Response, request, jsonify, current_app
+import json
 from app.services.transaction_service import (
     create_transaction,
     get_transactions,
     update_transaction,
     get_transaction_by_id,
-    delete_transaction
+    delete_transaction,
+    bulk_create_transactions,
 )
 
 from app.schemas.transaction_schemas import (
@@ -41,12 +43,54 @@ def create_transaction_route():
         return jsonify({"message": "Invalid transaction input", "errors": errors}), 422
 
 
+# --------------------------------------------
+# BULK CREATE Transactions
+# --------------------------------------------
+@transaction_bp.route("/bulk", methods=["POST"])
+@auth_required
+def bulk_create_transactions_route():
+    """
+    Create many transactions at once. Accepts a JSON array (or an object with a
+    "transactions" array) or NDJSON with Content-Type application/x-ndjson.
+    """
+    user_id = request.user_id
+
+    if request.mimetype == "application/x-ndjson":
+        items = []
+        for line in request.get_data(as_text=True).splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                items.append(line)  # reported as a failed item
+    else:
+        items = request.get_json(silent=True)
+        if isinstance(items, dict):
+            items = items.get("transactions")
+
+    if not isinstance(items, list) or not items:
+        return jsonify({"message": "Expected a non-empty list of transactions"}), 400
+
+    max_items = current_app.config.get("BULK_TRANSACTIONS_MAX_ITEMS", 10000)
+    if len(items) > max_items:
+        return jsonify({"message": f"Too many transactions in one request (max {max_items})"}), 413
+
+    result = bulk_create_transactions(user_id, items)
+    status = 201 if result["success_count"] else 422
+    return jsonify(result), status
+
+
 # --------------------------------------------
 # GET All Transactions (optional filters)
 # --------------------------------------------
 @transaction_bp.route("/", methods=["GET"])
 @auth_required
 def get_all_transactions_route():
+    """
+    List transactions. Supports page/per_page, or cursor/next_cursor for
+    keyset pagination (send an empty cursor to fetch the first page).
+    """
     user_id = request.user_id
     try:
         # Parse and validate query params with Pydantic
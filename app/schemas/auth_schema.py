@@ -25,8 +25,25 @@ class RegisterResponse(BaseModel):
 class LoginResponse(BaseModel):
     message: str
     token: str
+    refresh_token: str
+    expires_in: int
     user: UserResponse
 
+
+class RefreshSchema(BaseModel):
+    refresh_token: str
+
+
+class LogoutSchema(BaseModel):
+    refresh_token: Optional[str] = None
+
+
+class TokenResponse(BaseModel):
+    message: str
+    token: str
+    refresh_token: str
+    expires_in: int
+
 class UserDetailResponse(BaseModel):
     id: int
     username: str
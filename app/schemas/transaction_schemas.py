@@ -42,4 +42,7 @@ class TransactionFilterSchema(BaseModel):
     start_date: Optional[dt_date] = None
     end_date: Optional[dt_date] = None
     page: Optional[int] = 1
-    per_page: Optional[int] = 10
\ No newline at end of file
+    per_page: Optional[int] = 10
+    # Keyset pagination: pass cursor (empty for the first page) to switch modes
+    cursor: Optional[str] = None
+    include_total: Optional[bool] = False
\ No newline at end of file
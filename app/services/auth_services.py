@@ -1,6 +1,7 @@
-from app.extensions import db
+from app.extensions import db, hash_pool
 from app.models.user import User
-from app.utils.security import hash_password, verify_password,create_jwt_token
+from app.services.token_service import issue_token_pair, revoke_tokens, rotate_refresh_token
+from app.utils.security import hash_password, verify_password, password_needs_rehash
 from app.utils.auth_exceptions import (
     UserAlreadyExistsError,
     InvalidCredentialsError,
@@ -21,12 +22,15 @@ class AuthService:
 
         if existing_user:
             raise UserAlreadyExistsError("Username or email already exists.")
-        
+
+        # bcrypt runs on the bounded hash pool; raises PasswordHashingBusyError when saturated
+        password_hash = hash_pool.run(hash_password, password, hash_pool.rounds)
+
         try:
             new_user = User(
                 username=username,
                 email=email,
-                password_hash=hash_password(password)
+                password_hash=password_hash
             )
             db.session.add(new_user)
             db.session.commit()
@@ -45,17 +49,31 @@ class AuthService:
 
     @staticmethod
     def login_user(email:str,password:str):
-        """Authenticates a user and returns a JWT token."""
+        """
+        Authenticates a user and returns an access token plus a refresh
+        token for POST /auth/refresh. A stored hash made with
+        a bcrypt cost other than BCRYPT_ROUNDS is replaced while the
+        plaintext is at hand.
+        """
         user = User.query.filter_by(email=email).first()
 
-        if not user or not verify_password(password, user.password_hash):
+        if not user or not hash_pool.run(verify_password, password, user.password_hash):
             raise InvalidCredentialsError("Invalid email or password.")
-        
-        token = create_jwt_token(user.id)
-        
+
+        if password_needs_rehash(user.password_hash, hash_pool.rounds):
+            try:
+                user.password_hash = hash_pool.run(hash_password, password, hash_pool.rounds)
+                db.session.commit()
+            except Exception:
+                # The old hash still works; try again on the next login
+                db.session.rollback()
+
+        tokens = issue_token_pair(user.id)
+        db.session.commit()
+
         return {
             "message": "Login successful.",
-            "token": token,
+            **tokens,
             "user": {
                 "id": user.id,
                 "username": user.username,
@@ -84,10 +102,23 @@ class AuthService:
 
 
     @staticmethod
-    def logout():
-        """Handles user logout."""
-        # In a stateless JWT authentication, logout can be handled on the client side
-        
+    def refresh_tokens(refresh_token: str):
+        """Rotates a refresh token: returns a new access / refresh pair and retires the old refresh token."""
+        return {
+            "message": "Token refreshed.",
+            **rotate_refresh_token(refresh_token),
+        }, 200
+
+    @staticmethod
+    def logout(access_claims: dict = None, refresh_token: str = None):
+        """
+        Handles user logout. The access token is revoked until it expires
+        and the refresh token's family can no longer be used. Both are
+        optional, so logging out twice still succeeds.
+        """
+        user_id = int(access_claims["sub"]) if access_claims else None
+        revoke_tokens(access_claims, refresh_token, user_id)
+
         return {
             "message": "Logout successful."
-        },200
\ No newline at end of file
+        },200
@@ -0,0 +1,40 @@
+from itertools import chain
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.extensions import db, result_cache
+from app.models.category import Category
+from app.models.transaction import Transaction
+
+_PENDING_USERS = "result_cache_pending_users"
+
+
+def mark_user_changed(user_id: int, session=None):
+    """
+    Queue a cache version bump for user_id once the current DB transaction
+    commits. ORM writes are picked up automatically; Core statements (bulk
+    inserts, rebuilds) must call this explicitly.
+    """
+    session = session if session is not None else db.session()
+    session.info.setdefault(_PENDING_USERS, set()).add(user_id)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_changed_users(session, flush_context, instances):
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, (Transaction, Category)) and obj.user_id is not None:
+            mark_user_changed(obj.user_id, session)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_changed_users(session):
+    # Bump only after COMMIT: a reader that raced the write may have cached
+    # pre-commit data under the old version, which is never read again.
+    for user_id in session.info.pop(_PENDING_USERS, ()):
+        result_cache.bump_version(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session):
+    session.info.pop(_PENDING_USERS, None)
@@ -6,6 +6,7 @@ from app.utils.category_exceptions import (
     CategoryDatabaseError
 )
 from flask import current_app
+from sqlalchemy.exc import IntegrityError
 
 class CategoryService:
     @staticmethod
@@ -85,6 +86,10 @@ class CategoryService:
             return category
         except CategoryNotFoundError:
             raise
+        except IntegrityError:
+            # Renamed onto another of the user's categories (uq_categories_user_name_type)
+            db.session.rollback()
+            raise CategoryAlreadyExistsError("Category already exists for this user")
         except Exception as e:
             db.session.rollback()
             current_app.logger.error(f"[CATEGORY] Update error: {e}")
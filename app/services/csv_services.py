@@ -1,77 +1,567 @@
 import csv
-from decimal import Decimal
-from datetime import datetime
+import io
+import json
+import os
+import tempfile
+import uuid
+from itertools import islice
+import numpy as np
+import pandas as pd
+from decimal import Decimal, InvalidOperation
+from datetime import datetime, timedelta
 from typing import List
+from flask import current_app
 from pydantic import ValidationError
-from app.models import Category, Transaction
+from sqlalchemy import and_, or_, update
+from app.models import Category, ImportSession, Transaction
 from app.extensions import db
 from app.schemas.transaction_schemas import TransactionCreateSchema
-from app.services.transaction_service import create_transaction
+from app.services.importers import get_importer, register_importer
+from app.services.transaction_service import (
+    _fingerprint_key,
+    _format_validation_error,
+    bulk_create_transactions,
+    default_transaction_date,
+)
+from app.utils.transaction_exceptions import ConcurrentImportError, TransactionDatabaseError
+from app.utils.csv_exceptions import CSVEncodingError, CSVImportSessionNotFoundError, CSVImportSessionStateError
 
-def import_transactions_via_route(csv_path: str, user_id: int):
+
+def open_csv_upload(stream):
+    """Text view over an uploaded binary stream (werkzeug FileStorage.stream), skipping a UTF-8 BOM."""
+    return io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+
+
+def count_lines(lines, progress: dict):
+    """Pass lines through, counting them into progress["lines_read"] as they are consumed."""
+    progress.setdefault("lines_read", 0)
+    try:
+        for line in lines:
+            progress["lines_read"] += 1
+            yield line
+    except UnicodeDecodeError:
+        raise CSVEncodingError(f"CSV file is not valid UTF-8 (after line {progress['lines_read']}).")
+
+
+def parse_csv_date(date_str: str):
+    """MM/DD/YYYY (bank statement exports) or YYYY-MM-DD; None for an empty cell."""
+    if not date_str:
+        return None
+    for fmt in ("%m/%d/%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid date format: {date_str}")
+
+
+def parse_csv_row(row: dict) -> TransactionCreateSchema:
+    """Map one csv.DictReader row to TransactionCreateSchema (raises ValueError / ValidationError)."""
+    try:
+        amount = Decimal((row.get("amount") or "").strip())
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {row.get('amount')}")
+
+    return TransactionCreateSchema(
+        category_name=(row.get("category_name") or "").strip() or None,
+        type=(row.get("type") or "").strip().lower(),  # Normalize to lowercase
+        amount=amount,
+        description=(row.get("description") or "").strip() or None,
+        date=parse_csv_date((row.get("date") or "").strip()),
+    )
+
+
+@register_importer("csv", extensions=(".csv",), parse_row=parse_csv_row)
+def parse_csv(lines):
+    """Rows of a CSV with a header line (see import_transactions for the layout)."""
+    yield from csv.DictReader(lines)
+
+
+def import_rows(user_id: int, rows, category_cache: dict = None, occurrences: dict = None, before_commit=None,
+                parse_row=parse_csv_row) -> list:
     """
-    Reads a CSV file, validates and converts each row to TransactionCreateSchema,
-    calls create_transaction() for each row, and returns a summary.
+    Import (row number, record) pairs in one DB transaction and return one
+    report entry per row, in order.
+
+    Every row is parsed and validated first (parse_row maps a record to
+    TransactionCreateSchema; CSV rows by default); the valid ones then go through
+    bulk_create_transactions, which resolves categories with one lookup per
+    call (fewer with a shared `category_cache`) and inserts in executemany
+    chunks. Rows already imported earlier are reported as "duplicate" and
+    skipped. Failed entries echo the raw row.
+
+    before_commit(report) runs in the DB transaction that commits the rows
+    (on its own when no row parsed). If that transaction fails the
+    TransactionDatabaseError is raised instead of reported per row, so a
+    checkpoint never moves past rows that were not written. A
+    ConcurrentImportError is always raised: the whole upload can be retried.
+    """
+    occurrences = {} if occurrences is None else occurrences
+    results = []
+    parsed = []  # (position in results, row number, raw row, schema)
+
+    for idx, row in rows:
+        try:
+            parsed.append((len(results), idx, row, parse_row(row)))
+            results.append(None)
+        except ValidationError as e:
+            results.append({"row": idx, "status": "failed", "error": _format_validation_error(e), "data": row})
+        except ValueError as e:
+            results.append({"row": idx, "status": "failed", "error": str(e), "data": row})
+
+    def fill(outcome):
+        for (position, idx, row, _), result in zip(parsed, outcome):
+            if result["status"] in ("success", "duplicate"):
+                results[position] = {"row": idx, "status": result["status"]}
+            else:
+                results[position] = {"row": idx, "status": result["status"], "error": result["error"], "data": row}
+
+    def checkpoint(outcome):
+        fill(outcome)
+        before_commit(results)
+
+    if parsed:
+        try:
+            outcome = bulk_create_transactions(
+                user_id, [schema for _, _, _, schema in parsed], category_cache, occurrences,
+                before_commit=checkpoint if before_commit is not None else None,
+            )["results"]
+        except TransactionDatabaseError as e:
+            if before_commit is not None or isinstance(e, ConcurrentImportError):
+                raise
+            outcome = [{"status": "error", "error": str(e)}] * len(parsed)
+        fill(outcome)
+    elif before_commit is not None:
+        before_commit(results)
+        db.session.commit()
+    return results
+
+
+def import_transactions(csvfile, user_id: int, progress: dict = None, importer=None):
+    """
+    Import transactions from an open text stream in one DB transaction.
+    Lines read so far are counted into `progress` (if given) while parsing.
+    The report keeps one entry per row (1-based, header excluded).
+    `importer` (see app.services.importers) reads other formats.
 
     CSV Format:
         category_name,type,amount,description,date
     Example:
         Food,expense,250.50,Lunch at cafe,10/18/2025
     """
-    success_count = 0
-    fail_count = 0
-    results = []
+    progress = {} if progress is None else progress
+    importer = importer or get_importer("csv")
+    rows = enumerate(importer.parse(count_lines(csvfile, progress)), start=1)
+    results = import_rows(user_id, rows, parse_row=importer.parse_row)
 
-    with open(csv_path, "r", newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
+    success_count = sum(1 for r in results if r["status"] == "success")
+    duplicate_count = sum(1 for r in results if r["status"] == "duplicate")
+    return {
+        "message": f"✅ {importer.name.upper()} import completed",
+        "success_count": success_count,
+        "failed_count": len(results) - success_count - duplicate_count,
+        "duplicate_count": duplicate_count,
+        "lines_read": progress["lines_read"],
+        "details": results
+    }
+
+
+# -----------------------------
+# Resumable (async) import sessions
+# -----------------------------
+def import_session_dir() -> str:
+    return current_app.config.get("IMPORT_SESSION_DIR") or os.path.join(tempfile.gettempdir(), "budgetwise-imports")
+
+
+def create_import_session(user_id: int, upload, format: str = "csv") -> ImportSession:
+    """Store an upload (werkzeug FileStorage) as a new pending ImportSession."""
+    directory = import_session_dir()
+    os.makedirs(directory, exist_ok=True)
+    session = ImportSession(id=uuid.uuid4().hex, user_id=user_id, filename=upload.filename, format=format)
+    session.path = os.path.join(directory, f"{session.id}.{format}")
+    upload.save(session.path)
+    db.session.add(session)
+    db.session.commit()
+    return session
+
+
+def get_import_session(session_id: str, user_id: int) -> ImportSession:
+    session = db.session.get(ImportSession, session_id)
+    if session is None or session.user_id != user_id:
+        raise CSVImportSessionNotFoundError("Import session not found.")
+    return session
+
+
+def claim_import_session(session_id: str, job_id: str) -> bool:
+    """
+    Atomically hand the session to job_id: one conditional UPDATE, so of two
+    workers resuming it at once only one sees a row updated. Pending and
+    failed sessions can be claimed, and so can a running one whose job
+    stopped renewing its heartbeat IMPORT_SESSION_LEASE_SECONDS ago.
+    """
+    now = datetime.utcnow()
+    lease_expired = now - timedelta(seconds=current_app.config["IMPORT_SESSION_LEASE_SECONDS"])
+    result = db.session.execute(
+        update(ImportSession)
+        .where(
+            ImportSession.id == session_id,
+            or_(
+                ImportSession.status.in_(("pending", "failed")),
+                and_(
+                    ImportSession.status == "running",
+                    or_(ImportSession.heartbeat_at.is_(None), ImportSession.heartbeat_at < lease_expired),
+                ),
+            ),
+        )
+        .values(status="running", job_id=job_id, heartbeat_at=now)
+    )
+    db.session.commit()
+    return result.rowcount == 1
+
+
+def _update_owned_session(session_id: str, job_id: str, **values) -> bool:
+    """UPDATE the session only while job_id still holds it; False once another job has claimed it."""
+    result = db.session.execute(
+        update(ImportSession)
+        .where(ImportSession.id == session_id, ImportSession.job_id == job_id)
+        .values(**values)
+    )
+    return result.rowcount == 1
+
+
+def release_import_session(session_id: str, job_id: str, status: str):
+    """Give back a claim whose job could not be queued, restoring the session's previous status."""
+    _update_owned_session(session_id, job_id, status=status, heartbeat_at=None)
+    db.session.commit()
 
-        for idx, row in enumerate(reader, start=1):
+
+class _OffsetLines:
+    """Decoded lines of a binary file, tracking the byte offset just past the last line handed out."""
+
+    def __init__(self, f, progress: dict, stop: int = None):
+        self.f = f
+        self.offset = f.tell()
+        self.progress = progress
+        self.stop = stop
+
+    def __iter__(self):
+        while self.stop is None or self.offset < self.stop:
+            raw = self.f.readline()
+            if not raw:
+                return
+            self.offset += len(raw)
+            self.progress["lines_read"] = self.progress.get("lines_read", 0) + 1
             try:
-                # Parse date - handle MM/DD/YYYY format from your CSV
-                date_str = row.get("date", "").strip()
-                parsed_date = None
-                
-                if date_str:
-                    try:
-                        # Try MM/DD/YYYY format (matches your CSV)
-                        parsed_date = datetime.strptime(date_str, "%m/%d/%Y").date()
-                    except ValueError:
-                        # Fallback to YYYY-MM-DD format
-                        try:
-                            parsed_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                        except ValueError:
-                            raise ValueError(f"Invalid date format: {date_str}")
-
-                # Map CSV row to Pydantic schema
-                tx_schema = TransactionCreateSchema(
-                    category_name=row.get("category_name", "").strip() or None,
-                    type=row["type"].strip().lower(),  # Normalize to lowercase
-                    amount=Decimal(row["amount"].strip()),
-                    description=row.get("description", "").strip() or None,
-                    date=parsed_date
+                yield raw.decode("utf-8")
+            except UnicodeDecodeError:
+                raise CSVEncodingError(f"CSV file is not valid UTF-8 (line {self.progress['lines_read']}).")
+
+
+def _replay_occurrences(rows, parse_row, failed_rows=frozenset()) -> dict:
+    """
+    Rebuild the duplicate-occurrence counter for (row number, record) pairs
+    before a checkpoint, without touching the DB. Every row that was imported
+    or reported duplicate counts, as in bulk_create_transactions; rows in
+    failed_rows (from the session's failures file) were never fingerprinted.
+    """
+    occurrences = {}
+    for idx, row in rows:
+        if idx in failed_rows:
+            continue
+        try:
+            schema = parse_row(row)
+        except (ValidationError, ValueError):
+            continue
+        key = _fingerprint_key(default_transaction_date(schema.date), schema.amount, schema.description, schema.type)
+        occurrences[key] = occurrences.get(key, 0) + 1
+    return occurrences
+
+
+def _trim_failures(session: ImportSession) -> int:
+    """Drop failure lines written for a batch that never committed; returns the committed file size."""
+    if not os.path.exists(session.failures_path):
+        return 0
+    size = 0
+    with open(session.failures_path, "rb+") as f:
+        for _ in range(session.failed):
+            line = f.readline()
+            if not line:
+                break
+            size += len(line)
+        f.truncate(size)
+    return size
+
+
+def read_import_failures(session: ImportSession) -> list:
+    if not os.path.exists(session.failures_path):
+        return []
+    with open(session.failures_path, "rb") as f:
+        return [json.loads(line) for line in f]
+
+
+def run_import_session(job, session_id: str, chunk_rows: int = 1000):
+    """
+    Job body for POST /csv/import?async=true and .../resume. Rows are read
+    from the stored upload starting at the session's checkpoint and imported
+    chunk_rows at a time. Each chunk commits together with the new checkpoint
+    (byte offset and row number past the chunk, running totals), so a retry
+    after a crash neither repeats nor skips chunks. A chunk whose insert
+    fails stops the job with the checkpoint before it; resume retries it. CSV uploads resume by
+    seeking to the byte offset; other formats re-parse up to the checkpoint
+    row without touching the DB. Failed rows are appended
+    to an NDJSON file next to the upload; progress (lines_read, parsed,
+    inserted, duplicates, failed) is updated after every chunk.
+
+    The session must have been claimed for this job (claim_import_session).
+    Each chunk renews the claim's heartbeat in its own transaction and rolls
+    back if another job has since taken the session over.
+    """
+    session = db.session.get(ImportSession, session_id)
+    if session.status != "running" or session.job_id != job.id:
+        raise CSVImportSessionStateError("Import session is held by another job.")
+    session.error = None
+    db.session.commit()
+
+    def sync_progress():
+        job.progress.update(
+            parsed=session.rows_committed, inserted=session.inserted,
+            duplicates=session.duplicates, failed=session.failed,
+        )
+
+    job.progress["lines_read"] = 0
+    sync_progress()
+    committed = {"failures_size": _trim_failures(session)}
+    failed_rows = {entry["row"] for entry in read_import_failures(session)}
+
+    try:
+        with open(session.path, "rb") as f:
+            importer = get_importer(session.format)
+            lines = _OffsetLines(f, job.progress)
+            if importer.name == "csv":
+                header = next(iter(lines), "").lstrip("\ufeff")
+                fieldnames = next(csv.reader([header]), [])
+                resume_at = max(session.byte_offset, f.tell())
+                occurrences = _replay_occurrences(
+                    enumerate(csv.DictReader(_OffsetLines(f, {}, stop=resume_at), fieldnames=fieldnames), start=1),
+                    importer.parse_row, failed_rows,
                 )
+                f.seek(resume_at)
+                lines.offset = resume_at
+                rows = enumerate(csv.DictReader(lines, fieldnames=fieldnames), start=session.rows_committed + 1)
+            else:
+                # Records may span lines, so these resume by row number; byte_offset stays 0
+                rows = enumerate(importer.parse(count_lines(open_csv_upload(f), job.progress)), start=1)
+                occurrences = _replay_occurrences(islice(rows, session.rows_committed), importer.parse_row, failed_rows)
+            category_cache = {}
+            for chunk in iter(lambda: list(islice(rows, chunk_rows)), []):
+
+                def checkpoint(report, end_offset=lines.offset, last_row=chunk[-1][0]):
+                    if not _update_owned_session(session.id, job.id, heartbeat_at=datetime.utcnow()):
+                        raise CSVImportSessionStateError("Import session was taken over by another job.")
+                    failed = [entry for entry in report if entry["status"] not in ("success", "duplicate")]
+                    with open(session.failures_path, "ab") as out:
+                        out.truncate(committed["failures_size"])
+                        for entry in failed:
+                            out.write(json.dumps(entry, default=str).encode("utf-8") + b"\n")
+                        committed["pending_size"] = out.tell()
+                    session.byte_offset = end_offset
+                    session.rows_committed = last_row
+                    session.inserted += sum(1 for entry in report if entry["status"] == "success")
+                    session.duplicates += sum(1 for entry in report if entry["status"] == "duplicate")
+                    session.failed += len(failed)
+
+                import_rows(
+                    session.user_id, chunk, category_cache, occurrences,
+                    before_commit=checkpoint, parse_row=importer.parse_row,
+                )
+                committed["failures_size"] = committed["pending_size"]
+                sync_progress()
+
+        if not _update_owned_session(session.id, job.id, status="completed"):
+            raise CSVImportSessionStateError("Import session was taken over by another job.")
+        db.session.commit()
+        failures = read_import_failures(session)
+        for path in (session.path, session.failures_path):
+            if os.path.exists(path):
+                os.remove(path)
+    except Exception as e:
+        db.session.rollback()
+        # Left alone if another job has taken the session over
+        _update_owned_session(session.id, job.id, status="failed", error=str(e) or e.__class__.__name__)
+        db.session.commit()
+        raise
+
+    return {
+        "success_count": session.inserted,
+        "failed_count": session.failed,
+        "duplicate_count": session.duplicates,
+        "lines_read": job.progress["lines_read"],
+        "failures": failures,
+    }
+
+
+def import_transactions_via_route(csv_path: str, user_id: int):
+    """Import the CSV file at csv_path for user_id; see import_transactions for the format."""
+    with open(csv_path, "r", newline="", encoding="utf-8") as csvfile:
+        return import_transactions(csvfile, user_id)
+
+
+# -----------------------------
+# Vectorized (pandas) import engine
+# -----------------------------
+CSV_DATE_FORMATS = ("%m/%d/%Y", "%Y-%m-%d")
+TYPE_ERROR = "type: Value error, type must be either 'income' or 'expense'"
 
-                # Call the existing service to add transaction
-                create_transaction(user_id, tx_schema)
-                success_count += 1
-                results.append({"row": idx, "status": "success"})
 
-            except ValidationError as e:
-                fail_count += 1
-                error_msg = "; ".join([f"{err['loc'][0]}: {err['msg']}" for err in e.errors()])
-                results.append({"row": idx, "status": "failed", "error": error_msg, "data": row})
+def detect_date_format(dates: pd.Series) -> str:
+    """The CSV_DATE_FORMATS entry that parses the most non-empty values of a sample."""
+    sample = dates[dates != ""].head(1000)
+    return max(
+        CSV_DATE_FORMATS,
+        key=lambda fmt: pd.to_datetime(sample, format=fmt, errors="coerce").notna().sum(),
+    )
 
-            except ValueError as e:
-                fail_count += 1
-                results.append({"row": idx, "status": "failed", "error": str(e), "data": row})
 
-            except Exception as e:
-                fail_count += 1
-                results.append({"row": idx, "status": "error", "error": str(e), "data": row})
+def _parse_dates(dates: pd.Series, date_format: str) -> pd.Series:
+    parsed = pd.to_datetime(dates, format=date_format, errors="coerce")
+    # Rows that use the file's other format still parse, as in parse_csv_date
+    for fallback in CSV_DATE_FORMATS:
+        retry = parsed.isna() & (dates != "")
+        if fallback == date_format or not retry.any():
+            continue
+        parsed[retry] = pd.to_datetime(dates[retry], format=fallback, errors="coerce")
+    return parsed
+
+
+def _strip(values: pd.Series, lower: bool = False) -> pd.Series:
+    """str.strip() (and lower()) applied once per distinct value; statement columns repeat a lot."""
+    codes, uniques = pd.factorize(values)
+    uniques = uniques.str.strip()
+    if lower:
+        uniques = uniques.str.lower()
+    return pd.Series(np.asarray(uniques, dtype=object)[codes], index=values.index)
+
+
+def validate_csv_frame(chunk: pd.DataFrame, date_format: str):
+    """
+    Validate one read_csv chunk (all columns as str) with column operations.
+
+    Returns (valid, failures): `valid` is a DataFrame of normalized columns
+    (row, category_name, type, amount, description, date) for the rows that
+    passed; `failures` are report entries for the rest, with the same error
+    text parse_csv_row produces and checked in the same order.
+    """
+    column = lambda name: chunk[name] if name in chunk else pd.Series("", index=chunk.index, dtype=object)
+
+    category = _strip(column("category_name"))
+    tx_type = _strip(column("type"), lower=True)
+    # to_numeric and Decimal both accept surrounding spaces, and the error echoes the raw cell
+    amount_text = column("amount")
+    amount = pd.to_numeric(amount_text, errors="coerce")
+    date_text = _strip(column("date"))
+    dates = _parse_dates(date_text, date_format)
+
+    bad_amount = amount.isna() | ~np.isfinite(amount.fillna(0))
+    bad_date = dates.isna() & (date_text != "")
+    bad_type = ~tx_type.isin(("income", "expense"))
+    no_category = category == ""
+    failed = bad_amount | bad_date | bad_type | no_category
+
+    failures = []
+    if failed.any():
+        errors = np.select(
+            [bad_amount, bad_date, bad_type],
+            ["Invalid amount: " + amount_text, "Invalid date format: " + date_text, TYPE_ERROR],
+            default="Category not found or provided.",
+        )
+        failed_rows = chunk[failed].to_dict("records")
+        for idx, error, row in zip(chunk.index[failed] + 1, errors[failed.to_numpy()], failed_rows):
+            failures.append({"row": int(idx), "status": "failed", "error": error, "data": row})
+
+    ok = ~failed
+    description = _strip(column("description")[ok]).to_numpy()
+    valid_dates = dates[ok]
+    valid = pd.DataFrame({
+        "row": chunk.index[ok] + 1,
+        "category_name": category[ok],
+        "type": tx_type[ok],
+        "amount": amount_text[ok],
+        "description": np.where(description == "", None, description),
+        "date": np.where(valid_dates.notna(), valid_dates.dt.date.to_numpy(dtype=object), None),
+    }, dtype=object)  # object columns keep None as None instead of NaN
+    return valid, failures
+
+
+def iter_validated_chunks(source, chunk_rows: int = 10000):
+    """
+    Read a CSV (path or binary stream) with pandas in chunks of chunk_rows and
+    yield validate_csv_frame() results. The date format is detected once, from
+    the first chunk, and used for the whole file.
+    """
+    date_format = None
+    try:
+        reader = pd.read_csv(
+            source, dtype=str, keep_default_na=False, chunksize=chunk_rows,
+            encoding="utf-8-sig", skipinitialspace=False,
+        )
+        for chunk in reader:
+            if date_format is None:
+                date_format = detect_date_format(chunk["date"].str.strip() if "date" in chunk else pd.Series(dtype=str))
+            yield validate_csv_frame(chunk, date_format)
+    except UnicodeDecodeError:
+        raise CSVEncodingError("CSV file is not valid UTF-8.")
+    except pd.errors.EmptyDataError:
+        return
+
+
+def frame_to_schemas(valid: pd.DataFrame) -> list:
+    """Validated rows as TransactionCreateSchema, built without re-running validation."""
+    return [
+        TransactionCreateSchema.model_construct(
+            category_name=category, type=tx_type, amount=Decimal(amount),
+            description=description, date=tx_date,
+        )
+        for category, tx_type, amount, description, tx_date in zip(
+            valid["category_name"], valid["type"], valid["amount"], valid["description"], valid["date"]
+        )
+    ]
+
+
+def import_transactions_frame(source, user_id: int, dry_run: bool = False, chunk_rows: int = 10000):
+    """
+    Import a CSV with the vectorized engine. Chunks are validated with pandas
+    column operations and all valid rows are inserted through
+    bulk_create_transactions in one DB transaction, skipping rows imported
+    before. With dry_run nothing touches the database (so duplicates are not
+    detected). Only failed rows are reported.
+    """
+    failures = []
+    valid_frames = []
+    checked = 0
+    duplicate_count = 0
+
+    for valid, chunk_failures in iter_validated_chunks(source, chunk_rows):
+        checked += len(valid) + len(chunk_failures)
+        failures.extend(chunk_failures)
+        if not dry_run:
+            valid_frames.append(valid)
+
+    success_count = checked - len(failures)
+    if valid_frames and success_count:
+        valid = pd.concat(valid_frames)
+        created = bulk_create_transactions(user_id, frame_to_schemas(valid), occurrences={})
+        for idx, result in zip(valid["row"], created["results"]):
+            if result["status"] not in ("success", "duplicate"):
+                failures.append({"row": int(idx), "status": result["status"], "error": result["error"], "data": None})
+        failures.sort(key=lambda f: f["row"])
+        duplicate_count = created["duplicate_count"]
+        success_count = created["success_count"]
 
     return {
-        "message": "✅ CSV import completed",
+        "message": "✅ CSV validated (dry run)" if dry_run else "✅ CSV import completed",
+        "dry_run": dry_run,
         "success_count": success_count,
-        "failed_count": fail_count,
-        "details": results
-    }
\ No newline at end of file
+        "failed_count": len(failures),
+        "duplicate_count": duplicate_count,
+        "failures": failures,
+    }
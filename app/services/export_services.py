@@ -2,6 +2,8 @@ import os
 import csv
 from io import BytesIO, StringIO
 from datetime import datetime, date
+from decimal import Decimal
+from itertools import islice
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import inch
@@ -18,6 +20,15 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import PageBreak
 
+from flask import current_app
+from sqlalchemy import case, func
+
+from app.extensions import db, job_queue, render_pool
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.utils.export_exceptions import ColumnarExportUnavailableError
+
 
 # Register font
 try:
@@ -27,13 +38,167 @@ except Exception:
     FONT_NAME = "Helvetica"
 
 
+# =================================================================================
+# 🔵 PDF LAYOUT (built once at import, shared by every report)
+# =================================================================================
+PAGE_MARGINS = dict(rightMargin=40, leftMargin=40, topMargin=60, bottomMargin=40)
+
+STYLES = getSampleStyleSheet()
+
+TITLE_STYLE = ParagraphStyle(
+    "Title",
+    parent=STYLES["Heading1"],
+    fontName=FONT_NAME,
+    fontSize=18,
+    textColor=colors.HexColor("#2C3E50"),
+    alignment=1,
+)
+
+USER_STYLE = ParagraphStyle(
+    "UserInfo",
+    parent=STYLES["Normal"],
+    fontName=FONT_NAME,
+    fontSize=11,
+    textColor=colors.HexColor("#2C3E50"),
+)
+
+NOTES_STYLE = ParagraphStyle(
+    "NotesWrap",
+    parent=STYLES["Normal"],
+    fontSize=9,
+    leading=11,
+    fontName=FONT_NAME,
+)
+
+TABLE_HEADER = ["Date", "Transaction ID", "Type", "Category", "Amount", "Notes"]
+
+# --------------------------------------------
+# Dynamic column widths that WILL ALWAYS FIT
+# --------------------------------------------
+_available_width = A4[0] - PAGE_MARGINS["leftMargin"] - PAGE_MARGINS["rightMargin"]
+TABLE_COL_WIDTHS = [
+    60,    # Date
+    75,    # Txn ID
+    70,    # Type
+    90,    # Category
+    55,    # Amount
+    _available_width - (60 + 45 + 70 + 90 + 55)  # Notes auto-fills remaining
+]
+
+TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3498DB")),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+
+    ("ALIGN", (0, 1), (-2, -1), "LEFT"),
+    ("ALIGN", (-2, 1), (-2, -1), "RIGHT"),  # Amount
+
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("FONTNAME", (0, 0), (-1, -1), FONT_NAME),
+    ("FONTSIZE", (0, 0), (-1, -1), 9),
+
+    ("BACKGROUND", (0, 1), (-1, -1), colors.HexColor("#ECF0F1")),
+    ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#BDC3C7")),
+])
+
+SUMMARY_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#F8F9F9")),
+    ("TEXTCOLOR", (0, 0), (-1, -1), colors.HexColor("#2C3E50")),
+    ("FONTNAME", (0, 0), (-1, -1), FONT_NAME),
+    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+    ("FONTSIZE", (0, 0), (-1, -1), 11),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+    ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#BDC3C7")),
+])
+
+# -----------------------------------------------------------
+# Auto-calculate page capacity (rows per page)
+# -----------------------------------------------------------
+_estimated_row_height = 18      # in points (approx based on your font/spacing)
+_header_height = 40             # height of table header row
+_usable_height = A4[1] - PAGE_MARGINS["topMargin"] - PAGE_MARGINS["bottomMargin"] - 200  # header/userinfo
+ROWS_PER_PAGE = max(10, int((_usable_height - _header_height) / _estimated_row_height))
+
+
+def _pages(rows, size):
+    """Split any iterable of rows into lists of `size` rows."""
+    rows = iter(rows)
+    while page := list(islice(rows, size)):
+        yield page
+
+
 # =================================================================================
 # 🔵 PDF GENERATION (Dynamic, keeps original design)
 # =================================================================================
+def pdf_row(t):
+    """Plain, picklable (id, created_date, type, category_name, amount, description) for one transaction."""
+    return (t.id, t.created_date, t.type, t.category.name if t.category else None, t.amount, t.description)
+
+
 def generate_pdf_report(user_id, user_name, user_email, transactions,
-                        start_date=None, end_date=None, type=all):
+                        start_date=None, end_date=None, type=all, totals=None):
     """
     Generate PDF using old beautiful design but dynamic transaction data.
+    `totals` is an optional (total_income, total_expense) pair, normally from
+    export_totals(); without it the totals are summed while rows are laid out.
+    """
+    return render_pdf_rows(
+        (pdf_row(t) for t in transactions),
+        user_id=user_id,
+        user_name=user_name,
+        user_email=user_email,
+        start_date=start_date,
+        end_date=end_date,
+        totals=totals,
+    )
+
+
+def render_pdf_rows(rows, user_id, user_name, user_email, start_date=None, end_date=None, totals=None):
+    """
+    Render the report from pdf_row() tuples. Takes no ORM objects or app state,
+    so it can run in a worker process (see RenderPool).
+    """
+    buffer = BytesIO()
+    write_pdf_report(buffer, rows, user_id, user_name, user_email, start_date, end_date, totals)
+    pdf = buffer.getvalue()
+    buffer.close()
+
+    return pdf
+
+
+class _LazyStory(list):
+    """
+    Flowable list for doc.build() that pulls more flowables from `source` only
+    as the buffered ones are laid out, so a report never holds more than about
+    one page of tables at a time. Two items are kept buffered so keepWithNext
+    headings can still see the flowable that follows them.
+    """
+
+    def __init__(self, head, source):
+        super().__init__(head)
+        self._source = source
+
+    def _fill(self):
+        while self._source is not None and list.__len__(self) < 2:
+            try:
+                self.extend(next(self._source))
+            except StopIteration:
+                self._source = None
+
+    def __len__(self):
+        self._fill()
+        return list.__len__(self)
+
+    def __getitem__(self, index):
+        self._fill()
+        return list.__getitem__(self, index)
+
+
+def write_pdf_report(output, rows, user_id, user_name, user_email, start_date=None, end_date=None, totals=None):
+    """
+    Lay out the report into `output` (a path or binary file object). `rows`
+    may be any iterator of pdf_row() tuples, such as a yield_per query: page
+    tables are built only when reportlab reaches them.
     """
 
     today = date.today()
@@ -42,42 +207,22 @@ def generate_pdf_report(user_id, user_name, user_email, transactions,
     if not end_date:
         end_date = today
 
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=40,
-        leftMargin=40,
-        topMargin=60,
-        bottomMargin=40,
-    )
+    doc = SimpleDocTemplate(output, pagesize=A4, **PAGE_MARGINS)
 
     elements = []
-    styles = getSampleStyleSheet()
 
     # -----------------------------------------------------------
     # Header Section
     # -----------------------------------------------------------
-    header_table_data = []
-
     logo_path = os.path.join("app", "static", "logo.png")
     if os.path.exists(logo_path):
         logo = Image(logo_path, width=1.2 * inch, height=0.3 * inch)
     else:
-        logo = Paragraph("<b>BudgetWise</b>", styles["Normal"])
-
-    title_style = ParagraphStyle(
-        "Title",
-        parent=styles["Heading1"],
-        fontName=FONT_NAME,
-        fontSize=18,
-        textColor=colors.HexColor("#2C3E50"),
-        alignment=1,
-    )
-    title = Paragraph("", title_style)
+        logo = Paragraph("<b>BudgetWise</b>", STYLES["Normal"])
 
-    header_table_data.append([logo, title])
-    header_table = Table(header_table_data, colWidths=[120, 400])
+    title = Paragraph("", TITLE_STYLE)
+
+    header_table = Table([[logo, title]], colWidths=[120, 400])
     header_table.setStyle(TableStyle([("VALIGN", (0, 0), (-1, -1), "MIDDLE")]))
     elements.append(header_table)
     elements.append(Spacer(1, 20))
@@ -85,149 +230,71 @@ def generate_pdf_report(user_id, user_name, user_email, transactions,
     # -----------------------------------------------------------
     # User Info Section
     # -----------------------------------------------------------
-    user_style = ParagraphStyle(
-        "UserInfo",
-        parent=styles["Normal"],
-        fontName=FONT_NAME,
-        fontSize=11,
-        textColor=colors.HexColor("#2C3E50"),
-    )
-
     user_info = [
-        Paragraph(f"<b>USER NAME:</b> {user_name.upper()}", user_style),
-        Paragraph(f"<b>USER ID:</b> {user_id}", user_style),
-        Paragraph(f"<b>EMAIL:</b> {user_email}", user_style),
-        Paragraph(f"<b>PERIOD:</b> {start_date.strftime('%d %b %Y')} — {end_date.strftime('%d %b %Y')}", user_style),
-        Paragraph(f"<b>GENERATED ON:</b> {datetime.now().strftime('%d %B %Y, %I:%M %p')}", user_style),
+        Paragraph(f"<b>USER NAME:</b> {user_name.upper()}", USER_STYLE),
+        Paragraph(f"<b>USER ID:</b> {user_id}", USER_STYLE),
+        Paragraph(f"<b>EMAIL:</b> {user_email}", USER_STYLE),
+        Paragraph(f"<b>PERIOD:</b> {start_date.strftime('%d %b %Y')} — {end_date.strftime('%d %b %Y')}", USER_STYLE),
+        Paragraph(f"<b>GENERATED ON:</b> {datetime.now().strftime('%d %B %Y, %I:%M %p')}", USER_STYLE),
     ]
 
     for item in user_info:
         elements.append(item)
     elements.append(Spacer(1, 25))
 
-    # -----------------------------------------------------------
-    # Transactions Table with Manual Pagination (15 per page)
-    # -----------------------------------------------------------
-
-    elements.append(Paragraph("<b>Transaction Details</b>", styles["Heading2"]))
+    elements.append(Paragraph("<b>Transaction Details</b>", STYLES["Heading2"]))
     elements.append(Spacer(1, 10))
 
-    table_header = [
-        ["Date", "Transaction ID", "Type", "Category", "Amount", "Notes"]
-    ]
-
     # -----------------------------------------------------------
-    # Auto-calculate page capacity (rows per page)
+    # Transactions Table, ROWS_PER_PAGE rows per page, then Summary
     # -----------------------------------------------------------
-    estimated_row_height = 18      # in points (approx based on your font/spacing)
-    header_height = 40             # height of table header row
-    usable_height = A4[1] - doc.topMargin - doc.bottomMargin - 200  # adjust based on header/userinfo
-
-    rows_per_page = int((usable_height - header_height) / estimated_row_height)
-
-    if rows_per_page < 10:
-        rows_per_page = 10  # minimum safety
-
-
-    # Split transactions into chunks based on rows_per_page
-    # PAGE_SIZE = 15
-    chunks = [transactions[i:i + rows_per_page] for i in range(0, len(transactions), rows_per_page)]
-
-    for index, chunk in enumerate(chunks):
-        table_rows = []
-
-        # Build rows for this page
-        for t in chunk:
-            notes = Paragraph(t.description or "-", ParagraphStyle(
-                "NotesWrap",
-                parent=styles["Normal"],
-                fontSize=9,
-                leading=11,
-                fontName=FONT_NAME,
-            ))
-            serial = index * rows_per_page + (chunk.index(t) + 1)  # Global sequential number
-            hybrid_id = f"TX-{serial} (ID:{t.id})"
-            table_rows.append([
-                t.created_date.strftime("%Y-%m-%d") if t.created_date else "N/A",
-                hybrid_id,
-                t.type.title(),
-                t.category.name if t.category else "N/A",
-                f"${t.amount:.2f}",
-                notes
-            ])
-        
-        # Combine header + rows
-        table_data = table_header + table_rows
-
-        # --------------------------------------------
-        # Dynamic column widths that WILL ALWAYS FIT
-        # --------------------------------------------
-        # Available page width
-        available_width = A4[0] - doc.leftMargin - doc.rightMargin
-        col_widths = [
-            60,    # Date
-            75,    # Txn ID
-            70,    # Type
-            90,    # Category
-            55,    # Amount
-            available_width - (60 + 45 + 70 + 90 + 55)  # Notes auto-fills remaining
+    def pages_then_summary():
+        running = {"income": Decimal(0), "expense": Decimal(0)}
+
+        for index, page in enumerate(_pages(rows, ROWS_PER_PAGE)):
+            flowables = []
+            # Page break between tables, never after the last one
+            if index:
+                flowables.append(PageBreak())
+
+            table_data = [TABLE_HEADER]
+            for serial, (tx_id, created_date, tx_type, category_name, amount, description) in enumerate(
+                page, start=index * ROWS_PER_PAGE + 1  # Global sequential number
+            ):
+                hybrid_id = f"TX-{serial} (ID:{tx_id})"
+                table_data.append([
+                    created_date.strftime("%Y-%m-%d") if created_date else "N/A",
+                    hybrid_id,
+                    tx_type.title(),
+                    category_name or "N/A",
+                    f"${amount:.2f}",
+                    Paragraph(description or "-", NOTES_STYLE),
+                ])
+                if totals is None and tx_type in running:
+                    running[tx_type] += amount
+
+            table = Table(table_data, repeatRows=1, hAlign="LEFT", colWidths=TABLE_COL_WIDTHS, splitByRow=True)
+            table.setStyle(TABLE_STYLE)
+
+            flowables.append(table)
+            flowables.append(Spacer(1, 12))
+            yield flowables
+
+        # -------------------------------------------------------
+        # Summary Section (Dynamic); running totals are complete by now
+        # -------------------------------------------------------
+        total_income, total_expense = totals if totals is not None else (running["income"], running["expense"])
+        net_balance = total_income - total_expense
+
+        summary_data = [
+            ["Total Income", f"${total_income:.2f}"],
+            ["Total Expenses", f"${total_expense:.2f}"],
+            ["Net Balance", f"${net_balance:.2f}"],
         ]
 
-        table = Table(table_data, repeatRows=1, hAlign="LEFT", colWidths=col_widths,splitByRow=True)
-
-        table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3498DB")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-
-            ("ALIGN", (0, 1), (-2, -1), "LEFT"),
-            ("ALIGN", (-2, 1), (-2, -1), "RIGHT"),  # Amount
-
-            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ("FONTNAME", (0, 0), (-1, -1), FONT_NAME),
-            ("FONTSIZE", (0, 0), (-1, -1), 9),
-
-            ("BACKGROUND", (0, 1), (-1, -1), colors.HexColor("#ECF0F1")),
-            ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#BDC3C7")),
-        ]))
-
-        # Add table to PDF
-        elements.append(table)
-        elements.append(Spacer(1, 12))
-
-        # Add page break UNLESS it's the last page
-        if index < len(chunks) - 1:
-            elements.append(PageBreak())
-
-
-
-    # -----------------------------------------------------------
-    # Summary Section (Dynamic)
-    # -----------------------------------------------------------
-    total_income = sum(t.amount for t in transactions if t.type == "income")
-    total_expense = sum(t.amount for t in transactions if t.type == "expense")
-    net_balance = total_income - total_expense
-
-    elements.append(Paragraph("<b>Summary</b>", styles["Heading2"]))
-    elements.append(Spacer(1, 10))
-
-    summary_data = [
-        ["Total Income", f"${total_income:.2f}"],
-        ["Total Expenses", f"${total_expense:.2f}"],
-        ["Net Balance", f"${net_balance:.2f}"],
-    ]
-
-    summary_table = Table(summary_data, hAlign="LEFT", colWidths=[180, 150])
-    summary_table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#F8F9F9")),
-        ("TEXTCOLOR", (0, 0), (-1, -1), colors.HexColor("#2C3E50")),
-        ("FONTNAME", (0, 0), (-1, -1), FONT_NAME),
-        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-        ("FONTSIZE", (0, 0), (-1, -1), 11),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-        ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#BDC3C7")),
-    ]))
-    elements.append(summary_table)
+        summary_table = Table(summary_data, hAlign="LEFT", colWidths=[180, 150])
+        summary_table.setStyle(SUMMARY_TABLE_STYLE)
+        yield [Paragraph("<b>Summary</b>", STYLES["Heading2"]), Spacer(1, 10), summary_table]
 
     # -----------------------------------------------------------
     # Footer Section
@@ -240,30 +307,83 @@ def generate_pdf_report(user_id, user_name, user_email, transactions,
         canvas.drawCentredString(A4[0] / 2.0, 30, footer_text)
         canvas.restoreState()
 
-    doc.build(elements, onFirstPage=footer, onLaterPages=footer)
-    pdf = buffer.getvalue()
-    buffer.close()
+    doc.build(_LazyStory(elements, pages_then_summary()), onFirstPage=footer, onLaterPages=footer)
+
+
+# =================================================================================
+# 🔵 EXPORT QUERY
+# =================================================================================
+def export_transactions_query(user_id, start_date, end_date, type="all"):
+    """Transactions for the export period, oldest first (served by the user/date index)."""
+    query = (
+        Transaction.query
+        .filter(Transaction.user_id == user_id)
+        .filter(Transaction.created_date >= start_date)
+        .filter(Transaction.created_date <= end_date)
+    )
+    if type in ["income", "expense"]:
+        query = query.filter(Transaction.type == type)
+    return query.order_by(Transaction.created_date, Transaction.id)
+
+
+def export_totals(query):
+    """(total_income, total_expense) for an export_transactions_query, summed in SQL."""
+    income, expense = query.order_by(None).with_entities(
+        func.coalesce(func.sum(case((Transaction.type == "income", Transaction.amount), else_=0)), 0),
+        func.coalesce(func.sum(case((Transaction.type == "expense", Transaction.amount), else_=0)), 0),
+    ).one()
+    return Decimal(str(income)), Decimal(str(expense))
+
+
+def iter_pdf_rows(query, yield_per=1000):
+    """pdf_row() tuples for an export_transactions_query, selected as columns (no ORM objects)."""
+    columns = query.outerjoin(Category, Category.id == Transaction.category_id).with_entities(
+        Transaction.id,
+        Transaction.created_date,
+        Transaction.type,
+        Category.name,
+        Transaction.amount,
+        Transaction.description,
+    )
+    for row in columns.yield_per(yield_per):
+        yield tuple(row)
 
-    return pdf
+
+def export_pdf_rows(query):
+    """All pdf_row() tuples as a list, for handing to the render pool."""
+    return list(iter_pdf_rows(query))
 
 
 # =================================================================================
 # 🔵 CSV GENERATION (Dynamic)
 # =================================================================================
-def generate_csv_report(user_id, user_name, user_email, transactions):
+CSV_FLUSH_ROWS = 500
+
+
+def iter_csv_report(user_id, user_name, user_email, transactions, flush_rows=CSV_FLUSH_ROWS):
     """
-    CSV with original layout + dynamic data.
+    Yield the CSV report in text chunks. Rows are written as they arrive from
+    `transactions` (any iterable, e.g. a yield_per query) and the Summary
+    totals are kept as running sums, so memory does not grow with row count.
     """
 
     csv_buffer = StringIO()
     writer = csv.writer(csv_buffer)
 
+    def drain():
+        chunk = csv_buffer.getvalue()
+        csv_buffer.seek(0)
+        csv_buffer.truncate(0)
+        return chunk
+
     # Header row
     writer.writerow(["Date", "Transaction ID", "Transaction Type", "Category Type", "Amount", "Notes"])
 
     # Transaction rows
-    for i,t in enumerate(transactions):
-        hybrid_id = f"TX-{i+1} (ID:{t.id})"
+    total_income = Decimal(0)
+    total_expense = Decimal(0)
+    for i, t in enumerate(transactions, start=1):
+        hybrid_id = f"TX-{i} (ID:{t.id})"
         writer.writerow([
             t.created_date.strftime("%Y-%m-%d") if t.created_date else "N/A",
             hybrid_id,
@@ -273,9 +393,15 @@ def generate_csv_report(user_id, user_name, user_email, transactions):
             t.description or "-"
         ])
 
+        if t.type == "income":
+            total_income += t.amount
+        elif t.type == "expense":
+            total_expense += t.amount
+
+        if i % flush_rows == 0:
+            yield drain()
+
     # Summary
-    total_income = sum(t.amount for t in transactions if t.type == "income")
-    total_expense = sum(t.amount for t in transactions if t.type == "expense")
     balance = total_income - total_expense
 
     writer.writerow([])
@@ -284,4 +410,186 @@ def generate_csv_report(user_id, user_name, user_email, transactions):
     writer.writerow(["Total Expenses", f"{total_expense:.2f}"])
     writer.writerow(["Net Balance", f"{balance:.2f}"])
 
-    return csv_buffer.getvalue()
\ No newline at end of file
+    yield drain()
+
+
+def generate_csv_report(user_id, user_name, user_email, transactions):
+    """
+    CSV with original layout + dynamic data.
+    """
+    return "".join(iter_csv_report(user_id, user_name, user_email, transactions))
+
+
+# =================================================================================
+# 🔵 COLUMNAR EXPORT (Parquet / Arrow IPC)
+# =================================================================================
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+
+def require_pyarrow():
+    """Import pyarrow on first use; only columnar exports need it, so an install without it serves the rest."""
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ColumnarExportUnavailableError("Parquet and Arrow exports require the 'pyarrow' package.")
+    return pyarrow
+
+
+def columnar_schema(pa):
+    return pa.schema([
+        ("id", pa.int64()),
+        ("date", pa.date32()),
+        ("type", pa.dictionary(pa.int32(), pa.string())),
+        ("category", pa.dictionary(pa.int32(), pa.string())),
+        ("amount", pa.decimal128(10, 2)),
+        ("description", pa.string()),
+    ])
+
+
+def iter_record_batches(query, rows_per_batch=10000):
+    """
+    Arrow record batches for an export_transactions_query, built column by
+    column from a yield_per column query. `type` and `category` are
+    dictionary-encoded against one dictionary per export (read up front), so
+    every batch shares it and the IPC file format never sees a replacement.
+    """
+    pa = require_pyarrow()
+    pc = pa.compute
+    schema = columnar_schema(pa)
+
+    base = query.order_by(None)
+    type_dictionary = pa.array(
+        [t for (t,) in base.with_entities(Transaction.type).distinct().order_by(Transaction.type)], pa.string()
+    )
+    categories = (
+        base.join(Category, Category.id == Transaction.category_id)
+        .with_entities(Category.id, Category.name)
+        .distinct()
+        .order_by(Category.id)
+        .all()
+    )
+    category_ids = pa.array([c.id for c in categories], pa.int64())
+    category_dictionary = pa.array([c.name for c in categories], pa.string())
+
+    def encode(values, value_set, dictionary):
+        indices = pc.index_in(values, value_set=value_set).cast(pa.int32())
+        return pa.DictionaryArray.from_arrays(indices, dictionary)
+
+    rows = iter(query.with_entities(
+        Transaction.id,
+        Transaction.created_date,
+        Transaction.type,
+        Transaction.category_id,
+        Transaction.amount,
+        Transaction.description,
+    ).yield_per(rows_per_batch))
+
+    while True:
+        chunk = list(islice(rows, rows_per_batch))
+        if not chunk:
+            return
+        ids, dates, types, cat_ids, amounts, descriptions = zip(*chunk)
+        types = pa.array(types, pa.string())
+        yield pa.RecordBatch.from_arrays([
+            pa.array(ids, pa.int64()),
+            pa.array(dates, pa.date32()),
+            encode(types, type_dictionary, type_dictionary),
+            encode(pa.array(cat_ids, pa.int64()), category_ids, category_dictionary),
+            pa.array(amounts, pa.decimal128(10, 2)),
+            pa.array(descriptions, pa.string()),
+        ], schema=schema)
+
+
+def write_columnar_report(output, query, fmt, rows_per_group=10000, progress=None):
+    """
+    Write the export as Parquet (one row group per batch) or an Arrow IPC
+    file into `output` (a path or binary file object), so only one batch of
+    rows is in memory at a time. Returns the number of rows written.
+    """
+    pa = require_pyarrow()
+    schema = columnar_schema(pa)
+    if fmt == "parquet":
+        writer = pa.parquet.ParquetWriter(output, schema)
+    else:
+        writer = pa.ipc.new_file(output, schema)
+
+    written = 0
+    with writer:
+        for batch in iter_record_batches(query, rows_per_group):
+            writer.write_batch(batch)
+            written += batch.num_rows
+            if progress is not None:
+                progress["processed"] = written
+    return written
+
+
+# =================================================================================
+# 🔵 BACKGROUND EXPORT JOBS
+# =================================================================================
+EXPORT_FORMATS = {
+    "pdf": ("application/pdf", "budgetwise_report.pdf"),
+    "csv": ("text/csv", "budgetwise_report.csv"),
+    "parquet": ("application/vnd.apache.parquet", "budgetwise_transactions.parquet"),
+    "arrow": ("application/vnd.apache.arrow.file", "budgetwise_transactions.arrow"),
+}
+
+
+def _counted(rows, progress):
+    for row in rows:
+        progress["processed"] += 1
+        yield row
+
+
+def run_export_job(job, user_id, fmt, start_date, end_date, type="all", yield_per=1000):
+    """
+    Job body for POST /export/jobs: writes the report to the job's artifact
+    file and reports rows processed out of the total as it goes.
+    """
+    user = db.session.get(User, user_id)
+    query = export_transactions_query(user_id, start_date, end_date, type)
+    job.progress.update(total=query.order_by(None).count(), processed=0)
+
+    path = job_queue.artifact_path(job, fmt)
+    if fmt == "csv":
+        rows = _counted(query.yield_per(yield_per), job.progress)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            for chunk in iter_csv_report(user_id, user.username, user.email, rows):
+                f.write(chunk)
+    elif fmt in COLUMNAR_FORMATS:
+        write_columnar_report(
+            path, query, fmt, current_app.config["EXPORT_ROW_GROUP_ROWS"], progress=job.progress
+        )
+    elif job.progress["total"] > current_app.config["PDF_LARGE_REPORT_ROWS"]:
+        # Large report: lay pages out straight from the streaming query into the artifact file
+        write_pdf_report(
+            path,
+            _counted(iter_pdf_rows(query, yield_per), job.progress),
+            user_id=user_id,
+            user_name=user.username,
+            user_email=user.email,
+            start_date=start_date,
+            end_date=end_date,
+            totals=export_totals(query),
+        )
+    else:
+        rows = export_pdf_rows(query)
+        pdf = render_pool.run(
+            render_pdf_rows,
+            rows,
+            user_id=user_id,
+            user_name=user.username,
+            user_email=user.email,
+            start_date=start_date,
+            end_date=end_date,
+            totals=export_totals(query),
+        )
+        job.progress["processed"] = len(rows)
+        with open(path, "wb") as f:
+            f.write(pdf)
+
+    mimetype, download_name = EXPORT_FORMATS[fmt]
+    job.artifact = (path, mimetype, download_name)
+    return {"rows": job.progress["processed"]}
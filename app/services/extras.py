@@ -1,9 +1,10 @@
-from datetime import datetime
+from datetime import date, datetime
 from app.services.summary_services import SummaryService
+from app.services.rollup_service import next_month_start
 from app.extensions import db
 from app.models.transaction import Transaction
 from app.models.category import Category
-from sqlalchemy import func, extract, case, and_
+from sqlalchemy import func, case, and_
 
 
 # Get current year and month
@@ -19,20 +20,25 @@ class Extras:
         current_year = now.year
         current_month = now.month
 
+        # ✅ Half-open month bounds so the (user_id, created_date) index is range-scanned
+        current_start = date(current_year, current_month, 1)
+        next_start = next_month_start(current_year, current_month)
+
         #✅ Get current month total
         total_expenses_current_month = (
             db.session.query(func.sum(Transaction.amount))
             .join(Category)
             .filter(Transaction.user_id == user_id)
             .filter(Category.type == "expense")
-            .filter(extract('year', Transaction.created_date) == current_year)
-            .filter(extract('month', Transaction.created_date) == current_month)
+            .filter(Transaction.created_date >= current_start)
+            .filter(Transaction.created_date < next_start)
             .scalar()
         ) or 0.0
 
         # ✅ Get previous month and handle year wrap-around
         prev_year = current_year if current_month > 1 else current_year - 1
         prev_month = current_month - 1 if current_month > 1 else 12
+        prev_start = date(prev_year, prev_month, 1)
 
         # ✅ Get previous month total
         total_expenses_previous_month = (
@@ -40,8 +46,8 @@ class Extras:
             .join(Category)
             .filter(Transaction.user_id == user_id)
             .filter(Category.type == "expense")
-            .filter(extract('year', Transaction.created_date) == prev_year)
-            .filter(extract('month', Transaction.created_date) == prev_month)
+            .filter(Transaction.created_date >= prev_start)
+            .filter(Transaction.created_date < current_start)
             .scalar()
         ) or 0.0
 
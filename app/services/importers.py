@@ -0,0 +1,245 @@
+import html
+import json
+import os
+import re
+from decimal import Decimal, InvalidOperation
+from datetime import datetime
+from app.schemas.transaction_schemas import TransactionCreateSchema
+from app.utils.csv_exceptions import UnsupportedImportFormatError
+
+
+# Bank formats carry no categories of their own
+DEFAULT_CATEGORY = "Uncategorized"
+
+
+class Importer:
+    """
+    One upload format. `parse(lines)` is a generator over decoded text lines
+    that yields one record per transaction as soon as it is complete, so
+    files are never loaded whole. `parse_row(record)` turns a record into a
+    TransactionCreateSchema (raising ValueError / ValidationError), which
+    lets every format share import_rows and bulk_create_transactions.
+    """
+
+    def __init__(self, name: str, parse, parse_row, extensions=()):
+        self.name = name
+        self.parse = parse
+        self.parse_row = parse_row
+        self.extensions = tuple(extensions)
+
+    def __repr__(self):
+        return f"<Importer {self.name}>"
+
+
+IMPORTERS = {}
+
+
+def register_importer(name: str, extensions=(), parse_row=TransactionCreateSchema.model_validate):
+    """Decorator adding a parse generator to IMPORTERS under `name` and its file extensions."""
+    def decorator(parse):
+        IMPORTERS[name] = Importer(name, parse, parse_row, extensions)
+        return parse
+    return decorator
+
+
+def get_importer(name: str) -> Importer:
+    importer = IMPORTERS.get((name or "").lower())
+    if importer is None:
+        raise UnsupportedImportFormatError(
+            f"Unsupported import format: {name}. Supported formats: {', '.join(sorted(IMPORTERS))}."
+        )
+    return importer
+
+
+def importer_for(filename: str, name: str = None) -> Importer:
+    """The importer named by `name`, else the one registered for the file's extension (CSV by default)."""
+    if name:
+        return get_importer(name)
+    extension = os.path.splitext(filename or "")[1].lower()
+    for importer in IMPORTERS.values():
+        if extension in importer.extensions:
+            return importer
+    return get_importer("csv")
+
+
+# -----------------------------
+# Shared record helpers
+# -----------------------------
+def signed_record(amount: str, date, payee: str = None, memo: str = None, category: str = None) -> dict:
+    """
+    Record for a statement line whose amount is signed (negative = money
+    out) and already normalized to a "." decimal point with no thousands
+    separators. Values that cannot be read are passed through as text so
+    schema validation reports them against the row.
+    """
+    record = {
+        "category_name": category or DEFAULT_CATEGORY,
+        "type": None,
+        "amount": amount,
+        "description": " - ".join(dict.fromkeys(part for part in (payee, memo) if part)) or None,
+        "date": date,
+    }
+    try:
+        value = Decimal(amount or "")
+    except InvalidOperation:
+        return record
+    record["type"] = "expense" if value < 0 else "income"
+    record["amount"] = str(abs(value))
+    return record
+
+
+# -----------------------------
+# OFX / QFX
+# -----------------------------
+_OFX_TOKEN = re.compile(r"<([^<>]+)>([^<]*)")
+
+
+def _ofx_tokens(lines):
+    """(tag, text) pairs from OFX 1.x SGML or 2.x XML, whatever the line layout."""
+    buffer = ""
+    for line in lines:
+        buffer += line
+        # Text after the last "<" may belong to a tag continued on the next line
+        end = buffer.rfind("<")
+        if end <= 0:
+            continue
+        for match in _OFX_TOKEN.finditer(buffer, 0, end):
+            yield match.group(1).strip().upper(), html.unescape(match.group(2).strip())
+        buffer = buffer[end:]
+    for match in _OFX_TOKEN.finditer(buffer):
+        yield match.group(1).strip().upper(), html.unescape(match.group(2).strip())
+
+
+def parse_ofx_date(value: str):
+    """YYYYMMDD[HHMMSS[.XXX][TZ]] to an ISO date string; other text is returned unchanged."""
+    try:
+        return datetime.strptime(value[:8], "%Y%m%d").date().isoformat()
+    except ValueError:
+        return value
+
+
+def parse_ofx_amount(value: str):
+    """OFX amounts have no thousands separators; a comma is the decimal point (-12,50)."""
+    if value and value.count(",") == 1 and "." not in value:
+        return value.replace(",", ".")
+    return value
+
+
+@register_importer("ofx", extensions=(".ofx", ".qfx"))
+def parse_ofx(lines):
+    """
+    Yield one record per <STMTTRN> (bank and credit card statements). Amounts
+    come from TRNAMT, whose sign gives the type; NAME and MEMO become the
+    description.
+    """
+    fields = None
+    for tag, text in _ofx_tokens(lines):
+        if tag == "STMTTRN":
+            fields = {}
+        elif tag == "/STMTTRN":
+            if fields is not None:
+                yield signed_record(
+                    parse_ofx_amount(fields.get("TRNAMT")), parse_ofx_date(fields.get("DTPOSTED", "")),
+                    fields.get("NAME") or fields.get("PAYEE"), fields.get("MEMO"),
+                )
+            fields = None
+        elif fields is not None and text and not tag.startswith(("/", "?", "!")):
+            fields[tag] = text
+
+
+# -----------------------------
+# QIF
+# -----------------------------
+_QIF_DATE = re.compile(r"^(\d{1,2})/(\d{1,2})(['/])(\d{2}|\d{4})$")
+_QIF_TRANSACTION_TYPES = {"bank", "cash", "ccard", "oth a", "oth l"}
+
+
+def parse_qif_date(value: str):
+    """
+    Quicken dates (10/18/2025, 10/18/25, 10/18'25, " 1/ 5'25", or ISO) to an
+    ISO date string; other text is returned unchanged. A two-digit year after
+    an apostrophe is in the 2000s.
+    """
+    compact = value.replace(" ", "").replace("-", "/")
+    match = _QIF_DATE.match(compact)
+    try:
+        if match is None:
+            return datetime.strptime(compact, "%Y/%m/%d").date().isoformat()
+        month, day, separator, year = match.groups()
+        if len(year) == 2:
+            year = f"20{year}" if separator == "'" else datetime.strptime(year, "%y").strftime("%Y")
+        return datetime(int(year), int(month), int(day)).date().isoformat()
+    except ValueError:
+        return value
+
+
+def parse_qif_amount(value: str):
+    """Quicken writes amounts as 1,250.00, so commas are thousands separators."""
+    return value.replace(",", "") if value else value
+
+
+@register_importer("qif", extensions=(".qif",))
+def parse_qif(lines):
+    """
+    Yield one record per "^"-terminated entry of bank, cash and credit card
+    sections. Account, category list and investment sections are skipped.
+    The L field (before any /class) is the category; transfers ("[Account]")
+    are filed under "Transfer".
+    """
+    in_transactions = True
+    fields = {}
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        code, value = line[0], line[1:].strip()
+        if code == "!":
+            header = value.lower()
+            if header.startswith("type:"):
+                in_transactions = header[5:].strip() in _QIF_TRANSACTION_TYPES
+            elif header == "account":
+                in_transactions = False
+            fields = {}
+        elif code == "^":
+            if in_transactions and fields:
+                category = fields.get("L", "").split("/")[0].strip()
+                if category.startswith("["):
+                    category = "Transfer"
+                yield signed_record(
+                    parse_qif_amount(fields.get("T") or fields.get("U")), parse_qif_date(fields.get("D", "")),
+                    fields.get("P"), fields.get("M"), category,
+                )
+            fields = {}
+        elif code not in ("S", "E", "$"):  # split lines; the entry total is imported
+            fields.setdefault(code, value)
+
+
+# -----------------------------
+# NDJSON (sync service)
+# -----------------------------
+def parse_json_row(record) -> TransactionCreateSchema:
+    """Validate one decoded NDJSON object; a line that was not a JSON object is passed through as text."""
+    if not isinstance(record, dict):
+        raise ValueError(f"Invalid JSON object: {str(record)[:100]}")
+    return TransactionCreateSchema.model_validate(record)
+
+
+@register_importer("ndjson", extensions=(".ndjson", ".jsonl"), parse_row=parse_json_row)
+def parse_ndjson(lines):
+    """
+    Yield each non-blank line decoded as a TransactionCreateSchema object
+    (category_name, type, amount, description, date). Numbers are read as
+    Decimal. A malformed line is yielded as its raw text and fails alone.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line, parse_float=Decimal)
+        except ValueError:
+            yield line
+
+
+# The CSV importer lives with the rest of the CSV code and registers itself on import
+from app.services import csv_services  # noqa: E402,F401
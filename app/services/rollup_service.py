@@ -0,0 +1,219 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import event, extract, func, inspect, insert, delete, and_
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from app.extensions import db, result_cache
+from app.services.cache_service import mark_user_changed
+from app.models.category import Category
+from app.models.monthly_rollup import MonthlyRollup
+from app.models.transaction import Transaction
+
+ROLLUP_KEY = ("user_id", "year", "month", "category_id", "type")
+
+
+# -----------------------------
+# Delta application
+# -----------------------------
+def _to_decimal(value) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value or 0))
+
+
+def rollup_key(user_id, created_date, category_id, tx_type):
+    return (user_id, created_date.year, created_date.month, category_id, tx_type)
+
+
+def _upsert_statement(dialect_name: str):
+    table = MonthlyRollup.__table__
+    if dialect_name in ("sqlite", "postgresql"):
+        dialect_insert = sqlite.insert if dialect_name == "sqlite" else postgresql.insert
+        stmt = dialect_insert(table)
+        return stmt.on_conflict_do_update(
+            index_elements=list(ROLLUP_KEY),
+            set_={
+                "transaction_count": table.c.transaction_count + stmt.excluded.transaction_count,
+                "total_amount": table.c.total_amount + stmt.excluded.total_amount,
+            },
+        )
+    if dialect_name in ("mysql", "mariadb"):
+        stmt = mysql.insert(table)
+        return stmt.on_duplicate_key_update(
+            transaction_count=table.c.transaction_count + stmt.inserted.transaction_count,
+            total_amount=table.c.total_amount + stmt.inserted.total_amount,
+        )
+    return None
+
+
+def apply_rollup_deltas(connection, deltas: dict):
+    """
+    Apply {rollup_key: (count_delta, amount_delta)} to monthly_rollups using
+    the given connection, so it joins whatever DB transaction is in progress.
+    Rows whose count drops to zero are removed.
+    """
+    rows = [
+        dict(zip(ROLLUP_KEY, key), transaction_count=count, total_amount=amount)
+        for key, (count, amount) in deltas.items()
+        if count or amount
+    ]
+    if not rows:
+        return
+
+    table = MonthlyRollup.__table__
+    stmt = _upsert_statement(connection.dialect.name)
+    if stmt is not None:
+        connection.execute(stmt, rows)
+    else:
+        # Portable fallback: update, then insert the keys that did not exist yet
+        for row in rows:
+            key_filter = and_(*[table.c[col] == row[col] for col in ROLLUP_KEY])
+            updated = connection.execute(
+                table.update()
+                .where(key_filter)
+                .values(
+                    transaction_count=table.c.transaction_count + row["transaction_count"],
+                    total_amount=table.c.total_amount + row["total_amount"],
+                )
+            )
+            if updated.rowcount == 0:
+                connection.execute(insert(table), [row])
+
+    shrunk_users = {row["user_id"] for row in rows if row["transaction_count"] < 0}
+    if shrunk_users:
+        connection.execute(
+            delete(table).where(table.c.user_id.in_(shrunk_users), table.c.transaction_count <= 0)
+        )
+
+
+def add_rollup_delta(deltas: dict, key, count: int, amount):
+    current_count, current_amount = deltas.get(key, (0, Decimal(0)))
+    deltas[key] = (current_count + count, current_amount + _to_decimal(amount))
+
+
+def rollup_deltas_for_rows(rows) -> dict:
+    """Aggregate deltas for freshly inserted transaction dicts (bulk insert path)."""
+    deltas = {}
+    for row in rows:
+        key = rollup_key(row["user_id"], row["created_date"], row["category_id"], row["type"])
+        add_rollup_delta(deltas, key, 1, row["amount"])
+    return deltas
+
+
+# -----------------------------
+# ORM hooks: keep rollups in the same flush as the transaction write
+# -----------------------------
+_TRACKED_ATTRS = ("user_id", "created_date", "category_id", "type", "amount")
+
+
+def _previous_value(state, attr):
+    history = state.attrs[attr].history
+    if history.deleted:
+        return history.deleted[0]
+    return state.attrs[attr].value
+
+
+@event.listens_for(Transaction, "after_insert")
+def _rollup_after_insert(mapper, connection, target):
+    key = rollup_key(target.user_id, target.created_date, target.category_id, target.type)
+    apply_rollup_deltas(connection, {key: (1, _to_decimal(target.amount))})
+
+
+@event.listens_for(Transaction, "after_update")
+def _rollup_after_update(mapper, connection, target):
+    state = inspect(target)
+    if not any(state.attrs[attr].history.has_changes() for attr in _TRACKED_ATTRS):
+        return
+
+    old = {attr: _previous_value(state, attr) for attr in _TRACKED_ATTRS}
+    deltas = {}
+    add_rollup_delta(
+        deltas,
+        rollup_key(old["user_id"], old["created_date"], old["category_id"], old["type"]),
+        -1,
+        -_to_decimal(old["amount"]),
+    )
+    add_rollup_delta(
+        deltas,
+        rollup_key(target.user_id, target.created_date, target.category_id, target.type),
+        1,
+        target.amount,
+    )
+    apply_rollup_deltas(connection, deltas)
+
+
+@event.listens_for(Transaction, "after_delete")
+def _rollup_after_delete(mapper, connection, target):
+    key = rollup_key(target.user_id, target.created_date, target.category_id, target.type)
+    apply_rollup_deltas(connection, {key: (-1, -_to_decimal(target.amount))})
+
+
+@event.listens_for(Category, "after_delete")
+def _rollup_after_category_delete(mapper, connection, target):
+    connection.execute(delete(MonthlyRollup.__table__).where(MonthlyRollup.category_id == target.id))
+
+
+# -----------------------------
+# Range helpers
+# -----------------------------
+def next_month_start(year: int, month: int) -> date:
+    """First day of the month after (year, month)."""
+    return date(year + month // 12, month % 12 + 1, 1)
+
+
+def month_span(range_start: date, range_end: date):
+    """
+    Return (first, last) month indexes (year * 12 + month - 1) when the
+    half-open date range [range_start, range_end) covers whole calendar
+    months, otherwise None.
+    """
+    if range_start.day != 1 or range_end.day != 1 or range_end <= range_start:
+        return None
+    return range_start.year * 12 + range_start.month - 1, range_end.year * 12 + range_end.month - 2
+
+
+def rollup_month_index():
+    return MonthlyRollup.year * 12 + MonthlyRollup.month - 1
+
+
+# -----------------------------
+# Rebuild
+# -----------------------------
+def rebuild_rollups(user_id=None) -> int:
+    """Recompute monthly_rollups from the transactions table. Returns rows written."""
+    try:
+        year = extract("year", Transaction.created_date)
+        month = extract("month", Transaction.created_date)
+        source = (
+            db.session.query(
+                Transaction.user_id,
+                year,
+                month,
+                Transaction.category_id,
+                Transaction.type,
+                func.count(Transaction.id),
+                func.sum(Transaction.amount),
+            )
+            .filter(Transaction.created_date.isnot(None))
+            .group_by(Transaction.user_id, year, month, Transaction.category_id, Transaction.type)
+        )
+        wipe = delete(MonthlyRollup.__table__)
+        if user_id is not None:
+            source = source.filter(Transaction.user_id == user_id)
+            wipe = wipe.where(MonthlyRollup.user_id == user_id)
+
+        db.session.execute(wipe)
+        if user_id is not None:
+            mark_user_changed(user_id)
+        result = db.session.execute(
+            insert(MonthlyRollup.__table__).from_select(
+                list(ROLLUP_KEY) + ["transaction_count", "total_amount"],
+                source.statement,
+            )
+        )
+        db.session.commit()
+        if user_id is None:
+            result_cache.clear()
+        return result.rowcount
+    except Exception:
+        db.session.rollback()
+        raise
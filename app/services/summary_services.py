@@ -1,12 +1,15 @@
 from app.models.transaction import Transaction
 from app.models.category import Category
+from app.models.monthly_rollup import MonthlyRollup
 from app.extensions import db
-from sqlalchemy import func, extract, case, and_
+from app.services.rollup_service import month_span, next_month_start, rollup_month_index
+from flask import current_app
+from sqlalchemy import func, extract, case, and_, select, union_all
 from app.schemas.summary_schema import SummaryResponse, SummaryResponseSubCategory
 from app.utils.summary_exceptions import *
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 from typing import Optional
-import calendar
 
 
 
@@ -44,26 +47,11 @@ class SummaryService:
             )
 
             # ----------------------------- QUERY -------------------------------
-            query = (
-                db.session.query(
-                    func.sum(case((Category.type == "expense", 1), else_=0)).label("expense_transaction_count"),
-                    func.sum(case((Category.type == "expense", Transaction.amount), else_=0)).label("expense_transaction_total"),
-                    func.sum(case((Category.type == "income", 1), else_=0)).label("income_transaction_count"),
-                    func.sum(case((Category.type == "income", Transaction.amount), else_=0)).label("income_transaction_total"),
-                    func.count(Transaction.id).label("total_transactions"),
-                    (
-                        func.sum(case((Category.type == "income", Transaction.amount), else_=0))
-                        - func.sum(case((Category.type == "expense", Transaction.amount), else_=0))
-                    ).label("net_difference"),
-                )
-                .join(Category)
-                .filter(Transaction.user_id == user_id)
-                .filter(filter_condition)
+            result = SummaryService._period_totals(
+                user_id, filter_condition, range_start, range_end, subcategory
             )
 
-            result = query.first()
-
-            if not result or result.total_transactions == 0:
+            if not result or not result.total_transactions:
                 raise SummaryNotFoundError(
                     f"No transactions found for subcategory '{subcategory}'." if subcategory 
                     else "No transactions found for the selected period."
@@ -78,7 +66,7 @@ class SummaryService:
                 "total_transactions": int(result.total_transactions or 0),
                 "net_difference": float(result.net_difference or 0),
                 "range_start": str(range_start),
-                "range_end": str(range_end),
+                "range_end": str(range_end - timedelta(days=1)),
                 "subcategory": subcategory or "All",
             }
 
@@ -151,26 +139,11 @@ class SummaryService:
             )
 
             # ----------------------------- SUMMARY QUERY -----------------------
-            query = (
-                db.session.query(
-                    func.sum(case((Category.type == "expense", 1), else_=0)).label("expense_transaction_count"),
-                    func.sum(case((Category.type == "expense", Transaction.amount), else_=0)).label("expense_transaction_total"),
-                    func.sum(case((Category.type == "income", 1), else_=0)).label("income_transaction_count"),
-                    func.sum(case((Category.type == "income", Transaction.amount), else_=0)).label("income_transaction_total"),
-                    func.count(Transaction.id).label("total_transactions"),
-                    (
-                        func.sum(case((Category.type == "income", Transaction.amount), else_=0))
-                        - func.sum(case((Category.type == "expense", Transaction.amount), else_=0))
-                    ).label("net_difference"),
-                )
-                .join(Category)
-                .filter(Transaction.user_id == user_id)
-                .filter(filter_condition)
+            result = SummaryService._period_totals(
+                user_id, filter_condition, range_start, range_end, subcategory
             )
 
-            result = query.first()
-
-            if not result or result.total_transactions == 0:
+            if not result or not result.total_transactions:
                 raise SummaryNotFoundError(
                     "No transactions found for this period or subcategory."
                 )
@@ -201,23 +174,10 @@ class SummaryService:
                 filtered_summary = summary
 
             # ---------------------- SUBCATEGORY BREAKDOWN ----------------------
-            breakdown_query = (
-                db.session.query(
-                    Category.name.label("category_name"),
-                    Category.type.label("category_type"),
-                    func.sum(Transaction.amount).label("total"),
-                )
-                .join(Category)
-                .filter(Transaction.user_id == user_id)
-                .filter(Transaction.created_date.between(range_start, range_end))
-                .group_by(Category.name, Category.type)
+            breakdown_results = SummaryService._category_breakdown(
+                user_id, range_start, range_end, subcategory
             )
 
-            if subcategory:
-                breakdown_query = breakdown_query.filter(Category.name.ilike(subcategory))
-
-            breakdown_results = breakdown_query.all()
-
             summary_breakdown = {"income": [], "expense": []}
 
             for r in breakdown_results:
@@ -244,7 +204,7 @@ class SummaryService:
                 "type": tx_type or "all",
                 "transactions_count": filtered_summary.get("total_transactions", 0),
                 "range_start": str(range_start),
-                "range_end": str(range_end),
+                "range_end": str(range_end - timedelta(days=1)),
                 "subcategory": subcategory or "All",
                 "total_income": filtered_summary.get("income_transaction_total", 0.0),
                 "total_expense": filtered_summary.get("expense_transaction_total", 0.0),
@@ -264,6 +224,13 @@ class SummaryService:
 
     @staticmethod
     def get_dashboard_data(user_id: int):
+        """
+        Dashboard totals, breakdowns and top transactions.
+
+        Runs two statements: one grouped scan by (type, category, month) whose
+        rows are folded into every aggregate below, and one query for the
+        top-3 rows per type.
+        """
         try:
             # -----------------------------
             # 0. VALIDATE INPUT
@@ -271,202 +238,76 @@ class SummaryService:
             if not user_id:
                 raise MissingParameterError("user_id is required to fetch summary data.")
 
-            # Check if any transactions exist for this user
-            trans_exists = (
-                db.session.query(func.count(Transaction.id))
-                .filter(Transaction.user_id == user_id)
-                .scalar()
-            )
-
-            if trans_exists == 0:
-                raise SummaryNotFoundError("No transactions found for this user.")
-
             # -----------------------------
-            # 1. TOTAL INCOME / EXPENSE
+            # 1. GROUPED SCAN
             # -----------------------------
-            total_income = db.session.query(
-                func.coalesce(func.sum(Transaction.amount), 0)
-            ).filter_by(user_id=user_id, type="income").scalar()
-
-            total_expense = db.session.query(
-                func.coalesce(func.sum(Transaction.amount), 0)
-            ).filter_by(user_id=user_id, type="expense").scalar()
+            grouped_rows = SummaryService._dashboard_grouped_rows(user_id)
 
-            net_difference = total_income - total_expense
-
-            # -----------------------------
-            # 2. INCOME BY CATEGORY
-            # -----------------------------
-            income_by_category_raw = (
-                db.session.query(Category.name, func.sum(Transaction.amount))
-                .join(Transaction, Category.id == Transaction.category_id)
-                .filter(Transaction.user_id == user_id, Transaction.type == "income")
-                .group_by(Category.name)
-                .all()
-            )
-
-            income_by_category = {
-                name: float(amount) for name, amount in income_by_category_raw
-            }
+            if not grouped_rows:
+                raise SummaryNotFoundError("No transactions found for this user.")
 
-            # -----------------------------
-            # 3. EXPENSE BY CATEGORY
-            # -----------------------------
-            expense_by_category_raw = (
-                db.session.query(Category.name, func.sum(Transaction.amount))
-                .join(Transaction, Category.id == Transaction.category_id)
-                .filter(Transaction.user_id == user_id, Transaction.type == "expense")
-                .group_by(Category.name)
-                .all()
-            )
+            totals = {"income": Decimal(0), "expense": Decimal(0)}
+            by_category = {"income": {}, "expense": {}}
+            per_month = {"income": {}, "expense": {}}
+            count_per_month = {}
 
-            expense_by_category = {
-                name: float(amount) for name, amount in expense_by_category_raw
-            }
+            for tx_type, category_name, month, count, amount in grouped_rows:
+                month = int(month)
+                amount = Decimal(amount or 0)
+                count_per_month[month] = count_per_month.get(month, 0) + int(count)
 
-            # -----------------------------
-            # 4. TOP 3 INCOME
-            # -----------------------------
-            top_3_income_raw = (
-                db.session.query(Transaction)
-                .filter_by(user_id=user_id, type="income")
-                .order_by(Transaction.amount.desc())
-                .limit(3)
-                .all()
-            )
+                if tx_type not in totals:
+                    continue
+                totals[tx_type] += amount
+                by_category[tx_type][category_name] = by_category[tx_type].get(category_name, Decimal(0)) + amount
+                per_month[tx_type][month] = per_month[tx_type].get(month, Decimal(0)) + amount
 
-            top_3_income = [
-                {
-                    "amount": float(t.amount),
-                    "category": t.category.name,
-                    "date": t.created_date.isoformat()
-                }
-                for t in top_3_income_raw
-            ]
-
-            # -----------------------------
-            # 5. TOP 3 EXPENSE
-            # -----------------------------
-            top_3_expense_raw = (
-                db.session.query(Transaction)
-                .filter_by(user_id=user_id, type="expense")
-                .order_by(Transaction.amount.desc())
-                .limit(3)
-                .all()
-            )
+            total_income = totals["income"]
+            total_expense = totals["expense"]
+            net_difference = total_income - total_expense
 
-            top_3_expense = [
-                {
-                    "amount": float(t.amount),
-                    "category": t.category.name,
-                    "date": t.created_date.isoformat()
-                }
-                for t in top_3_expense_raw
-            ]
+            income_by_category = {name: float(amount) for name, amount in by_category["income"].items()}
+            expense_by_category = {name: float(amount) for name, amount in by_category["expense"].items()}
 
             # -----------------------------
-            # 6. OVERALL HIGHEST INCOME
+            # 2. TOP 3 INCOME / EXPENSE
             # -----------------------------
-            highest_income = (
-                db.session.query(Transaction)
-                .filter_by(user_id=user_id, type="income")
-                .order_by(Transaction.amount.desc())
-                .first()
-            )
+            top_rows = SummaryService._dashboard_top_rows(user_id, limit=3)
 
-            overall_highest_income = (
-                {
-                    "amount": float(highest_income.amount),
-                    "category": highest_income.category.name,
-                    "date": highest_income.created_date.isoformat(),
-                }
-                if highest_income else None
-            )
+            top_3_income = [row for tx_type, row in top_rows if tx_type == "income"]
+            top_3_expense = [row for tx_type, row in top_rows if tx_type == "expense"]
 
             # -----------------------------
-            # 7. OVERALL HIGHEST EXPENSE
+            # 3. OVERALL HIGHEST INCOME / EXPENSE
             # -----------------------------
-            highest_expense = (
-                db.session.query(Transaction)
-                .filter_by(user_id=user_id, type="expense")
-                .order_by(Transaction.amount.desc())
-                .first()
-            )
-
-            overall_highest_expense = (
-                {
-                    "amount": float(highest_expense.amount),
-                    "category": highest_expense.category.name,
-                    "date": highest_expense.created_date.isoformat(),
-                }
-                if highest_expense else None
-            )
+            overall_highest_income = top_3_income[0] if top_3_income else None
+            overall_highest_expense = top_3_expense[0] if top_3_expense else None
 
             # -----------------------------
-            # 8. TRANSACTIONS PER MONTH
+            # 4. PER MONTH
             # -----------------------------
-            trans_per_month_raw = (
-                db.session.query(
-                    extract("month", Transaction.created_date).label("month"),
-                    func.count(Transaction.id)
-                )
-                .filter(Transaction.user_id == user_id)
-                .group_by("month")
-                .order_by("month")
-                .all()
-            )
-
             transactions_per_month = [
-                {"month": int(month), "count": count}
-                for month, count in trans_per_month_raw
+                {"month": month, "count": count}
+                for month, count in sorted(count_per_month.items())
             ]
 
-            # -----------------------------
-            # 9. INCOME PER MONTH
-            # -----------------------------
-            income_per_month_raw = (
-                db.session.query(
-                    extract("month", Transaction.created_date).label("month"),
-                    func.sum(Transaction.amount)
-                )
-                .filter(Transaction.user_id == user_id, Transaction.type == "income")
-                .group_by("month")
-                .order_by("month")
-                .all()
-            )
-
             income_per_month = [
-                {"month": int(month), "amount": float(amount)}
-                for month, amount in income_per_month_raw
+                {"month": month, "amount": float(amount)}
+                for month, amount in sorted(per_month["income"].items())
             ]
 
-            # -----------------------------
-            # 10. EXPENSE PER MONTH
-            # -----------------------------
-            expense_per_month_raw = (
-                db.session.query(
-                    extract("month", Transaction.created_date).label("month"),
-                    func.sum(Transaction.amount)
-                )
-                .filter(Transaction.user_id == user_id, Transaction.type == "expense")
-                .group_by("month")
-                .order_by("month")
-                .all()
-            )
-
             expense_per_month = [
-                {"month": int(month), "amount": float(amount)}
-                for month, amount in expense_per_month_raw
+                {"month": month, "amount": float(amount)}
+                for month, amount in sorted(per_month["expense"].items())
             ]
 
-
             # -----------------------------
             # GROUPED DATA
             # -----------------------------
 
             # GROUPED INCOME + EXPENSE PER MONTH
-            income_dict = {int(m): float(a) for m, a in income_per_month_raw}
-            expense_dict = {int(m): float(a) for m, a in expense_per_month_raw}
+            income_dict = {row["month"]: row["amount"] for row in income_per_month}
+            expense_dict = {row["month"]: row["amount"] for row in expense_per_month}
 
             all_months = sorted(set(income_dict.keys()) | set(expense_dict.keys()))
 
@@ -509,50 +350,235 @@ class SummaryService:
         except Exception as e:
             # Unknown database or logic failure
             raise SummaryDatabaseError(f"An unexpected error occurred: {str(e)}")
-        
+
     # -------------------------------------------------------------------------
 
+    @staticmethod
+    def _dashboard_grouped_rows(user_id: int):
+        """
+        (type, category name, month, count, amount) for every bucket of the user's
+        history. GROUPING SETS is not available on SQLite or MySQL, so the finer
+        grouping is returned once and folded in Python; it has at most
+        types x categories x 12 rows. Category names are joined after grouping.
+        """
+        if current_app.config.get("SUMMARY_USE_ROLLUPS", True):
+            src_type = MonthlyRollup.type
+            src_category = MonthlyRollup.category_id
+            src_month = MonthlyRollup.month
+            count_expr = func.sum(MonthlyRollup.transaction_count)
+            amount_expr = func.sum(MonthlyRollup.total_amount)
+            user_filter = MonthlyRollup.user_id == user_id
+        else:
+            src_type = Transaction.type
+            src_category = Transaction.category_id
+            src_month = extract("month", Transaction.created_date)
+            count_expr = func.count(Transaction.id)
+            amount_expr = func.sum(Transaction.amount)
+            user_filter = Transaction.user_id == user_id
+
+        buckets = (
+            db.session.query(
+                src_type.label("type"),
+                src_category.label("category_id"),
+                src_month.label("month"),
+                count_expr.label("count"),
+                amount_expr.label("amount"),
+            )
+            .filter(user_filter)
+            .group_by(src_type, src_category, src_month)
+            .subquery()
+        )
+
+        return (
+            db.session.query(buckets.c.type, Category.name, buckets.c.month, buckets.c.count, buckets.c.amount)
+            .join(Category, Category.id == buckets.c.category_id)
+            .all()
+        )
+
+    @staticmethod
+    def _dashboard_top_rows(user_id: int, limit: int):
+        """
+        Largest `limit` income and expense transactions in one statement.
+
+        Each branch is an ORDER BY amount DESC LIMIT n that walks the
+        (user_id, type, amount) index and stops early; a ROW_NUMBER() window
+        over the same rows has to rank the user's whole history first.
+        """
+        branches = []
+        for tx_type in ("income", "expense"):
+            branches.append(
+                select(
+                    Transaction.type.label("type"),
+                    Transaction.amount.label("amount"),
+                    Transaction.created_date.label("created_date"),
+                    Transaction.category_id.label("category_id"),
+                )
+                .where(Transaction.user_id == user_id, Transaction.type == tx_type)
+                .order_by(Transaction.amount.desc())
+                .limit(limit)
+                .subquery()
+            )
+
+        top = union_all(*[select(branch) for branch in branches]).subquery()
+
+        rows = (
+            db.session.query(top.c.type, top.c.amount, top.c.created_date, Category.name.label("category"))
+            .join(Category, Category.id == top.c.category_id)
+            .order_by(top.c.type, top.c.amount.desc())
+            .all()
+        )
+
+        return [
+            (
+                row.type,
+                {
+                    "amount": float(row.amount),
+                    "category": row.category,
+                    "date": row.created_date.isoformat(),
+                },
+            )
+            for row in rows
+        ]
+
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _rollup_span(range_start: date, range_end: date):
+        """Month span to read from monthly_rollups, or None to scan transactions."""
+        if not current_app.config.get("SUMMARY_USE_ROLLUPS", True):
+            return None
+        return month_span(range_start, range_end)
+
+    @staticmethod
+    def _rollup_span_filter(span):
+        first, last = span
+        return and_(
+            MonthlyRollup.year.between(first // 12, last // 12),
+            rollup_month_index().between(first, last),
+        )
+
+    @staticmethod
+    def _totals_columns(count_expr, amount_expr, total_expr):
+        income_total = func.sum(case((Category.type == "income", amount_expr), else_=0))
+        expense_total = func.sum(case((Category.type == "expense", amount_expr), else_=0))
+        return (
+            func.sum(case((Category.type == "expense", count_expr), else_=0)).label("expense_transaction_count"),
+            expense_total.label("expense_transaction_total"),
+            func.sum(case((Category.type == "income", count_expr), else_=0)).label("income_transaction_count"),
+            income_total.label("income_transaction_total"),
+            total_expr.label("total_transactions"),
+            (income_total - expense_total).label("net_difference"),
+        )
+
+    @staticmethod
+    def _period_totals(user_id: int, filter_condition, range_start: date, range_end: date,
+                       subcategory: Optional[str] = None):
+        """Income/expense counts and totals, from monthly_rollups when the range is month-aligned."""
+        span = SummaryService._rollup_span(range_start, range_end)
+
+        if span:
+            query = (
+                db.session.query(*SummaryService._totals_columns(
+                    MonthlyRollup.transaction_count,
+                    MonthlyRollup.total_amount,
+                    func.sum(MonthlyRollup.transaction_count),
+                ))
+                .select_from(MonthlyRollup)
+                .join(Category, Category.id == MonthlyRollup.category_id)
+                .filter(MonthlyRollup.user_id == user_id)
+                .filter(SummaryService._rollup_span_filter(span))
+            )
+            if subcategory:
+                query = query.filter(Category.name.ilike(subcategory))
+        else:
+            query = (
+                db.session.query(*SummaryService._totals_columns(
+                    1, Transaction.amount, func.count(Transaction.id)
+                ))
+                .join(Category)
+                .filter(Transaction.user_id == user_id)
+                .filter(filter_condition)
+            )
+
+        return query.first()
+
+    @staticmethod
+    def _category_breakdown(user_id: int, range_start: date, range_end: date,
+                            subcategory: Optional[str] = None):
+        """Totals per (category name, category type) for the range."""
+        span = SummaryService._rollup_span(range_start, range_end)
+
+        if span:
+            query = (
+                db.session.query(
+                    Category.name.label("category_name"),
+                    Category.type.label("category_type"),
+                    func.sum(MonthlyRollup.total_amount).label("total"),
+                )
+                .select_from(MonthlyRollup)
+                .join(Category, Category.id == MonthlyRollup.category_id)
+                .filter(MonthlyRollup.user_id == user_id)
+                .filter(SummaryService._rollup_span_filter(span))
+                .group_by(Category.name, Category.type)
+            )
+        else:
+            query = (
+                db.session.query(
+                    Category.name.label("category_name"),
+                    Category.type.label("category_type"),
+                    func.sum(Transaction.amount).label("total"),
+                )
+                .join(Category)
+                .filter(Transaction.user_id == user_id)
+                .filter(Transaction.created_date >= range_start)
+                .filter(Transaction.created_date < range_end)
+                .group_by(Category.name, Category.type)
+            )
+
+        if subcategory:
+            query = query.filter(Category.name.ilike(subcategory))
+
+        return query.all()
+
     @staticmethod
     def _build_period_filter(period_type: str, start: str, end: str, subcategory: Optional[str] = None):
-        """Builds SQLAlchemy date/month/year filter."""
-        print("Building filter for:", period_type, start, end, subcategory)
+        """
+        Builds the date/month/year filter as a half-open range
+        created_date >= range_start AND created_date < range_end, so the
+        (user_id, created_date, id) index can be range-scanned.
+        Returns (condition, range_start, range_end) with range_end exclusive.
+        """
         try:
-            filters = []
-
             if period_type == "year":
                 start_year = int(start)
                 end_year = int(end)
-                filters.append(extract("year", Transaction.created_date).between(start_year, end_year))
                 range_start = date(start_year, 1, 1)
-                range_end = date(end_year, 12, 31)
+                range_end = date(end_year + 1, 1, 1)
 
             elif period_type == "month":
                 start_year, start_month = map(int, start.split("-"))
                 end_year, end_month = map(int, end.split("-"))
                 range_start = date(start_year, start_month, 1)
-                last_day = calendar.monthrange(end_year, end_month)[1]
-                range_end = date(end_year, end_month, last_day)
-
-                filters.append(
-                    and_(
-                        extract("year", Transaction.created_date).between(start_year, end_year),
-                        extract("month", Transaction.created_date).between(start_month, end_month),
-                    )
-                )
+                range_end = next_month_start(end_year, end_month)
 
             elif period_type == "date":
                 range_start = datetime.strptime(start, "%Y-%m-%d").date()
-                range_end = datetime.strptime(end, "%Y-%m-%d").date()
-                filters.append(Transaction.created_date.between(range_start, range_end))
+                range_end = datetime.strptime(end, "%Y-%m-%d").date() + timedelta(days=1)
 
             else:
                 raise InvalidPeriodTypeError("Invalid period_type supplied.")
 
+            filters = [
+                Transaction.created_date >= range_start,
+                Transaction.created_date < range_end,
+            ]
             if subcategory:
                 filters.append(Category.name.ilike(subcategory))
 
             return and_(*filters), range_start, range_end
 
+        except SummaryError:
+            raise
         except ValueError:
             raise InvalidPeriodTypeError("Invalid date or period format.")
         except Exception as e:
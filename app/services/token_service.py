@@ -0,0 +1,142 @@
+import hashlib
+import secrets
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db, revocation_list
+from app.models.refresh_token import RefreshToken
+from app.models.revoked_token import RevokedToken
+from app.utils.auth_exceptions import TokenExpiredError, TokenInvalidError, TokenRevokedError
+from app.utils.security import create_jwt_token
+
+
+# -----------------------------
+# Revocation store (shared by all processes)
+# -----------------------------
+class DatabaseRevocationStore:
+    """
+    RevocationList store backed by the revoked_tokens table; the cursor is
+    the last row id seen. Ids are assigned at insert, not commit, so a row
+    can become visible after a higher id was already read. Each sync
+    therefore re-reads the `overlap` ids below the cursor too; entries read
+    twice just overwrite themselves in the list.
+    """
+
+    def __init__(self, overlap: int = 1000):
+        self.overlap = overlap
+
+    def add(self, jti: str, expires_at: float):
+        """Idempotent: revoking a jti that is already revoked (e.g. a second logout) is a no-op."""
+        db.session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= time.time()))
+        if db.session.execute(select(RevokedToken.id).where(RevokedToken.jti == jti)).first() is None:
+            db.session.add(RevokedToken(jti=jti, expires_at=int(expires_at)))
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Revoked concurrently by another request; the row we lost to is the same revocation
+            db.session.rollback()
+
+    def since(self, cursor):
+        query = select(RevokedToken.id, RevokedToken.jti, RevokedToken.expires_at).where(
+            RevokedToken.expires_at > time.time()
+        )
+        if cursor is not None:
+            query = query.where(RevokedToken.id > cursor - self.overlap)
+        try:
+            rows = db.session.execute(query.order_by(RevokedToken.id)).all()
+        finally:
+            # Do not leave a transaction open on the request's session
+            db.session.rollback()
+        last_id = max(cursor or 0, rows[-1].id if rows else 0)
+        return [(jti, expires_at) for _, jti, expires_at in rows], last_id
+
+
+# -----------------------------
+# Refresh tokens
+# -----------------------------
+def _hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def issue_token_pair(user_id: int, family_id: str = None) -> dict:
+    """
+    A new access token plus a refresh token in `family_id` (a new family
+    for a fresh login). The refresh row is added to the session; the caller
+    commits.
+    """
+    refresh_token = secrets.token_urlsafe(32)
+    db.session.add(RefreshToken(
+        user_id=user_id,
+        token_hash=_hash_refresh_token(refresh_token),
+        family_id=family_id or uuid.uuid4().hex,
+        expires_at=datetime.utcnow() + timedelta(seconds=current_app.config["REFRESH_TOKEN_EXPIRES"]),
+    ))
+    expires_in = current_app.config["JWT_ACCESS_EXPIRES"]
+    return {
+        "token": create_jwt_token(user_id, expires_in=expires_in),
+        "refresh_token": refresh_token,
+        "expires_in": expires_in,
+    }
+
+
+def revoke_refresh_family(family_id: str):
+    db.session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.utcnow())
+    )
+
+
+def rotate_refresh_token(refresh_token: str) -> dict:
+    """
+    Exchange a refresh token for a new token pair. The old token is marked
+    used with a conditional UPDATE, so of two concurrent refreshes only one
+    succeeds. A token that was already used or revoked is treated as stolen:
+    its whole family is revoked and the user must log in again.
+    """
+    row = RefreshToken.query.filter_by(token_hash=_hash_refresh_token(refresh_token)).first()
+    if row is None:
+        raise TokenInvalidError("Invalid refresh token.")
+
+    now = datetime.utcnow()
+    if row.revoked_at is None and row.used_at is None and row.expires_at <= now:
+        raise TokenExpiredError("Refresh token has expired.")
+
+    claimed = db.session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == row.id, RefreshToken.used_at.is_(None), RefreshToken.revoked_at.is_(None))
+        .values(used_at=now)
+    ).rowcount
+    if claimed != 1:
+        db.session.rollback()
+        revoke_refresh_family(row.family_id)
+        db.session.commit()
+        current_app.logger.warning("[AUTH] Refresh token reuse for user %s; family revoked", row.user_id)
+        raise TokenRevokedError("Refresh token has already been used. Please log in again.")
+
+    tokens = issue_token_pair(row.user_id, row.family_id)
+    db.session.commit()
+    return tokens
+
+
+# -----------------------------
+# Logout
+# -----------------------------
+def revoke_tokens(access_claims: dict = None, refresh_token: str = None, user_id: int = None):
+    """
+    Revoke an access token (by jti, until its exp) and/or the family of a
+    refresh token. A refresh token of another user is ignored.
+    """
+    if access_claims and access_claims.get("jti"):
+        revocation_list.revoke(access_claims["jti"], int(access_claims["exp"]))
+
+    if refresh_token:
+        row = RefreshToken.query.filter_by(token_hash=_hash_refresh_token(refresh_token)).first()
+        if row is not None and (user_id is None or row.user_id == user_id):
+            revoke_refresh_family(row.family_id)
+            db.session.commit()
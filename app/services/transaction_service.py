@@ -8,14 +8,24 @@ from app.schemas.transaction_schemas import (
     TransactionResponseSchema,
 )
 from datetime import datetime as dt_date
-from datetime import datetime
+from datetime import datetime, date
+from sqlalchemy import and_, or_, insert
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from pydantic import ValidationError
+from app.services.rollup_service import apply_rollup_deltas, rollup_deltas_for_rows
+from app.services.cache_service import mark_user_changed
 from app.utils.protected import auth_required
 import json
+import base64
+import hashlib
+from decimal import Decimal
 
 from app.utils.transaction_exceptions import (
     CategoryNotFoundError,
     TransactionNotFoundError,
-    TransactionDatabaseError
+    TransactionDatabaseError,
+    ConcurrentImportError,
+    InvalidCursorError,
 )
 from flask import current_app
 
@@ -23,6 +33,11 @@ from flask import current_app
 # Create Transaction
 # -----------------------------
 
+def default_transaction_date(value, now: datetime = None):
+    """created_date for a transaction submitted without a date: today in UTC."""
+    return value or (now or datetime.utcnow()).date()
+
+
 def create_transaction(user_id: int, transaction_data: TransactionCreateSchema):
     try:
         category = None
@@ -48,7 +63,7 @@ def create_transaction(user_id: int, transaction_data: TransactionCreateSchema):
             category_id=category.id,
             amount=transaction_data.amount,
             description=transaction_data.description,
-            created_date=transaction_data.date or datetime.utcnow().date(),
+            created_date=default_transaction_date(transaction_data.date),
             updated_at=datetime.utcnow(),
             type=transaction_data.type,  # new field added earlier
         )
@@ -75,59 +90,373 @@ def create_transaction(user_id: int, transaction_data: TransactionCreateSchema):
         db.session.rollback()
         raise TransactionDatabaseError(f"Database error: {str(e)}")
 
+# -----------------------------
+# Bulk Create Transactions
+# -----------------------------
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in error.errors()
+    )
+
+
+def _resolve_categories(user_id: int, items: list, category_cache: dict = None):
+    """
+    Resolve the categories referenced by a batch of TransactionCreateSchema items
+    with one lookup query, creating any missing (name, type) pairs in one insert.
+    Pairs already in `category_cache` ((name, type) -> id, shared across the
+    batches of one import) are not looked up again, and new ones are added to it.
+
+    Returns (valid_ids, ids_by_name) where ids_by_name maps (name, type) -> id.
+    """
+    wanted_ids = {i.category_id for i in items if i.category_id}
+    wanted_names = {(i.category_name, i.type) for i in items if not i.category_id and i.category_name}
+    cached = {pair: category_cache[pair] for pair in wanted_names if pair in category_cache} if category_cache else {}
+    wanted_names -= cached.keys()
+
+    def lookup(ids, names):
+        if not ids and not names:
+            return []
+        conditions = []
+        if ids:
+            conditions.append(Category.id.in_(ids))
+        if names:
+            conditions.append(Category.name.in_({name for name, _ in names}))
+        return (
+            db.session.query(Category.id, Category.name, Category.type)
+            .filter(Category.user_id == user_id, or_(*conditions))
+            .all()
+        )
+
+    valid_ids = set()
+    ids_by_name = dict(cached)
+    for cat_id, name, cat_type in lookup(wanted_ids, wanted_names):
+        if cat_id in wanted_ids:
+            valid_ids.add(cat_id)
+        ids_by_name.setdefault((name, cat_type), cat_id)
+
+    missing = [pair for pair in wanted_names if pair not in ids_by_name]
+    if missing:
+        db.session.execute(
+            insert(Category),
+            [{"name": name, "type": cat_type, "user_id": user_id} for name, cat_type in missing],
+        )
+        for cat_id, name, cat_type in lookup(set(), set(missing)):
+            ids_by_name.setdefault((name, cat_type), cat_id)
+
+    if category_cache is not None:
+        category_cache.update(ids_by_name)
+    return valid_ids, ids_by_name
+
+
+def _fingerprint_key(created_date, amount, description, tx_type: str) -> tuple:
+    return (created_date.isoformat(), f"{Decimal(amount):.2f}", " ".join((description or "").lower().split()), tx_type)
+
+
+def transaction_fingerprint(user_id: int, created_date, amount, description, tx_type: str, occurrence: int = 0) -> str:
+    """
+    Import fingerprint: sha256 of (user, date, amount, normalized description,
+    type) plus the occurrence number of that combination within the import,
+    so two identical coffees on one statement stay two transactions while a
+    re-uploaded statement matches the rows it already created.
+    """
+    return _hash_fingerprint(user_id, _fingerprint_key(created_date, amount, description, tx_type), occurrence)
+
+
+def _hash_fingerprint(user_id: int, key: tuple, occurrence: int) -> str:
+    raw = "|".join((str(user_id), *key, str(occurrence)))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _fingerprint_rows(rows: list, occurrences: dict):
+    """Set row["fingerprint"] as transaction_fingerprint does, reusing the key it counts occurrences by."""
+    for row in rows:
+        key = _fingerprint_key(row["created_date"], row["amount"], row["description"], row["type"])
+        occurrence = occurrences.get(key, 0)
+        occurrences[key] = occurrence + 1
+        row["fingerprint"] = _hash_fingerprint(row["user_id"], key, occurrence)
+
+
+def _existing_fingerprints(fingerprints: list) -> set:
+    existing = set()
+    for start in range(0, len(fingerprints), BULK_INSERT_CHUNK_SIZE):
+        chunk = fingerprints[start:start + BULK_INSERT_CHUNK_SIZE]
+        existing.update(
+            fp for (fp,) in db.session.query(Transaction.fingerprint).filter(Transaction.fingerprint.in_(chunk))
+        )
+    return existing
+
+
+def _insert_ignoring_duplicates(dialect_name: str):
+    """INSERT that skips rows whose fingerprint already exists (ON CONFLICT DO NOTHING / INSERT IGNORE)."""
+    table = Transaction.__table__
+    if dialect_name in ("sqlite", "postgresql"):
+        dialect_insert = sqlite.insert if dialect_name == "sqlite" else postgresql.insert
+        return dialect_insert(table).on_conflict_do_nothing(index_elements=["fingerprint"])
+    if dialect_name in ("mysql", "mariadb"):
+        return mysql.insert(table).prefix_with("IGNORE")
+    return insert(table)
+
+
+def bulk_create_transactions(
+    user_id: int, items: list, category_cache: dict = None, occurrences: dict = None, before_commit=None
+):
+    """
+    Create many transactions in a single DB transaction.
+
+    Items may be raw dicts or TransactionCreateSchema instances. Invalid items
+    are reported and skipped; valid rows are inserted with executemany in
+    chunks of BULK_INSERT_CHUNK_SIZE. Returns a per-item result list.
+    Callers importing in several batches can pass one `category_cache` dict
+    to all of them; it is cleared if the batch is rolled back.
+
+    Passing `occurrences` (a dict shared by every batch of one import) turns
+    on deduplication: rows get a transaction_fingerprint, those already in the
+    database are reported as "duplicate" (one IN lookup per chunk), and the
+    insert ignores fingerprint conflicts from concurrent imports.
+
+    before_commit(results), if given, runs inside the same DB transaction just
+    before COMMIT, e.g. to record an import checkpoint atomically with the rows.
+
+    If a concurrent import wrote some of the batch's rows between the
+    fingerprint lookup and the insert, the batch is rolled back and run once
+    more; the lookup then sees those rows and reports them as duplicates. A
+    second conflict raises ConcurrentImportError (409).
+    """
+    try:
+        return _bulk_create_once(user_id, items, category_cache, occurrences, before_commit)
+    except ConcurrentImportError:
+        current_app.logger.info("[TRANSACTION] Concurrent import conflict; retrying the batch once")
+        return _bulk_create_once(user_id, items, category_cache, occurrences, before_commit)
+
+
+def _bulk_create_once(
+    user_id: int, items: list, category_cache: dict = None, occurrences: dict = None, before_commit=None
+):
+    """One attempt of bulk_create_transactions; rolls back and restores the shared dicts on failure."""
+    results = [None] * len(items)
+    valid = []
+
+    for index, item in enumerate(items):
+        try:
+            schema = item if isinstance(item, TransactionCreateSchema) else TransactionCreateSchema(**item)
+        except ValidationError as ve:
+            results[index] = {"index": index, "status": "failed", "error": _format_validation_error(ve)}
+            continue
+        except TypeError:
+            results[index] = {"index": index, "status": "failed", "error": "Item must be a JSON object."}
+            continue
+        valid.append((index, schema))
+
+    seen_before = dict(occurrences) if occurrences is not None else None
+    try:
+        valid_ids, ids_by_name = _resolve_categories(user_id, [s for _, s in valid], category_cache)
+
+        now = datetime.utcnow()
+        rows = []
+        indexes = []
+        for index, schema in valid:
+            if schema.category_id:
+                category_id = schema.category_id if schema.category_id in valid_ids else None
+            else:
+                category_id = ids_by_name.get((schema.category_name, schema.type))
+
+            if category_id is None:
+                results[index] = {"index": index, "status": "failed", "error": "Category not found or provided."}
+                continue
+
+            rows.append({
+                "user_id": user_id,
+                "category_id": category_id,
+                "amount": schema.amount,
+                "description": schema.description,
+                "created_date": default_transaction_date(schema.date, now),
+                "updated_at": now,
+                "type": schema.type,
+            })
+            indexes.append(index)
+            results[index] = {"index": index, "status": "success"}
+
+        connection = db.session.connection()
+        statement = insert(Transaction.__table__)
+        duplicate_count = 0
+        if occurrences is not None:
+            _fingerprint_rows(rows, occurrences)
+            existing = _existing_fingerprints([row["fingerprint"] for row in rows])
+            if existing:
+                for index, row in zip(indexes, rows):
+                    if row["fingerprint"] in existing:
+                        results[index] = {"index": index, "status": "duplicate"}
+                rows = [row for row in rows if row["fingerprint"] not in existing]
+                duplicate_count = len(indexes) - len(rows)
+            statement = _insert_ignoring_duplicates(connection.dialect.name)
+
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            chunk = rows[start:start + BULK_INSERT_CHUNK_SIZE]
+            inserted = connection.execute(statement, chunk).rowcount
+            if occurrences is not None and connection.dialect.supports_sane_multi_rowcount \
+                    and inserted != len(chunk):
+                # A concurrent import inserted some of these rows after our lookup;
+                # roll back so rollups never count rows this batch did not write.
+                raise ConcurrentImportError("Rows were imported concurrently; please retry.")
+
+        # Core inserts bypass the ORM hooks, so rollups and cache versions are updated explicitly
+        apply_rollup_deltas(connection, rollup_deltas_for_rows(rows))
+        mark_user_changed(user_id)
+
+        if before_commit is not None:
+            before_commit(results)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        if category_cache is not None:
+            category_cache.clear()  # may hold ids of categories created in this batch
+        if occurrences is not None:
+            occurrences.clear()
+            occurrences.update(seen_before)
+        current_app.logger.error(f"[TRANSACTION] Bulk create error: {str(e)}")
+        if isinstance(e, TransactionDatabaseError):
+            raise
+        raise TransactionDatabaseError("Failed to create transactions in bulk.")
+
+    success_count = len(rows)
+    return {
+        "success_count": success_count,
+        "failed_count": len(items) - success_count - duplicate_count,
+        "duplicate_count": duplicate_count,
+        "results": results,
+    }
+
+
+# -----------------------------
+# Cursor helpers (keyset pagination)
+# -----------------------------
+def encode_cursor(created_date, transaction_id: int) -> str:
+    """Encode the (created_date, id) of the last row on a page into an opaque token."""
+    raw = json.dumps([created_date.isoformat(), transaction_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """Decode a token produced by encode_cursor() back into (created_date, id)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created, transaction_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return date.fromisoformat(created), int(transaction_id)
+    except Exception:
+        raise InvalidCursorError("Invalid pagination cursor.")
+
+
 # -----------------------------
 # Get All Transactions (with filters)
 # -----------------------------
+def _filtered_transactions_query(user_id: int, filters: dict):
+    query = Transaction.query.filter_by(user_id=user_id)
+
+    if filters.get("type"):
+        query = query.filter_by(type=filters["type"])
+    if filters.get("category"):
+        query = query.join(Category).filter(Category.name == filters["category"])
+    if filters.get("start_date"):
+        query = query.filter(Transaction.created_date >= filters["start_date"])
+    if filters.get("end_date"):
+        query = query.filter(Transaction.created_date <= filters["end_date"])
+
+    return query
+
+
+def _transaction_to_dict(t):
+    model = TransactionResponseSchema(
+        id=t.id,
+        amount=round(float(t.amount), 2),
+        type=t.type,
+        category=t.category.name,
+        description=t.description,
+        date=(
+        t.created_date.strftime("%Y-%m-%d")
+        if isinstance(t.created_date, (dt_date, datetime))
+        else str(t.created_date)
+        ),
+        user_id=t.user_id,
+    )
+    return json.loads(model.model_dump_json())
+
+
 def get_transactions(user_id: int, filters: dict):
+    """
+    List a user's transactions, newest first.
 
+    Two pagination modes are supported:
+      * offset mode (default) – ``page`` / ``per_page``, returns page counts.
+      * cursor mode – enabled when ``cursor`` is present in the filters
+        (an empty cursor requests the first page). Uses a keyset predicate on
+        (created_date, id) so deep pages cost the same as the first one.
+    """
     try:
-        query = Transaction.query.filter_by(user_id=user_id)
+        query = _filtered_transactions_query(user_id, filters)
 
-        if filters.get("type"):
-            query = query.filter_by(type=filters["type"])
-        if filters.get("category"):
-            query = query.join(Category).filter(Category.name == filters["category"])
-        if filters.get("start_date"):
-            query = query.filter(Transaction.created_date >= filters["start_date"])
-        if filters.get("end_date"):
-            query = query.filter(Transaction.created_date <= filters["end_date"])
+        if "cursor" in filters:
+            return _get_transactions_by_cursor(query, filters)
 
         page = int(filters.get("page", 1))
         per_page = int(filters.get("per_page", 10))
-        pagination = query.order_by(Transaction.created_date.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
-
-        result_models = [
-            TransactionResponseSchema(
-                id=t.id,
-                amount=round(float(t.amount), 2),
-                type=t.type,
-                category=t.category.name,
-                description=t.description,
-                date=(
-                t.created_date.strftime("%Y-%m-%d")
-                if isinstance(t.created_date, (dt_date, datetime))
-                else str(t.created_date)
-                ),
-                user_id=t.user_id,
-            )
-            for t in pagination.items
-        ]
+        pagination = query.order_by(
+            Transaction.created_date.desc(), Transaction.id.desc()
+        ).paginate(page=page, per_page=per_page, error_out=False)
 
         response = {
             "page": pagination.page,
             "per_page": pagination.per_page,
             "total_pages": pagination.pages,
             "total_items": pagination.total,
-            "transactions": [
-                json.loads(m.model_dump_json()) for m in result_models
-            ],
+            "transactions": [_transaction_to_dict(t) for t in pagination.items],
         }
 
         return response
+    except InvalidCursorError:
+        raise
     except Exception as e:
         raise TransactionDatabaseError(f"Database error: {str(e)}")
+
+
+def _get_transactions_by_cursor(query, filters: dict):
+    per_page = int(filters.get("per_page", 10))
+
+    # COUNT(*) is only paid for when the client explicitly asks for it
+    total_items = query.order_by(None).count() if filters.get("include_total") else None
+
+    if filters.get("cursor"):
+        last_date, last_id = decode_cursor(filters["cursor"])
+        query = query.filter(
+            or_(
+                Transaction.created_date < last_date,
+                and_(Transaction.created_date == last_date, Transaction.id < last_id),
+            )
+        )
+
+    # Fetch one extra row to know whether another page exists
+    rows = (
+        query.order_by(Transaction.created_date.desc(), Transaction.id.desc())
+        .limit(per_page + 1)
+        .all()
+    )
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    response = {
+        "per_page": per_page,
+        "next_cursor": encode_cursor(rows[-1].created_date, rows[-1].id) if has_more else None,
+        "has_more": has_more,
+        "transactions": [_transaction_to_dict(t) for t in rows],
+    }
+    if total_items is not None:
+        response["total_items"] = total_items
+
+    return response
+
+
 # -----------------------------
 # Get Transaction by ID
 # -----------------------------
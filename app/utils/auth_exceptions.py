@@ -41,4 +41,14 @@ class TokenInvalidError(AuthBaseError):
 
 class TokenInvalidFormatError(AuthBaseError):
     """Raised when Authorization header format is invalid."""
-    pass
\ No newline at end of file
+    pass
+
+
+class PasswordHashingBusyError(AuthBaseError):
+    """Raised when the password hashing pool is saturated."""
+    pass
+
+
+class TokenRevokedError(AuthBaseError):
+    """Raised when an access or refresh token has been revoked (logout or refresh token reuse)."""
+    pass
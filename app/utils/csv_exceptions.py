@@ -0,0 +1,28 @@
+class CSVImportError(Exception):
+    """Base exception for CSV import errors."""
+    pass
+
+
+class CSVFileTooLargeError(CSVImportError):
+    """Raised when an uploaded CSV exceeds CSV_IMPORT_MAX_BYTES."""
+    pass
+
+
+class CSVEncodingError(CSVImportError):
+    """Raised when an uploaded CSV is not valid UTF-8 text."""
+    pass
+
+
+class CSVImportSessionNotFoundError(CSVImportError):
+    """Raised when an import session id is unknown or owned by another user."""
+    pass
+
+
+class CSVImportSessionStateError(CSVImportError):
+    """Raised when an import session is resumed while running or after it completed."""
+    pass
+
+
+class UnsupportedImportFormatError(CSVImportError):
+    """Raised when an upload's format has no registered importer, or the option used does not support it."""
+    pass
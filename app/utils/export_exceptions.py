@@ -22,3 +22,17 @@ class CSVGenerationError(ExportError):
     """Raised when CSV generation fails."""
     pass
 
+
+class UnsupportedExportFormatError(ExportError):
+    """Raised when an export is requested in a format we do not produce."""
+    pass
+
+
+class ColumnarExportUnavailableError(UnsupportedExportFormatError):
+    """Raised when Parquet/Arrow export is requested but pyarrow is not installed."""
+    pass
+
+
+class RenderTimeoutError(PDFGenerationError):
+    """Raised when a report does not render within PDF_RENDER_TIMEOUT."""
+    pass
@@ -0,0 +1,66 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from app.utils.auth_exceptions import PasswordHashingBusyError
+
+
+class HashPool:
+    """
+    Runs bcrypt hashing and checks on a small thread pool (bcrypt releases
+    the GIL), so a login burst uses at most PASSWORD_HASH_WORKERS cores and
+    the rest of the API keeps its threads. At most PASSWORD_HASH_MAX_PENDING
+    calls may wait for a worker; beyond that, or after waiting
+    PASSWORD_HASH_TIMEOUT seconds, PasswordHashingBusyError is raised at
+    once instead of letting requests pile up. Before init_app, calls run in
+    the calling thread.
+    """
+
+    def __init__(self, app=None):
+        self.rounds = 12
+        self._slots = None
+        self._executor = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.rounds = int(app.config.get("BCRYPT_ROUNDS", 12))
+        self.workers = int(app.config.get("PASSWORD_HASH_WORKERS", 2))
+        self.max_pending = int(app.config.get("PASSWORD_HASH_MAX_PENDING", 16))
+        self.timeout = float(app.config.get("PASSWORD_HASH_TIMEOUT", 5))
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_pending)
+        app.extensions["hash_pool"] = self
+
+    def _get_executor(self):
+        # Created on first use so no threads exist before a pre-fork server forks
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="budgetwise-hash")
+            return self._executor
+
+    def run(self, func, *args):
+        slots = self._slots
+        if slots is None:
+            return func(*args)
+        if not slots.acquire(blocking=False):
+            raise PasswordHashingBusyError("Too many sign-ins in progress. Please retry shortly.")
+
+        try:
+            future = self._get_executor().submit(func, *args)
+        except BaseException:
+            slots.release()
+            raise
+        # Released when the call finishes (or is cancelled), not when the caller gives up
+        future.add_done_callback(lambda _: slots.release())
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise PasswordHashingBusyError("Password check did not start in time. Please retry shortly.")
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,18 @@
+class JobError(Exception):
+    """Base exception for background job errors."""
+    pass
+
+
+class JobNotFoundError(JobError):
+    """Raised when a job id is unknown, expired, or owned by another user."""
+    pass
+
+
+class JobNotReadyError(JobError):
+    """Raised when a job's result is requested before it has finished."""
+    pass
+
+
+class JobQueueFullError(JobError):
+    """Raised when the bounded job queue cannot accept more work."""
+    pass
@@ -0,0 +1,151 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from app.utils.job_exceptions import JobNotFoundError, JobQueueFullError
+
+
+class Job:
+    """A unit of background work owned by one user."""
+
+    def __init__(self, user_id: int, kind: str, job_id: str = None):
+        self.id = job_id or uuid.uuid4().hex
+        self.user_id = user_id
+        self.kind = kind
+        self.status = "queued"
+        self.progress = {}
+        self.result = None
+        self.error = None
+        self.artifact = None  # (path, mimetype, download_name) for file-producing jobs
+        self.created_at = time.time()
+        self.finished_at = None
+        self.expires_at = None
+        self._future = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("finished", "failed")
+
+    def wait(self, timeout=None):
+        """Block until the job has run (used by tests and CLI callers)."""
+        if self._future is not None:
+            self._future.result(timeout=timeout)
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": dict(self.progress),
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "expires_at": self.expires_at,
+        }
+
+
+class JobQueue:
+    """
+    Bounded background job runner. Jobs run on a fixed-size thread pool inside
+    an app context; at most JOB_MAX_PENDING may be queued or running at once.
+    Finished jobs, and any artifact file they wrote, are dropped JOB_RESULT_TTL
+    seconds after completion.
+    """
+
+    def __init__(self, app=None):
+        self.jobs = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.workers = int(app.config.get("JOB_WORKERS", 2))
+        self.max_pending = int(app.config.get("JOB_MAX_PENDING", 20))
+        self.ttl = int(app.config.get("JOB_RESULT_TTL", 3600))
+        self.artifact_dir = app.config.get("JOB_ARTIFACT_DIR") or os.path.join(
+            tempfile.gettempdir(), "budgetwise-jobs"
+        )
+        app.extensions["job_queue"] = self
+
+    def _get_executor(self):
+        # Created on first use so no threads exist before a pre-fork server forks
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="budgetwise-job")
+        return self._executor
+
+    # ---- submission
+
+    def submit(self, app, user_id: int, kind: str, func, *args, job_id: str = None, **kwargs) -> Job:
+        """
+        Queue func(job, *args, **kwargs); its return value becomes job.result.
+        job_id pre-allocates the job's id, e.g. one already recorded as the
+        owner of a DB row.
+        """
+        self.purge_expired()
+        with self._lock:
+            pending = sum(1 for job in self.jobs.values() if not job.done)
+            if pending >= self.max_pending:
+                raise JobQueueFullError("Too many background jobs in progress. Please retry shortly.")
+            job = Job(user_id, kind, job_id)
+            self.jobs[job.id] = job
+            job._future = self._get_executor().submit(self._run, app, job, func, args, kwargs)
+        return job
+
+    def _run(self, app, job, func, args, kwargs):
+        with app.app_context():
+            job.status = "running"
+            try:
+                job.result = func(job, *args, **kwargs)
+                job.status = "finished"
+            except Exception as e:
+                job.error = str(e) or e.__class__.__name__
+                job.status = "failed"
+                app.logger.exception("Background job %s (%s) failed", job.id, job.kind)
+            finally:
+                job.finished_at = time.time()
+                job.expires_at = job.finished_at + self.ttl
+
+    # ---- lookup
+
+    def get(self, job_id: str, user_id: int) -> Job:
+        self.purge_expired()
+        job = self.jobs.get(job_id)
+        if job is None or job.user_id != user_id:
+            raise JobNotFoundError("Job not found or expired.")
+        return job
+
+    def artifact_path(self, job: Job, extension: str) -> str:
+        os.makedirs(self.artifact_dir, exist_ok=True)
+        return os.path.join(self.artifact_dir, f"{job.id}.{extension}")
+
+    # ---- expiry
+
+    def purge_expired(self, now=None):
+        now = now or time.time()
+        with self._lock:
+            expired = [job for job in self.jobs.values() if job.expires_at and job.expires_at <= now]
+            for job in expired:
+                del self.jobs[job.id]
+        for job in expired:
+            if job.artifact:
+                try:
+                    os.remove(job.artifact[0])
+                except FileNotFoundError:
+                    pass
+
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def clear(self):
+        """Forget every job and remove the artifact directory."""
+        with self._lock:
+            self.jobs.clear()
+        shutil.rmtree(self.artifact_dir, ignore_errors=True)
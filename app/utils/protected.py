@@ -1,5 +1,6 @@
 from functools import wraps
 from flask import request, jsonify, current_app
+from app.extensions import revocation_list, token_cache
 from app.utils.security import decode_jwt_token
 import jwt
 from app.utils.auth_exceptions import (
@@ -7,8 +8,39 @@ from app.utils.auth_exceptions import (
     TokenExpiredError,
     TokenInvalidError,
     TokenInvalidFormatError,
+    TokenRevokedError,
 )
 
+
+def _verify_token(token: str) -> dict:
+    """Full HS256 verification; only runs when the token is not in token_cache."""
+    try:
+        current_app.logger.debug("[JWT] About to decode token")
+        decoded_payload = decode_jwt_token(token)
+        user_id = decoded_payload.get("sub")
+
+        if not user_id:
+            current_app.logger.warning("[AUTH] Token decoded but no 'sub' (user ID) found.")
+            raise TokenInvalidError("Token payload invalid — missing 'sub'.")
+
+        # Rejects a non-numeric sub before the claims are cached
+        int(user_id)
+
+    except (TokenExpiredError, jwt.ExpiredSignatureError):
+        current_app.logger.warning("[AUTH] Token has expired.")
+        raise TokenExpiredError("Token has expired.")
+    except TokenInvalidError:
+        raise
+    except jwt.InvalidTokenError:
+        raise TokenInvalidError("Invalid token.")
+    except Exception as e:
+        current_app.logger.error("[AUTH] Unexpected error: %s", e)
+        raise TokenInvalidError(str(e))
+
+    token_cache.put(token, decoded_payload)
+    return decoded_payload
+
+
 def auth_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -16,39 +48,23 @@ def auth_required(f):
         if not auth_header:
             current_app.logger.warning("[AUTH] Missing Authorization header.")
             raise TokenMissingError("Authorization header is missing.")
-        
- 
-            # Extract Bearer token
+
+        # Extract Bearer token
         parts = auth_header.split(" ")
         if len(parts) != 2 or parts[0].lower() != "bearer":
-                
             return jsonify({"message": "Invalid Authorization header format"}), 401
 
         token = parts[1]
-           
-        try:
-            # Decode and verify token
-            current_app.logger.debug("[JWT] About to decode token")
-            decoded_payload = decode_jwt_token(token)
-            user_id = decoded_payload.get("sub")
-            
-            if not user_id:
-                current_app.logger.warning("[AUTH] Token decoded but no 'sub' (user ID) found.")
-                return TokenInvalidError("Token payload invalid — missing 'sub'.")
-                
-            # Convert string user_id back to integer
-            request.user_id = int(user_id)
- 
-            current_app.logger.debug(f"[AUTH] Authenticated user ID: {user_id}")
-
-        except jwt.ExpiredSignatureError:
-            current_app.logger.warning("[AUTH] Token has expired.")
-            raise TokenExpiredError("Token has expired.")
-        except jwt.InvalidTokenError:
-            raise TokenInvalidError("Invalid token.")
-        except Exception as e:
-            current_app.logger.error(f"[AUTH] Unexpected error: {e}")
-            raise TokenInvalidError(str(e))
+        # A dashboard page sends the same token with every call; verify it once
+        claims = token_cache.get(token) or _verify_token(token)
+        # In-memory lookup, synced from the shared store every few seconds
+        if revocation_list.is_revoked(claims.get("jti")):
+            raise TokenRevokedError("Token has been revoked.")
+
+        # Convert string user_id back to integer
+        request.user_id = int(claims["sub"])
+        request.token_claims = claims
+        current_app.logger.debug("[AUTH] Authenticated user ID: %s", request.user_id)
 
         # Proceed to the protected route
         return f(*args, **kwargs)
@@ -0,0 +1,61 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from app.utils.export_exceptions import RenderTimeoutError
+
+
+class RenderPool:
+    """
+    Runs CPU-bound render functions (reportlab layout) in worker processes so
+    they do not hold the web process's GIL. Functions and arguments must be
+    picklable. With PDF_RENDER_MODE='inline' (the testing default) they run
+    in the calling thread instead.
+    """
+
+    def __init__(self, app=None):
+        self.mode = "inline"
+        self._executor = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.mode = (app.config.get("PDF_RENDER_MODE") or "inline").lower()
+        self.workers = int(app.config.get("PDF_RENDER_WORKERS", 2))
+        self.timeout = float(app.config.get("PDF_RENDER_TIMEOUT", 60))
+        app.extensions["render_pool"] = self
+
+    def _get_executor(self):
+        # Created on first use so no processes exist before a pre-fork server forks.
+        # 'spawn' keeps workers from inheriting the web process's threads and DB connections.
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def run(self, func, *args, **kwargs):
+        if self.mode != "process":
+            return func(*args, **kwargs)
+
+        future = self._get_executor().submit(func, *args, **kwargs)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # A task that already started cannot be interrupted; it finishes in the
+            # background and its worker is then reused.
+            future.cancel()
+            raise RenderTimeoutError(f"Rendering did not finish within {self.timeout:g}s.")
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); start a fresh pool for the next call
+            self.shutdown(wait=False)
+            raise
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
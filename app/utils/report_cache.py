@@ -0,0 +1,228 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+
+# --------------------------
+# Stores
+# --------------------------
+
+class DiskReportStore:
+    """
+    Report files named by cache key in one directory, evicted least recently
+    used once their total size exceeds max_bytes. Entries older than ttl
+    seconds are treated as misses.
+
+    Several processes may share the directory. Each keeps its own index, so
+    every rescan_interval seconds a write rebuilds the index from a scan of
+    the directory (recency = file mtime, refreshed on every hit). max_bytes
+    then bounds the directory as a whole, not each process's share of it.
+
+    Any object with the same get / put / put_file / put_stream / clear methods can be
+    passed to ReportCache.init_app instead.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 2**20, ttl: int = 300, rescan_interval: float = 30):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.rescan_interval = rescan_interval
+        self._index = OrderedDict()  # key -> (size, stored_at)
+        self._total = 0
+        self._scanned_at = 0.0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            self._scan()
+            self._evict()
+
+    def _scan(self):
+        """
+        Rebuild the index from the directory, least recently used (oldest
+        mtime) first, picking up files written by other processes and by
+        earlier runs. Caller holds the lock.
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith("."):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            if entry.is_file():
+                entries.append((stat.st_mtime, entry.name, stat.st_size))
+        self._index = OrderedDict()
+        self._total = 0
+        for mtime, name, size in sorted(entries):
+            self._index[name] = (size, mtime)
+            self._total += size
+        self._scanned_at = time.monotonic()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str):
+        """Path of the cached report, or None."""
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            if entry[1] + self.ttl <= time.time():
+                self._remove(key)
+                return None
+            path = self._path(key)
+            try:
+                # Recency for other processes' scans; keeps the original stored_at for the ttl
+                os.utime(path)
+            except FileNotFoundError:
+                # Evicted by another process sharing the directory
+                self._total -= self._index.pop(key)[0]
+                return None
+            self._index.move_to_end(key)
+            return path
+
+    def put(self, key: str, data: bytes) -> str:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return self._commit(key, tmp_path, len(data))
+
+    def put_file(self, key: str, fileobj) -> str:
+        """Copy a binary file object (e.g. a SpooledTemporaryFile) into the store."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            fileobj.seek(0)
+            shutil.copyfileobj(fileobj, f)
+            size = f.tell()
+        return self._commit(key, tmp_path, size)
+
+    def put_stream(self, key: str, chunks):
+        """
+        Yield `chunks` unchanged while copying them to the store. The entry is
+        only committed once the stream is exhausted, so an aborted download
+        never leaves a truncated report behind.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+                    f.write(data)
+                    size += len(data)
+                    yield chunk
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self._commit(key, tmp_path, size)
+
+    def _commit(self, key: str, tmp_path: str, size: int) -> str:
+        path = self._path(key)
+        os.replace(tmp_path, path)
+        with self._lock:
+            if time.monotonic() - self._scanned_at >= self.rescan_interval:
+                self._scan()
+            if key in self._index:
+                self._total -= self._index[key][0]
+            self._index[key] = (size, time.time())
+            self._index.move_to_end(key)
+            self._total += size
+            self._evict(keep=key)
+        return path
+
+    def _evict(self, keep=None):
+        while self._total > self.max_bytes and self._index:
+            key = next(iter(self._index))
+            if key == keep:
+                break
+            self._remove(key)
+
+    def _remove(self, key: str):
+        size, _ = self._index.pop(key)
+        self._total -= size
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+
+
+# --------------------------
+# Cache facade
+# --------------------------
+
+class ReportCache:
+    """
+    Caches rendered export files keyed by (user_id, data version, format,
+    start_date, end_date, type). The data version comes from the result cache,
+    so any committed write for the user moves their reports to a new key. The
+    key doubles as the HTTP ETag.
+
+    Process-local (lru) versions miss writes committed by other workers, so
+    without a shared version store files are kept no longer than
+    CACHE_LOCAL_TTL, the same staleness bound as cached summaries.
+    """
+
+    def __init__(self, app=None):
+        self.store = None
+        self.versions = None
+        self.epoch = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app, store=None):
+        self.versions = app.extensions["result_cache"]
+        # Process-local versions restart at 0 with every backend, so keys also
+        # carry an epoch to keep a surviving cache directory from matching new data.
+        self.epoch = uuid.uuid4().hex
+        if store is None and app.config.get("REPORT_CACHE_ENABLED", True):
+            ttl = int(app.config.get("REPORT_CACHE_TTL", 300))
+            if not self.versions.versions_shared:
+                ttl = min(ttl, int(app.config.get("CACHE_LOCAL_TTL", 15)))
+            store = DiskReportStore(
+                app.config.get("REPORT_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "budgetwise-reports"),
+                max_bytes=int(app.config.get("REPORT_CACHE_MAX_BYTES", 256 * 2**20)),
+                ttl=ttl,
+            )
+        self.store = store
+        app.extensions["report_cache"] = self
+
+    @staticmethod
+    def make_key(user_id: int, version, fmt: str, start_date, end_date, type: str) -> str:
+        raw = f"{user_id}|{version}|{fmt}|{start_date}|{end_date}|{type}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def key_for(self, user_id: int, fmt: str, start_date, end_date, type: str):
+        """Cache key for this report, or None when caching is off or data versions are not tracked."""
+        if self.store is None or not self.versions.enabled:
+            return None
+        version = self.versions.get_version(user_id)
+        if not self.versions.versions_shared:
+            version = f"{self.epoch}:{version}"
+        return self.make_key(user_id, version, fmt, start_date, end_date, type)
+
+    def get(self, key: str):
+        return self.store.get(key)
+
+    def put(self, key: str, data: bytes) -> str:
+        return self.store.put(key, data)
+
+    def put_file(self, key: str, fileobj) -> str:
+        return self.store.put_file(key, fileobj)
+
+    def put_stream(self, key: str, chunks):
+        return self.store.put_stream(key, chunks)
+
+    def clear(self):
+        if self.store is not None:
+            self.store.clear()
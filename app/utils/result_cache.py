@@ -0,0 +1,220 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+# --------------------------
+# Backends
+# --------------------------
+
+class LRUCacheBackend:
+    """
+    In-process, thread-safe LRU store with per-entry TTL. A write bumps the
+    version only in the process that committed it, so other workers keep
+    serving their entries until the TTL (CACHE_LOCAL_TTL) runs out.
+    """
+
+    # Versions live in this process only and restart at 0
+    shared = False
+
+    def __init__(self, max_entries: int = 1024, ttl: int = 300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_version(self, user_id: int) -> int:
+        with self._lock:
+            return self._versions.get(user_id, 0)
+
+    def bump_version(self, user_id: int) -> int:
+        with self._lock:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            return self._versions[user_id]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+
+class RedisCacheBackend:
+    """
+    Shared store for any client speaking the Redis protocol (redis-py or a fake).
+    Values are JSON encoded; Decimals and dates are stored as strings, matching
+    what Flask's JSON provider sends to clients anyway.
+    """
+
+    shared = True
+
+    def __init__(self, client, ttl: int = 300, prefix: str = "budgetwise:cache"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _version_key(self, user_id: int) -> str:
+        return f"{self.prefix}:version:{user_id}"
+
+    def get(self, key):
+        raw = self.client.get(f"{self.prefix}:{key}")
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, value):
+        self.client.set(f"{self.prefix}:{key}", json.dumps(value, default=str), ex=self.ttl)
+
+    def get_version(self, user_id: int) -> int:
+        key = self._version_key(user_id)
+        raw = self.client.get(key)
+        if raw is None:
+            # Seed with a timestamp rather than 0 so an evicted version key can never
+            # point back at entries written under an older counter value.
+            self.client.set(key, time.time_ns(), nx=True)
+            raw = self.client.get(key)
+        return int(raw)
+
+    def bump_version(self, user_id: int) -> int:
+        self.get_version(user_id)
+        return int(self.client.incr(self._version_key(user_id)))
+
+    def clear(self):
+        for key in self.client.scan_iter(f"{self.prefix}:*"):
+            self.client.delete(key)
+
+
+# --------------------------
+# Cache facade
+# --------------------------
+
+class ResultCache:
+    """
+    Caches per-user read results keyed by (user_id, endpoint, normalized params)
+    and the user's data version. Writers bump the version, so entries computed
+    before a write are simply never looked up again.
+    """
+
+    def __init__(self, app=None):
+        self.backend = None
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app, backend=None):
+        if backend is None:
+            backend = self._backend_from_config(app.config)
+        self.backend = backend
+        self.reset_stats()
+        app.extensions["result_cache"] = self
+
+    @staticmethod
+    def _backend_from_config(config):
+        kind = (config.get("CACHE_BACKEND") or "lru").lower()
+        ttl = int(config.get("CACHE_TTL", 300))
+
+        if kind == "none":
+            return None
+        if kind == "redis":
+            try:
+                import redis
+            except ImportError:
+                raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package.")
+            client = redis.Redis.from_url(config.get("CACHE_REDIS_URL", "redis://localhost:6379/0"))
+            return RedisCacheBackend(client, ttl=ttl)
+        return LRUCacheBackend(
+            max_entries=int(config.get("CACHE_MAX_ENTRIES", 1024)),
+            ttl=min(ttl, int(config.get("CACHE_LOCAL_TTL", 15))),
+        )
+
+    # ---- versions
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    @property
+    def versions_shared(self) -> bool:
+        """True when versions are visible to every process (and survive restarts)."""
+        return bool(self.backend and self.backend.shared)
+
+    def get_version(self, user_id: int) -> int:
+        return self.backend.get_version(user_id) if self.backend else 0
+
+    def bump_version(self, user_id: int):
+        if self.backend:
+            self.backend.bump_version(user_id)
+
+    def clear(self):
+        if self.backend:
+            self.backend.clear()
+
+    # ---- lookups
+
+    @staticmethod
+    def make_key(user_id: int, version: int, endpoint: str, params: dict) -> str:
+        normalized = json.dumps(params or {}, sort_keys=True, default=str, separators=(",", ":"))
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+        return f"{user_id}:{version}:{endpoint}:{digest}"
+
+    def get_or_compute(self, user_id: int, endpoint: str, params: dict, compute):
+        """Return the cached result for this call, computing and storing it on a miss."""
+        if not self.backend:
+            return compute()
+
+        key = self.make_key(user_id, self.get_version(user_id), endpoint, params)
+        cached = self.backend.get(key)
+        if cached is not None:
+            self._record(endpoint, "hits")
+            return cached
+
+        self._record(endpoint, "misses")
+        result = compute()
+        self.backend.set(key, result)
+        return result
+
+    # ---- metrics
+
+    def _record(self, endpoint: str, outcome: str):
+        with self._stats_lock:
+            counters = self._stats.setdefault(endpoint, {"hits": 0, "misses": 0})
+            counters[outcome] += 1
+
+    def stats(self) -> dict:
+        """Hit / miss counters of this process since init_app, overall and per endpoint (see GET /api/health)."""
+        with self._stats_lock:
+            per_endpoint = {name: dict(c) for name, c in self._stats.items()}
+        hits = sum(c["hits"] for c in per_endpoint.values())
+        misses = sum(c["misses"] for c in per_endpoint.values())
+        return {
+            "backend": type(self.backend).__name__ if self.backend else None,
+            "versions_shared": self.versions_shared,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "endpoints": per_endpoint,
+        }
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats = {}
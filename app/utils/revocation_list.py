@@ -0,0 +1,105 @@
+import threading
+import time
+
+from flask import current_app
+
+
+# --------------------------
+# Stores
+# --------------------------
+
+class MemoryRevocationStore:
+    """
+    Process-local store for tests and single-process deployments. Any object
+    with the same add / since methods (e.g. token_service.DatabaseRevocationStore)
+    can be passed to RevocationList.init_app instead.
+    """
+
+    def __init__(self):
+        self._entries = []  # (jti, expires_at) in revocation order
+        self._lock = threading.Lock()
+
+    def add(self, jti: str, expires_at: float):
+        with self._lock:
+            self._entries.append((jti, expires_at))
+
+    def since(self, cursor):
+        """Entries revoked after `cursor` (None = all) and the cursor to pass next time."""
+        with self._lock:
+            start = cursor or 0
+            return self._entries[start:], len(self._entries)
+
+
+# --------------------------
+# In-memory list
+# --------------------------
+
+class RevocationList:
+    """
+    Revoked access-token ids (jti -> exp) held in a dict in each process, so
+    auth_required checks revocation with one lookup and no DB round trip.
+    The dict is synced from the shared store at most every
+    TOKEN_REVOCATION_SYNC_SECONDS, reading only entries added since the last
+    sync. Revocations made by this process apply at once; those made by other
+    processes within the sync interval. Expired entries are dropped on sync.
+    """
+
+    def __init__(self, app=None):
+        self.store = None
+        self.sync_interval = 5.0
+        self._revoked = {}
+        self._cursor = None
+        self._synced_at = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app, store=None):
+        self.sync_interval = float(app.config.get("TOKEN_REVOCATION_SYNC_SECONDS", 5))
+        if store is None:
+            if (app.config.get("TOKEN_REVOCATION_STORE") or "db").lower() == "memory":
+                store = MemoryRevocationStore()
+            else:
+                # Imported here: the store needs the models, which need app.extensions
+                from app.services.token_service import DatabaseRevocationStore
+                store = DatabaseRevocationStore()
+        self.store = store
+        with self._lock:
+            self._revoked = {}
+            self._cursor = None
+            self._synced_at = None
+        app.extensions["revocation_list"] = self
+
+    def revoke(self, jti: str, expires_at: float):
+        self.store.add(jti, expires_at)
+        with self._lock:
+            self._revoked[jti] = expires_at
+
+    def is_revoked(self, jti: str, now: float = None) -> bool:
+        if not jti:
+            return False
+        if self._synced_at is None or time.monotonic() - self._synced_at >= self.sync_interval:
+            try:
+                self.sync(now)
+            except Exception:
+                current_app.logger.exception("[AUTH] Revocation list sync failed; using the previous list")
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > (now or time.time())
+
+    def sync(self, now: float = None):
+        """Copy entries added to the store since the last sync; keep serving the old set if it fails."""
+        now = now or time.time()
+        with self._lock:
+            try:
+                entries, cursor = self.store.since(self._cursor)
+            except Exception:
+                self._synced_at = time.monotonic()
+                raise
+            revoked = {jti: expires_at for jti, expires_at in self._revoked.items() if expires_at > now}
+            revoked.update((jti, expires_at) for jti, expires_at in entries if expires_at > now)
+            self._revoked = revoked
+            self._cursor = cursor
+            self._synced_at = time.monotonic()
+
+    def __len__(self):
+        return len(self._revoked)
@@ -1,5 +1,6 @@
 import bcrypt
 import jwt
+import uuid
 from datetime import datetime, timedelta
 from flask import current_app
 from app.utils.auth_exceptions import SecretKeyMissingError, TokenInvalidError, TokenExpiredError
@@ -9,9 +10,9 @@ from app.utils.auth_exceptions import SecretKeyMissingError, TokenInvalidError,
 # Password Hashing Utilities
 # --------------------------
 
-def hash_password(password: str) -> str:
-    """Hash a plaintext password using bcrypt."""
-    salt = bcrypt.gensalt()
+def hash_password(password: str, rounds: int = 12) -> str:
+    """Hash a plaintext password using bcrypt with the given cost."""
+    salt = bcrypt.gensalt(rounds)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
@@ -21,6 +22,14 @@ def verify_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
 
 
+def password_needs_rehash(hashed: str, rounds: int) -> bool:
+    """True when a bcrypt hash ("$2b$<cost>$...") was made with a different cost."""
+    parts = hashed.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return False
+    return int(parts[2]) != rounds
+
+
 # --------------------------
 # JWT Token Utilities
 # --------------------------
@@ -30,7 +39,8 @@ def create_jwt_token(user_id: int, expires_in: int = 3600) -> str:
     payload = {
         "exp": datetime.utcnow() + timedelta(seconds=expires_in),
         "iat": datetime.utcnow(),
-        "sub": str(user_id)  # Convert user_id to string for JWT compatibility
+        "sub": str(user_id),  # Convert user_id to string for JWT compatibility
+        "jti": uuid.uuid4().hex  # lets logout revoke this token before it expires
     }
 
     secret = current_app.config.get("SECRET_KEY")
@@ -39,7 +49,7 @@ def create_jwt_token(user_id: int, expires_in: int = 3600) -> str:
 
     try:
         token = jwt.encode(payload, secret, algorithm="HS256")
-        current_app.logger.debug(f"[JWT] Created token for user {user_id}")
+        current_app.logger.debug("[JWT] Created token for user %s", user_id)
         return token.decode("utf-8") if isinstance(token, bytes) else token
     except Exception as e:
         current_app.logger.error(f"[JWT] Failed to create token: {e}")
@@ -0,0 +1,73 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+class TokenCache:
+    """
+    In-process, thread-safe LRU of verified JWT claims, keyed by the sha256
+    digest of the token so raw tokens are not kept in memory. An entry lives
+    until the token's `exp` or JWT_CACHE_TTL seconds, whichever comes first,
+    so a cached token is never accepted after it expires. JWT_CACHE_MAX_ENTRIES
+    of 0 turns the cache off.
+    """
+
+    def __init__(self, app=None):
+        self.max_entries = 0
+        self.ttl = 60
+        self._entries = OrderedDict()  # digest -> (claims, expires_at)
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.max_entries = int(app.config.get("JWT_CACHE_MAX_ENTRIES", 4096))
+        self.ttl = int(app.config.get("JWT_CACHE_TTL", 60))
+        # Entries were verified with the previous app's SECRET_KEY
+        self.clear()
+        app.extensions["token_cache"] = self
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str, now: float = None):
+        """Claims of a token verified earlier and not yet expired, else None."""
+        if not self.max_entries:
+            return None
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if expires_at <= (now or time.time()):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def put(self, token: str, claims: dict, now: float = None):
+        if not self.max_entries:
+            return
+        expires_at = (now or time.time()) + self.ttl
+        if "exp" in claims:
+            expires_at = min(expires_at, float(claims["exp"]))
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (claims, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, token: str):
+        with self._lock:
+            self._entries.pop(self._key(token), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
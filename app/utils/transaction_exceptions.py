@@ -13,6 +13,11 @@ class InvalidTransactionDataError(TransactionError):
     pass
 
 
+class InvalidCursorError(InvalidTransactionDataError):
+    """Raised when a pagination cursor cannot be decoded."""
+    pass
+
+
 class CategoryNotFoundError(TransactionError):
     """Raised when the referenced category does not exist."""
     pass
@@ -47,3 +52,8 @@ class TransactionDeleteError(TransactionError):
 class TransactionDatabaseError(TransactionError):
     """Raised for unexpected DB commit or query errors."""
     pass
+
+
+class ConcurrentImportError(TransactionDatabaseError):
+    """Raised when a concurrent import keeps writing rows of the same batch; retrying the request is safe."""
+    pass
@@ -0,0 +1,77 @@
+"""
+CSV import validation time: per-row parse_csv_row (Pydantic + strptime)
+versus the vectorized pandas engine used by ?dry_run=true / ?engine=pandas.
+
+Generates a synthetic bank statement in memory (no database involved) and
+reports the median wall time for each engine and size.
+
+Usage:
+    python benchmarks/bench_csv_validate.py --sizes 10000 100000
+"""
+import argparse
+import csv
+import io
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.services.csv_services import iter_validated_chunks, parse_csv_row  # noqa: E402
+
+
+def make_csv(count: int) -> bytes:
+    rng = random.Random(7)
+    lines = ["category_name,type,amount,description,date"]
+    for i in range(count):
+        amount = "n/a" if i % 500 == 0 else f"{rng.uniform(1, 5000):.2f}"
+        lines.append(
+            f"{rng.choice(('Food', 'Rent', 'Fuel', 'Salary'))},{rng.choice(('income', 'Expense'))},"
+            f"{amount},row {i},{rng.randint(1, 12)}/{rng.randint(1, 28)}/2025"
+        )
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def validate_rows(data: bytes) -> int:
+    ok = 0
+    for row in csv.DictReader(io.StringIO(data.decode("utf-8"))):
+        try:
+            parse_csv_row(row)
+            ok += 1
+        except Exception:
+            pass
+    return ok
+
+
+def validate_frame(data: bytes) -> int:
+    return sum(len(valid) for valid, _ in iter_validated_chunks(io.BytesIO(data), 50000))
+
+
+def measure(func, data, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        valid = func(data)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples), valid
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'rows s':>8} {'pandas s':>9} {'valid':>8}")
+    for size in args.sizes:
+        data = make_csv(size)
+        row_seconds, row_valid = measure(validate_rows, data, args.repeat)
+        frame_seconds, frame_valid = measure(validate_frame, data, args.repeat)
+        assert row_valid == frame_valid
+        print(f"{size:>8} {row_seconds:>8.2f} {frame_seconds:>9.2f} {frame_valid:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Dashboard latency versus transaction count.
+
+Seeds a throwaway SQLite database with one user at increasing transaction
+counts and times SummaryService.get_dashboard_data, with the monthly_rollups
+table enabled and disabled. Also reports the number of SQL statements per call.
+
+Usage:
+    python benchmarks/bench_dashboard.py --sizes 1000 10000 100000
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# The engine is bound when the app is created, so point it at a scratch file first
+BENCH_DIR = tempfile.mkdtemp(prefix="budgetwise-bench-")
+os.environ["FLASK_ENV"] = "development"
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(BENCH_DIR, 'bench.db')}"
+
+from sqlalchemy import event, insert  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.extensions import db  # noqa: E402
+from app.models import Category, Transaction, User  # noqa: E402
+from app.services.rollup_service import rebuild_rollups  # noqa: E402
+from app.services.summary_services import SummaryService  # noqa: E402
+
+USER_ID = 1
+
+
+def seed(count: int):
+    rng = random.Random(7)
+    db.session.execute(insert(User), [{"id": USER_ID, "username": "bench", "email": "b@example.com", "password_hash": "x"}])
+    names = [("Salary", "income"), ("Bonus", "income"), ("Food", "expense"), ("Rent", "expense"),
+             ("Fuel", "expense"), ("Travel", "expense"), ("Bills", "expense"), ("Fun", "expense")]
+    db.session.execute(insert(Category), [{"user_id": USER_ID, "name": n, "type": t} for n, t in names])
+    categories = db.session.query(Category.id, Category.type).all()
+
+    start = date(2023, 1, 1)
+    rows = []
+    for _ in range(count):
+        cat_id, cat_type = rng.choice(categories)
+        created = start + timedelta(days=rng.randrange(730))
+        rows.append({
+            "user_id": USER_ID, "category_id": cat_id, "amount": round(rng.uniform(1, 5000), 2),
+            "description": "bench", "type": cat_type, "created_date": created, "updated_at": created,
+        })
+    for i in range(0, len(rows), 5000):
+        db.session.execute(insert(Transaction), rows[i:i + 5000])
+    db.session.commit()
+    rebuild_rollups()
+
+
+def measure(repeat: int):
+    statements = []
+
+    def count(*args, **kwargs):
+        statements.append(1)
+
+    samples = []
+    for _ in range(repeat):
+        statements.clear()
+        event.listen(db.engine, "before_cursor_execute", count)
+        started = time.perf_counter()
+        SummaryService.get_dashboard_data(USER_ID)
+        samples.append((time.perf_counter() - started) * 1000)
+        event.remove(db.engine, "before_cursor_execute", count)
+        db.session.expunge_all()
+    return statistics.median(samples), len(statements)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+
+    app = create_app()
+    print(f"{'transactions':>12} {'rollups':>8} {'median ms':>10} {'statements':>11}")
+    try:
+        with app.app_context():
+            for size in args.sizes:
+                db.drop_all()
+                db.create_all()
+                seed(size)
+                for use_rollups in (False, True):
+                    app.config["SUMMARY_USE_ROLLUPS"] = use_rollups
+                    ms, statements = measure(args.repeat)
+                    print(f"{size:>12} {str(use_rollups):>8} {ms:>10.2f} {statements:>11}")
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        shutil.rmtree(BENCH_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
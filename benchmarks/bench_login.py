@@ -0,0 +1,109 @@
+"""
+Login throughput under a burst, with bcrypt in the request thread versus
+the bounded hash pool.
+
+Registers one user, then has --clients threads log in --logins times in
+total through the Flask test client while a probe thread calls GET
+/api/auth/me in a loop. Reports logins per second, logins rejected with 503
+(pool saturated), and the probe's median / p95 latency, i.e. how much the
+burst slows the rest of the API.
+
+Usage:
+    python benchmarks/bench_login.py --rounds 10 12 --clients 16 --logins 64
+"""
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# The engine is bound when the app is created, so point it at a scratch file first
+BENCH_DIR = tempfile.mkdtemp(prefix="budgetwise-bench-")
+os.environ["FLASK_ENV"] = "development"
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(BENCH_DIR, 'bench.db')}"
+os.environ.setdefault("SECRET_KEY", "budgetwise-benchmark-secret-key-0123456789")
+
+from app import create_app  # noqa: E402
+from app.extensions import db, hash_pool  # noqa: E402
+from app.models import User  # noqa: E402
+from app.utils.security import create_jwt_token, hash_password  # noqa: E402
+
+EMAIL, PASSWORD = "bench@example.com", "bench-password"
+
+
+def burst(app, clients: int, logins: int):
+    statuses, probe = [], []
+    done = threading.Event()
+
+    def login_worker(count):
+        client = app.test_client()
+        for _ in range(count):
+            res = client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+            statuses.append(res.status_code)
+
+    def probe_worker():
+        client = app.test_client()
+        with app.app_context():
+            headers = {"Authorization": f"Bearer {create_jwt_token(1)}"}
+        while not done.is_set():
+            started = time.perf_counter()
+            client.get("/api/auth/me", headers=headers)
+            probe.append((time.perf_counter() - started) * 1000)
+
+    workers = [threading.Thread(target=login_worker, args=(logins // clients,)) for _ in range(clients)]
+    prober = threading.Thread(target=probe_worker)
+    prober.start()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    done.set()
+    prober.join()
+
+    ok = statuses.count(200)
+    p95 = statistics.quantiles(probe, n=20)[-1] if len(probe) > 1 else probe[0]
+    return ok / elapsed, statuses.count(503), statistics.median(probe), p95
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 12])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--logins", type=int, default=64)
+    args = parser.parse_args()
+
+    app = create_app()
+    app.logger.setLevel(logging.WARNING)  # the development config logs every request at DEBUG
+    pool_slots = hash_pool._slots
+    print(f"{'rounds':>6} {'mode':>7} {'logins/s':>9} {'503s':>5} {'probe p50 ms':>13} {'probe p95 ms':>13}")
+    try:
+        with app.app_context():
+            db.create_all()
+            for rounds in args.rounds:
+                hash_pool.rounds = rounds
+                User.query.delete()
+                db.session.add(User(id=1, username="bench", email=EMAIL, password_hash=hash_password(PASSWORD, rounds)))
+                db.session.commit()
+                for mode, slots in (("inline", None), ("pool", pool_slots)):
+                    # With no slots the pool runs bcrypt in the request thread, as before
+                    hash_pool._slots = slots
+                    rate, rejected, p50, p95 = burst(app, args.clients, args.logins)
+                    print(f"{rounds:>6} {mode:>7} {rate:>9.1f} {rejected:>5} {p50:>13.2f} {p95:>13.2f}")
+            hash_pool._slots = pool_slots
+            hash_pool.shutdown()
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        shutil.rmtree(BENCH_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+PDF report build time and peak memory versus row count.
+
+Feeds generate_pdf_report synthetic transactions (no database involved) and
+reports the median wall time and the tracemalloc peak for each size.
+
+Usage:
+    python benchmarks/bench_pdf_report.py --sizes 1000 10000 50000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.services.export_services import generate_pdf_report  # noqa: E402
+
+
+def make_transactions(count: int):
+    rng = random.Random(11)
+    categories = [SimpleNamespace(name=n) for n in ("Salary", "Food", "Rent", "Fuel", "Travel")]
+    start = date(2024, 1, 1)
+    return [
+        SimpleNamespace(
+            id=i,
+            created_date=start + timedelta(days=rng.randrange(365)),
+            type=rng.choice(("income", "expense")),
+            category=rng.choice(categories),
+            amount=Decimal(f"{rng.uniform(1, 5000):.2f}"),
+            description=rng.choice((None, "groceries", "monthly rent for the flat", "fuel")),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def build(transactions):
+    return generate_pdf_report(
+        user_id=1,
+        user_name="bench",
+        user_email="bench@example.com",
+        transactions=transactions,
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+    )
+
+
+def measure(transactions, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build(transactions)
+        samples.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    pdf = build(transactions)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(samples), peak, len(pdf)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'median s':>9} {'peak MiB':>9} {'pdf KiB':>9}")
+    for size in args.sizes:
+        transactions = make_transactions(size)
+        seconds, peak, pdf_size = measure(transactions, args.repeat)
+        print(f"{size:>8} {seconds:>9.2f} {peak / 2**20:>9.1f} {pdf_size / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Query-plan benchmark for the transaction hot paths.
+
+Seeds a throwaway SQLite database, then runs the hot queries twice: once with
+the composite transaction indexes dropped (the pre-migration schema) and once
+with them in place. Prints EXPLAIN QUERY PLAN output and the median latency.
+
+Usage:
+    python benchmarks/bench_query_plans.py --users 20 --rows-per-user 20000
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# The engine is bound when the app is created, so point it at a scratch file first
+BENCH_DIR = tempfile.mkdtemp(prefix="budgetwise-bench-")
+os.environ["FLASK_ENV"] = "development"
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(BENCH_DIR, 'bench.db')}"
+
+from sqlalchemy import func, insert, text  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.extensions import db  # noqa: E402
+from app.models import Category, Transaction, User  # noqa: E402
+
+TARGET_USER = 1
+
+
+def seed(users: int, rows_per_user: int):
+    rng = random.Random(42)
+    db.session.execute(insert(User), [
+        {"id": u, "username": f"user{u}", "email": f"user{u}@example.com", "password_hash": "x"}
+        for u in range(1, users + 1)
+    ])
+
+    categories = []
+    for u in range(1, users + 1):
+        for name, cat_type in [("Salary", "income"), ("Food", "expense"), ("Rent", "expense"),
+                               ("Fuel", "expense"), ("Bonus", "income")]:
+            categories.append({"user_id": u, "name": name, "type": cat_type})
+    db.session.execute(insert(Category), categories)
+    cat_rows = db.session.query(Category.id, Category.user_id, Category.type).all()
+
+    by_user = {}
+    for cat_id, user_id, cat_type in cat_rows:
+        by_user.setdefault(user_id, []).append((cat_id, cat_type))
+
+    start = date(2022, 1, 1)
+    for u in range(1, users + 1):
+        rows = []
+        for _ in range(rows_per_user):
+            cat_id, cat_type = rng.choice(by_user[u])
+            created = start + timedelta(days=rng.randrange(1460))
+            rows.append({
+                "user_id": u,
+                "category_id": cat_id,
+                "amount": round(rng.uniform(1, 5000), 2),
+                "description": "bench",
+                "type": cat_type,
+                "created_date": created,
+                "updated_at": created,
+            })
+        db.session.execute(insert(Transaction), rows)
+    db.session.commit()
+
+
+def hot_queries():
+    range_start, range_end = date(2024, 3, 1), date(2024, 6, 1)
+    return {
+        "list page (newest first)": (
+            db.session.query(Transaction.id)
+            .filter(Transaction.user_id == TARGET_USER)
+            .order_by(Transaction.created_date.desc(), Transaction.id.desc())
+            .limit(10)
+        ),
+        "date-range sum": (
+            db.session.query(func.sum(Transaction.amount))
+            .filter(Transaction.user_id == TARGET_USER)
+            .filter(Transaction.created_date >= range_start)
+            .filter(Transaction.created_date < range_end)
+        ),
+        "total by type": (
+            db.session.query(func.sum(Transaction.amount))
+            .filter(Transaction.user_id == TARGET_USER, Transaction.type == "expense")
+        ),
+        "top 3 by amount": (
+            db.session.query(Transaction.id, Transaction.amount)
+            .filter(Transaction.user_id == TARGET_USER, Transaction.type == "expense")
+            .order_by(Transaction.amount.desc())
+            .limit(3)
+        ),
+    }
+
+
+def explain(query):
+    sql = str(query.statement.compile(db.engine, compile_kwargs={"literal_binds": True}))
+    return [row[-1] for row in db.session.execute(text("EXPLAIN QUERY PLAN " + sql))]
+
+
+def time_query(query, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        query.all()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def run(label, repeat):
+    print(f"\n=== {label} ===")
+    for name, query in hot_queries().items():
+        ms = time_query(query, repeat)
+        print(f"{name:<28} {ms:8.2f} ms")
+        for step in explain(query):
+            print(f"    {step}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--rows-per-user", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_app()
+    try:
+        with app.app_context():
+            db.create_all()
+            indexes = list(Transaction.__table__.indexes)
+            for index in indexes:
+                index.drop(db.engine)
+
+            seed(args.users, args.rows_per_user)
+            print(f"Seeded {args.users * args.rows_per_user} transactions for {args.users} users")
+            db.session.execute(text("ANALYZE"))
+            run("before: PK/FK only", args.repeat)
+
+            for index in indexes:
+                index.create(db.engine)
+            db.session.execute(text("ANALYZE"))
+            run("after: composite indexes", args.repeat)
+
+            db.session.remove()
+            db.engine.dispose()
+    finally:
+        shutil.rmtree(BENCH_DIR, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
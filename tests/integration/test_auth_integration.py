@@ -1,5 +1,12 @@
+import threading
+from datetime import datetime, timedelta
+
+from app.models.refresh_token import RefreshToken
+from app.models.revoked_token import RevokedToken
+from app.services.token_service import DatabaseRevocationStore
 from app.models.user import User
-from app.extensions import db
+from app.extensions import db, hash_pool, revocation_list
+from app.utils.security import hash_password
 
 
 # -----------------------------------
@@ -63,6 +70,44 @@ def test_login_integration(client):
     assert res.json["user"]["email"] == "t@example.com"
 
 
+# -----------------------------------
+# LOGIN REHASHES OUTDATED COST
+# -----------------------------------
+def test_login_rehashes_outdated_cost(client, monkeypatch):
+    monkeypatch.setattr(hash_pool, "rounds", 4)
+    client.post("/api/auth/register", json={
+        "username": "tejas",
+        "email": "t@example.com",
+        "password": "password123"
+    })
+    assert User.query.one().password_hash.startswith("$2b$04$")
+
+    monkeypatch.setattr(hash_pool, "rounds", 5)
+    res = client.post("/api/auth/login", json={"email": "t@example.com", "password": "password123"})
+
+    assert res.status_code == 200
+    stored = User.query.one().password_hash
+    assert stored.startswith("$2b$05$")
+    assert client.post("/api/auth/login", json={
+        "email": "t@example.com", "password": "password123"
+    }).status_code == 200
+    assert User.query.one().password_hash == stored
+
+
+# -----------------------------------
+# LOGIN SATURATED
+# -----------------------------------
+def test_login_returns_503_when_hash_pool_saturated(client, monkeypatch):
+    monkeypatch.setattr(hash_pool, "_slots", threading.BoundedSemaphore(1))
+    hash_pool._slots.acquire()
+    db.session.add(User(username="tejas", email="t@example.com", password_hash=hash_password("password123", 4)))
+    db.session.commit()
+
+    res = client.post("/api/auth/login", json={"email": "t@example.com", "password": "password123"})
+
+    assert res.status_code == 503
+
+
 # -----------------------------------
 # LOGIN FAIL
 # -----------------------------------
@@ -99,4 +144,78 @@ def test_get_current_user(client, auth_header):
 def test_logout(client):
     res = client.post("/api/auth/logout")
     assert res.status_code == 200
-    assert res.json["message"].lower() == "logout successful."
\ No newline at end of file
+    assert res.json["message"].lower() == "logout successful."
+
+# -----------------------------------
+# REFRESH TOKENS
+# -----------------------------------
+def login(client):
+    db.session.add(User(username="tejas", email="t@example.com", password_hash=hash_password("password123", 4)))
+    db.session.commit()
+    return client.post("/api/auth/login", json={"email": "t@example.com", "password": "password123"}).json
+
+
+def test_refresh_rotates_tokens(client):
+    tokens = login(client)
+    assert tokens["expires_in"] == 3600
+
+    res = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+
+    assert res.status_code == 200
+    assert res.json["refresh_token"] != tokens["refresh_token"]
+    assert res.json["token"] != tokens["token"]
+    me = client.get("/api/auth/me", headers={"Authorization": f"Bearer {res.json['token']}"})
+    assert me.status_code == 200
+
+
+def test_refresh_token_reuse_revokes_family(client):
+    tokens = login(client)
+    rotated = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).json
+
+    replay = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert replay.status_code == 401
+
+    # The legitimate successor is revoked too
+    res = client.post("/api/auth/refresh", json={"refresh_token": rotated["refresh_token"]})
+    assert res.status_code == 401
+    assert RefreshToken.query.filter(RefreshToken.revoked_at.is_(None)).count() == 0
+
+
+def test_refresh_rejects_unknown_and_expired_tokens(client):
+    tokens = login(client)
+    assert client.post("/api/auth/refresh", json={"refresh_token": "nope"}).status_code == 401
+    assert client.post("/api/auth/refresh", json={}).status_code == 400
+
+    RefreshToken.query.update({"expires_at": datetime.utcnow() - timedelta(seconds=1)})
+    db.session.commit()
+    res = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert res.status_code == 401
+    assert "expired" in res.json["message"].lower()
+
+
+def test_logout_revokes_access_and_refresh_tokens(client):
+    tokens = login(client)
+    headers = {"Authorization": f"Bearer {tokens['token']}"}
+    assert client.get("/api/auth/me", headers=headers).status_code == 200    # now in the JWT cache
+
+    res = client.post("/api/auth/logout", headers=headers, json={"refresh_token": tokens["refresh_token"]})
+    assert res.status_code == 200
+
+    me = client.get("/api/auth/me", headers=headers)
+    assert me.status_code == 401
+    assert "revoked" in me.json["message"].lower()
+    assert client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).status_code == 401
+    # Still fine to call again
+    assert client.post("/api/auth/logout", headers=headers).status_code == 200
+
+
+def test_repeated_logout_with_database_revocation_store(app, client):
+    revocation_list.init_app(app, store=DatabaseRevocationStore())
+    tokens = login(client)
+    headers = {"Authorization": f"Bearer {tokens['token']}"}
+
+    assert client.post("/api/auth/logout", headers=headers).status_code == 200
+    assert client.post("/api/auth/logout", headers=headers).status_code == 200
+
+    assert RevokedToken.query.count() == 1
+    assert client.get("/api/auth/me", headers=headers).status_code == 401
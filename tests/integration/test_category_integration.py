@@ -65,6 +65,13 @@ def test_update_category_route(client, auth_header):
     assert data["category"]["name"] == "NewName"
     assert data["category"]["type"] == "income"
 
+def test_update_category_to_existing_name_route(client, auth_header):
+    seed_category(name="Food")
+    cat = seed_category(name="Groceries")
+    res = client.put(f"/api/categories/{cat.id}", json={"name": "Food"}, headers=auth_header)
+    assert res.status_code == 400
+    assert db.session.get(Category, cat.id).name == "Groceries"
+
 # ---------------------------
 # DELETE CATEGORY
 # ---------------------------
@@ -0,0 +1,474 @@
+from io import BytesIO
+
+import pytest
+from sqlalchemy import event
+
+from app.extensions import db, job_queue
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.utils.security import create_jwt_token
+
+
+# --------------------------------------------------------
+# HELPER: upload a CSV body
+# --------------------------------------------------------
+def upload(client, auth_header, text, url="/api/csv/import", filename="statement.csv"):
+    body = text if isinstance(text, bytes) else text.encode("utf-8")
+    return client.post(
+        url,
+        data={"file": (BytesIO(body), filename)},
+        headers=auth_header,
+        content_type="multipart/form-data",
+    )
+
+
+# --------------------------------------------------------
+# BULK IMPORT — REPORT FORMAT
+# --------------------------------------------------------
+def test_csv_import_reports_each_row(client, auth_header):
+    text = (
+        "category_name,type,amount,description,date\n"
+        "Food,expense,250.50,Lunch,10/18/2025\n"
+        "Salary,Income,5000,October,2025-10-01\n"
+        "Food,expense,abc,Bad amount,10/18/2025\n"
+        "Food,expense,12,Bad date,18.10.2025\n"
+        "Food,transfer,12,Bad type,10/18/2025\n"
+        ",expense,12,No category,10/18/2025\n"
+        "Food,expense,40,Dinner,\n"
+    )
+
+    res = upload(client, auth_header, text)
+
+    assert res.status_code == 201
+    data = res.json
+    assert data["success_count"] == 3
+    assert data["failed_count"] == 4
+    assert [d["row"] for d in data["details"]] == list(range(1, 8))
+    assert [d["status"] for d in data["details"]] == [
+        "success", "success", "failed", "failed", "failed", "failed", "success"
+    ]
+    assert data["details"][2]["error"] == "Invalid amount: abc"
+    assert data["details"][3]["error"] == "Invalid date format: 18.10.2025"
+    assert data["details"][4]["error"].startswith("type")
+    assert data["details"][5]["error"] == "Category not found or provided."
+    assert data["details"][5]["data"]["description"] == "No category"
+
+    assert Transaction.query.filter_by(user_id=1).count() == 3
+    assert Category.query.filter_by(user_id=1, name="Food").count() == 1
+
+
+def test_csv_import_statement_count_independent_of_rows(client, auth_header):
+    rows = "".join(f"Cat {i % 5},expense,{i + 1},Row {i},10/{i % 28 + 1}/2025\n" for i in range(300))
+    statements = []
+    listener = lambda *args, **kwargs: statements.append(1)
+
+    event.listen(db.engine, "before_cursor_execute", listener)
+    try:
+        res = upload(client, auth_header, "category_name,type,amount,description,date\n" + rows)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", listener)
+
+    assert res.json["success_count"] == 300
+    # category lookup, category insert, category re-select, fingerprint lookup,
+    # transaction insert, rollup upsert
+    assert len(statements) <= 6
+    assert Transaction.query.count() == 300
+
+
+# --------------------------------------------------------
+# UPLOAD HANDLING
+# --------------------------------------------------------
+def test_csv_import_reads_upload_stream(client, auth_header, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    text = "\ufeffcategory_name,type,amount,description,date\nFood,expense,10,Lunch,10/18/2025\n"
+
+    res = upload(client, auth_header, text)
+
+    assert res.status_code == 201
+    assert res.json["success_count"] == 1
+    assert res.json["lines_read"] == 2
+    assert list(tmp_path.iterdir()) == []   # nothing written to the working directory
+
+
+def test_csv_import_rejects_oversized_upload(client, auth_header, app, monkeypatch):
+    monkeypatch.setitem(app.config, "CSV_IMPORT_MAX_BYTES", 1024)
+    text = "category_name,type,amount,description,date\n" + "Food,expense,10,Lunch,10/18/2025\n" * 100
+
+    res = upload(client, auth_header, text)
+
+    assert res.status_code == 413
+    assert "too large" in res.json["message"]
+    assert Transaction.query.count() == 0
+
+
+def test_csv_import_rejects_non_utf8(client, auth_header):
+    res = upload(client, auth_header, b"category_name,type,amount,description,date\nCaf\xe9,expense,10,,\n")
+
+    assert res.status_code == 400
+    assert "UTF-8" in res.json["message"]
+
+
+# --------------------------------------------------------
+# DEDUPLICATION
+# --------------------------------------------------------
+def test_csv_reimport_skips_duplicates(client, auth_header):
+    header = "category_name,type,amount,description,date\n"
+    first = header + "Food,expense,4.50,Coffee,10/18/2025\nFood,expense,4.50,Coffee,10/18/2025\n"
+    # Overlapping statement: the same two coffees (description spacing/case differ) plus a new row
+    second = header + (
+        "Food,expense,4.5,coffee ,10/18/2025\n"
+        "Food,expense,4.50,COFFEE,10/18/2025\n"
+        "Food,expense,4.50,Coffee,10/19/2025\n"
+    )
+
+    assert upload(client, auth_header, first).json["success_count"] == 2
+    res = upload(client, auth_header, second)
+
+    assert res.json["success_count"] == 1
+    assert res.json["duplicate_count"] == 2
+    assert res.json["failed_count"] == 0
+    assert [d["status"] for d in res.json["details"]] == ["duplicate", "duplicate", "success"]
+    assert Transaction.query.count() == 3
+
+    again = upload(client, auth_header, second, url="/api/csv/import?engine=pandas")
+    assert again.json["duplicate_count"] == 3
+    assert Transaction.query.count() == 3
+
+
+def test_concurrent_duplicate_rolls_back_batch(client, auth_header, monkeypatch):
+    from app.models.monthly_rollup import MonthlyRollup
+    from app.services import transaction_service
+
+    text = "category_name,type,amount,description,date\nFood,expense,4.50,Coffee,10/18/2025\n"
+    upload(client, auth_header, text)
+    rollups = [(r.transaction_count, r.total_amount) for r in MonthlyRollup.query.all()]
+
+    # Another import keeps writing the row between our fingerprint lookup and the insert
+    monkeypatch.setattr(transaction_service, "_existing_fingerprints", lambda fingerprints: set())
+    res = upload(client, auth_header, text + "Food,expense,9,Tea,10/18/2025\n")
+
+    assert res.status_code == 409
+    assert Transaction.query.count() == 1
+    assert [(r.transaction_count, r.total_amount) for r in MonthlyRollup.query.all()] == rollups
+
+
+def test_concurrent_duplicate_batch_retried_once(client, auth_header, monkeypatch):
+    from app.services import transaction_service
+
+    text = "category_name,type,amount,description,date\nFood,expense,4.50,Coffee,10/18/2025\n"
+    upload(client, auth_header, text)
+
+    # The first lookup misses the concurrently written row; the retry's lookup sees it
+    real_existing, lookups = transaction_service._existing_fingerprints, []
+
+    def racing_existing(fingerprints):
+        lookups.append(1)
+        return set() if len(lookups) == 1 else real_existing(fingerprints)
+
+    monkeypatch.setattr(transaction_service, "_existing_fingerprints", racing_existing)
+    res = upload(client, auth_header, text + "Food,expense,9,Tea,10/18/2025\n")
+
+    assert res.status_code == 201
+    assert [d["status"] for d in res.json["details"]] == ["duplicate", "success"]
+    assert Transaction.query.count() == 2
+
+
+# --------------------------------------------------------
+# VECTORIZED ENGINE / DRY RUN
+# --------------------------------------------------------
+STATEMENT = (
+    "category_name,type,amount,description,date\n"
+    "Food,expense,250.50,Lunch,10/18/2025\n"
+    "Food,expense,abc,Bad amount,10/18/2025\n"
+    "Salary,income,5000,,10/01/2025\n"
+)
+
+
+def test_csv_dry_run_validates_without_writing(client, auth_header):
+    res = upload(client, auth_header, STATEMENT, url="/api/csv/import?dry_run=true")
+
+    assert res.status_code == 200
+    assert res.json["dry_run"] is True
+    assert res.json["success_count"] == 2
+    assert [(f["row"], f["error"]) for f in res.json["failures"]] == [(2, "Invalid amount: abc")]
+    assert Transaction.query.count() == 0
+    assert Category.query.count() == 0
+
+
+def test_csv_import_pandas_engine(client, auth_header):
+    res = upload(client, auth_header, STATEMENT, url="/api/csv/import?engine=pandas")
+
+    assert res.status_code == 201
+    assert res.json["success_count"] == 2
+    assert res.json["failed_count"] == 1
+    food = Transaction.query.filter_by(description="Lunch").one()
+    assert str(food.amount) == "250.50"
+    assert food.created_date.isoformat() == "2025-10-18"
+    assert Transaction.query.filter_by(type="income").one().description is None
+
+
+# --------------------------------------------------------
+# OTHER FORMATS (OFX / QIF / NDJSON)
+# --------------------------------------------------------
+def test_ofx_import_by_extension(client, auth_header):
+    text = (
+        "OFXHEADER:100\n<OFX><BANKTRANLIST>\n"
+        "<STMTTRN>\n<DTPOSTED>20251018\n<TRNAMT>-25.50\n<NAME>Corner Cafe\n</STMTTRN>\n"
+        "<STMTTRN>\n<DTPOSTED>bad\n<TRNAMT>10\n<NAME>Refund\n</STMTTRN>\n"
+        "</BANKTRANLIST></OFX>\n"
+    )
+
+    res = upload(client, auth_header, text, filename="statement.qfx")
+
+    assert res.status_code == 201
+    assert res.json["message"] == "✅ OFX import completed"
+    assert [r["status"] for r in res.json["details"]] == ["success", "failed"]
+    assert res.json["details"][1]["error"].startswith("date:")
+    tx = Transaction.query.one()
+    assert (tx.type, str(tx.amount), tx.description) == ("expense", "25.50", "Corner Cafe")
+    assert Category.query.filter_by(user_id=1, name="Uncategorized").count() == 1
+
+    # Same statement again: every transaction is a duplicate
+    again = upload(client, auth_header, text, filename="statement.qfx")
+    assert again.json["duplicate_count"] == 1
+
+
+def test_qif_import_by_format_param(client, auth_header):
+    text = "!Type:Bank\nD10/18/2025\nT-40.00\nPGrocer\nLFood\n^\n"
+
+    res = upload(client, auth_header, text, url="/api/csv/import?format=qif", filename="export.txt")
+
+    assert res.status_code == 201
+    assert res.json["success_count"] == 1
+    assert Transaction.query.one().category.name == "Food"
+
+
+def test_ndjson_async_import(client, auth_header, jobs_dir):
+    text = (
+        '{"category_name": "Food", "type": "expense", "amount": "12.10", "date": "2025-10-18"}\n'
+        "{oops\n"
+        '{"category_name": "Salary", "type": "income", "amount": 5000}\n'
+    )
+
+    res = upload(client, auth_header, text, url="/api/csv/import?async=true", filename="sync.ndjson")
+    job_queue.jobs[res.json["job_id"]].wait(timeout=10)
+
+    status = client.get(res.json["status_url"], headers=auth_header).json
+    assert status["result"]["success_count"] == 2
+    assert status["result"]["failed_count"] == 1
+    assert client.get(res.json["session_url"], headers=auth_header).json["format"] == "ndjson"
+    page = client.get(res.json["failures_url"], headers=auth_header).json
+    assert page["failures"][0]["data"] == "{oops"
+
+
+def test_unsupported_import_format(client, auth_header):
+    res = upload(client, auth_header, "x", url="/api/csv/import?format=xlsx")
+    assert res.status_code == 400
+
+    res = upload(client, auth_header, "!Type:Bank\n", url="/api/csv/import?dry_run=true", filename="a.qif")
+    assert res.status_code == 400
+    assert Transaction.query.count() == 0
+
+
+# --------------------------------------------------------
+# BACKGROUND IMPORT JOBS
+# --------------------------------------------------------
+@pytest.fixture()
+def jobs_dir(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(job_queue, "artifact_dir", str(tmp_path))
+    monkeypatch.setitem(app.config, "IMPORT_SESSION_DIR", str(tmp_path))
+    monkeypatch.setitem(app.config, "CSV_IMPORT_CHUNK_ROWS", 2)
+    yield tmp_path
+    job_queue.clear()
+
+
+def test_async_csv_import_job(client, auth_header, jobs_dir):
+    text = "category_name,type,amount,description,date\n" + "".join(
+        f"Food,expense,{'bad' if i % 3 == 0 else i},Row {i},10/18/2025\n" for i in range(1, 8)
+    )
+
+    res = upload(client, auth_header, text, url="/api/csv/import?async=true")
+    assert res.status_code == 202
+    assert res.headers["Location"] == res.json["status_url"]
+    job_queue.jobs[res.json["job_id"]].wait(timeout=10)
+
+    status = client.get(res.json["status_url"], headers=auth_header).json
+    assert status["status"] == "finished"
+    assert status["progress"] == {"lines_read": 8, "parsed": 7, "inserted": 5, "duplicates": 0, "failed": 2}
+    assert status["result"] == {"success_count": 5, "failed_count": 2, "duplicate_count": 0, "lines_read": 8}
+    assert list(jobs_dir.iterdir()) == []          # stored upload and failures file removed
+
+    page = client.get(f"{res.json['failures_url']}?per_page=1&page=2", headers=auth_header).json
+    assert page["total_items"] == 2
+    assert page["total_pages"] == 2
+    assert [f["row"] for f in page["failures"]] == [6]
+    assert page["failures"][0]["data"]["amount"] == "bad"
+
+    # Chunks are committed separately but share one category cache
+    assert Transaction.query.count() == 5
+    assert Category.query.filter_by(user_id=1, name="Food").count() == 1
+
+
+def test_async_csv_import_job_private_to_user(client, auth_header, jobs_dir):
+    res = upload(
+        client, auth_header, "category_name,type,amount,description,date\nFood,expense,1,,\n",
+        url="/api/csv/import?async=1",
+    )
+    job_queue.jobs[res.json["job_id"]].wait(timeout=10)
+
+    other = {"Authorization": f"Bearer {create_jwt_token(user_id=2)}"}
+    assert client.get(res.json["status_url"], headers=other).status_code == 404
+    assert client.get(res.json["failures_url"], headers=other).status_code == 404
+
+
+# --------------------------------------------------------
+# RESUMABLE IMPORT SESSIONS
+# --------------------------------------------------------
+def test_resumed_import_continues_from_checkpoint(client, auth_header, jobs_dir, monkeypatch):
+    from app.services import csv_services
+
+    rows = ["Food,expense,1,A,10/18/2025", "Food,expense,bad,B,10/18/2025",
+            "Food,expense,3,C,10/18/2025", "Food,expense,4,D,10/18/2025",
+            "Food,expense,4,D,10/18/2025", "Food,expense,oops,F,10/18/2025",
+            "Food,expense,7,G,10/18/2025"]
+    text = "category_name,type,amount,description,date\n" + "\n".join(rows) + "\n"
+
+    # Crash while importing the third chunk (rows 5-6)
+    real_import_rows, calls = csv_services.import_rows, []
+
+    def crashing_import_rows(*args, **kwargs):
+        calls.append(args[1])
+        if len(calls) == 3:
+            raise RuntimeError("worker died")
+        return real_import_rows(*args, **kwargs)
+
+    monkeypatch.setattr(csv_services, "import_rows", crashing_import_rows)
+    res = upload(client, auth_header, text, url="/api/csv/import?async=true")
+    job_queue.jobs[res.json["job_id"]].wait(timeout=10)
+
+    session = client.get(res.json["session_url"], headers=auth_header).json
+    assert session["status"] == "failed"
+    assert (session["rows_committed"], session["inserted"], session["failed"]) == (4, 3, 1)
+    assert Transaction.query.count() == 3
+
+    monkeypatch.setattr(csv_services, "import_rows", real_import_rows)
+    resumed = client.post(res.json["resume_url"], headers=auth_header)
+    assert resumed.status_code == 202
+    job_queue.jobs[resumed.json["job_id"]].wait(timeout=10)
+
+    status = client.get(resumed.json["status_url"], headers=auth_header).json
+    # Row 5 repeats row 4 inside the same file, so it is a new transaction, not a duplicate
+    assert status["result"] == {"success_count": 5, "failed_count": 2, "duplicate_count": 0, "lines_read": 4}
+    assert Transaction.query.count() == 5
+
+    page = client.get(resumed.json["failures_url"], headers=auth_header).json
+    assert [f["row"] for f in page["failures"]] == [2, 6]
+    assert client.get(res.json["session_url"], headers=auth_header).json["status"] == "completed"
+
+
+def test_resumed_ndjson_import_replays_category_id_rows(client, auth_header, jobs_dir, monkeypatch, app):
+    from app.services import csv_services
+
+    food = Category(name="Food", type="expense", user_id=1)
+    db.session.add(food)
+    db.session.commit()
+    # Three identical undated rows: the third repeats the first two, it is not a re-upload
+    line = f'{{"category_id": {food.id}, "type": "expense", "amount": "2.50", "description": "Coffee"}}\n'
+
+    real_import_rows, calls = csv_services.import_rows, []
+
+    def crashing_import_rows(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("worker died")
+        return real_import_rows(*args, **kwargs)
+
+    monkeypatch.setattr(csv_services, "import_rows", crashing_import_rows)
+    res = upload(client, auth_header, line * 3, url="/api/csv/import?async=true", filename="sync.ndjson")
+    job_queue.jobs[res.json["job_id"]].wait(timeout=10)
+    assert client.get(res.json["session_url"], headers=auth_header).json["rows_committed"] == 2
+
+    monkeypatch.setattr(csv_services, "import_rows", real_import_rows)
+    resumed = client.post(res.json["resume_url"], headers=auth_header)
+    job_queue.jobs[resumed.json["job_id"]].wait(timeout=10)
+
+    result = client.get(resumed.json["status_url"], headers=auth_header).json["result"]
+    assert (result["success_count"], result["duplicate_count"]) == (3, 0)
+    assert Transaction.query.count() == 3
+
+
+def test_failed_chunk_keeps_checkpoint_before_it(client, auth_header, jobs_dir, monkeypatch):
+    from app.services import csv_services
+    from app.utils.transaction_exceptions import TransactionDatabaseError
+
+    text = "category_name,type,amount,description,date\n" + "".join(
+        f"Food,expense,{i},Row {i},10/18/2025\n" for i in range(1, 6)
+    )
+    real_bulk_create, calls = csv_services.bulk_create_transactions, []
+
+    def failing_bulk_create(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 2:
+            raise TransactionDatabaseError("Failed to create transactions in bulk.")
+        return real_bulk_create(*args, **kwargs)
+
+    monkeypatch.setattr(csv_services, "bulk_create_transactions", failing_bulk_create)
+    res = upload(client, auth_header, text, url="/api/csv/import?async=true")
+    job_queue.jobs[res.json["job_id"]].wait(timeout=10)
+
+    session = client.get(res.json["session_url"], headers=auth_header).json
+    assert session["status"] == "failed"
+    assert (session["rows_committed"], session["inserted"], session["failed"]) == (2, 2, 0)
+
+    monkeypatch.setattr(csv_services, "bulk_create_transactions", real_bulk_create)
+    resumed = client.post(res.json["resume_url"], headers=auth_header)
+    job_queue.jobs[resumed.json["job_id"]].wait(timeout=10)
+
+    assert client.get(resumed.json["status_url"], headers=auth_header).json["result"]["success_count"] == 5
+    assert Transaction.query.count() == 5
+
+
+def test_import_session_resume_claims_session_across_workers(client, auth_header, jobs_dir, app, monkeypatch):
+    from datetime import datetime, timedelta
+    from app.models import ImportSession
+    from app.services import csv_services
+
+    real_import_rows = csv_services.import_rows
+    monkeypatch.setattr(csv_services, "import_rows", lambda *args, **kwargs: 1 / 0)
+    res = upload(
+        client, auth_header, "category_name,type,amount,description,date\nFood,expense,1,,\n",
+        url="/api/csv/import?async=true",
+    )
+    job_queue.jobs[res.json["job_id"]].wait(timeout=10)
+    monkeypatch.setattr(csv_services, "import_rows", real_import_rows)
+    session = db.session.get(ImportSession, res.json["session_id"])
+
+    # Held by a job on another worker, which this process's job queue knows nothing about
+    session.status, session.job_id, session.heartbeat_at = "running", "elsewhere", datetime.utcnow()
+    db.session.commit()
+    assert client.post(res.json["resume_url"], headers=auth_header).status_code == 409
+
+    # That worker died: once its lease lapses the session can be resumed here
+    lease = app.config["IMPORT_SESSION_LEASE_SECONDS"]
+    session.heartbeat_at = datetime.utcnow() - timedelta(seconds=lease + 1)
+    db.session.commit()
+    resumed = client.post(res.json["resume_url"], headers=auth_header)
+    assert resumed.status_code == 202
+    job_queue.jobs[resumed.json["job_id"]].wait(timeout=10)
+
+    db.session.expire_all()  # the job committed from its own session
+    session = client.get(res.json["session_url"], headers=auth_header).json
+    assert (session["status"], session["job_id"]) == ("completed", resumed.json["job_id"])
+    assert Transaction.query.count() == 1
+
+
+def test_import_session_resume_rejected_when_completed(client, auth_header, jobs_dir):
+    res = upload(
+        client, auth_header, "category_name,type,amount,description,date\nFood,expense,1,,\n",
+        url="/api/csv/import?async=true",
+    )
+    job_queue.jobs[res.json["job_id"]].wait(timeout=10)
+
+    assert client.post(res.json["resume_url"], headers=auth_header).status_code == 409
+    other = {"Authorization": f"Bearer {create_jwt_token(user_id=2)}"}
+    assert client.get(res.json["session_url"], headers=other).status_code == 404
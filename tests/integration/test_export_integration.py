@@ -0,0 +1,399 @@
+import csv
+import sys
+from datetime import date as dt_date
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+
+from app.extensions import db, job_queue, report_cache
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.routes import export_routes
+from app.services.export_services import export_pdf_rows, export_totals, export_transactions_query, pdf_row
+from app.utils.report_cache import DiskReportStore
+from app.utils.security import create_jwt_token
+
+
+# --------------------------------------------------------
+# HELPER: seed user + transactions inside app context
+# --------------------------------------------------------
+def seed_user(app):
+    with app.app_context():
+        db.session.add(User(id=1, username="tejas", email="t@example.com", password_hash="x"))
+        db.session.commit()
+
+
+def add_tx(amount, tx_type, cat_name, created, app, user_id=1):
+    with app.app_context():
+        category = Category.query.filter_by(name=cat_name, user_id=user_id).first()
+        if not category:
+            category = Category(name=cat_name, type=tx_type, user_id=user_id)
+            db.session.add(category)
+            db.session.commit()
+
+        db.session.add(Transaction(
+            user_id=user_id,
+            category_id=category.id,
+            amount=Decimal(amount),
+            type=tx_type,
+            created_date=created,
+            updated_at=created,
+            description="test",
+        ))
+        db.session.commit()
+
+
+def parse_csv(res):
+    return list(csv.reader(StringIO(res.get_data(as_text=True))))
+
+
+# --------------------------------------------------------
+# CSV EXPORT — STREAMED
+# --------------------------------------------------------
+def test_csv_export_streams_rows_and_totals(client, auth_header, app):
+    seed_user(app)
+    add_tx(300, "income", "Salary", dt_date(2025, 1, 2), app)
+    add_tx(40, "expense", "Food", dt_date(2025, 1, 5), app)
+    add_tx(60, "expense", "Food", dt_date(2025, 1, 3), app)
+    add_tx(999, "expense", "Food", dt_date(2025, 2, 1), app)
+
+    res = client.get("/api/export/csv?start_date=2025-01-01&end_date=2025-01-31", headers=auth_header)
+
+    assert res.status_code == 200
+    assert res.is_streamed
+    assert res.mimetype == "text/csv"
+    assert "budgetwise_report.csv" in res.headers["Content-Disposition"]
+
+    rows = parse_csv(res)
+    assert rows[0][0] == "Date"
+    assert [r[0] for r in rows[1:4]] == ["2025-01-02", "2025-01-03", "2025-01-05"]
+    assert rows[1][1].startswith("TX-1 ")
+    assert rows[-3:] == [["Total Income", "300.00"], ["Total Expenses", "100.00"], ["Net Balance", "200.00"]]
+
+
+def test_csv_export_type_filter(client, auth_header, app):
+    seed_user(app)
+    add_tx(300, "income", "Salary", dt_date(2025, 1, 2), app)
+    add_tx(40, "expense", "Food", dt_date(2025, 1, 5), app)
+
+    res = client.get(
+        "/api/export/csv?start_date=2025-01-01&end_date=2025-01-31&type=expense", headers=auth_header
+    )
+
+    rows = parse_csv(res)
+    assert len([r for r in rows if r and r[0].startswith("2025-")]) == 1
+    assert rows[-3] == ["Total Income", "0.00"]
+
+
+def test_csv_export_no_transactions(client, auth_header, app):
+    seed_user(app)
+
+    res = client.get("/api/export/csv?start_date=2025-01-01&end_date=2025-01-31", headers=auth_header)
+
+    assert res.status_code == 404
+
+
+# --------------------------------------------------------
+# PDF EXPORT
+# --------------------------------------------------------
+def test_pdf_export_success(client, auth_header, app):
+    seed_user(app)
+    add_tx(300, "income", "Salary", dt_date(2025, 1, 2), app)
+    add_tx(40, "expense", "Food", dt_date(2025, 1, 5), app)
+
+    res = client.get("/api/export/pdf?start_date=2025-01-01&end_date=2025-01-31", headers=auth_header)
+
+    assert res.status_code == 200
+    assert res.mimetype == "application/pdf"
+    assert res.data.startswith(b"%PDF")
+
+
+def test_export_totals_summed_in_sql(app):
+    seed_user(app)
+    add_tx("300.50", "income", "Salary", dt_date(2025, 1, 2), app)
+    add_tx("40.25", "expense", "Food", dt_date(2025, 1, 5), app)
+    add_tx("9.75", "expense", "Food", dt_date(2025, 1, 6), app)
+
+    query = export_transactions_query(1, dt_date(2025, 1, 1), dt_date(2025, 1, 31))
+
+    assert export_totals(query) == (Decimal("300.50"), Decimal("50.00"))
+    assert export_totals(export_transactions_query(1, dt_date(2024, 1, 1), dt_date(2024, 1, 31))) == (0, 0)
+
+
+def test_export_pdf_rows_match_orm_rows(app):
+    seed_user(app)
+    add_tx("300.50", "income", "Salary", dt_date(2025, 1, 2), app)
+    add_tx("40.25", "expense", "Food", dt_date(2025, 1, 5), app)
+
+    query = export_transactions_query(1, dt_date(2025, 1, 1), dt_date(2025, 1, 31))
+
+    assert export_pdf_rows(query) == [pdf_row(t) for t in query.all()]
+    assert export_pdf_rows(query)[0][3] == "Salary"
+
+
+# --------------------------------------------------------
+# BACKGROUND EXPORT JOBS
+# --------------------------------------------------------
+@pytest.fixture()
+def jobs_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(job_queue, "artifact_dir", str(tmp_path))
+    yield tmp_path
+    job_queue.clear()
+
+
+def test_csv_export_job_lifecycle(client, auth_header, app, jobs_dir):
+    seed_user(app)
+    add_tx(300, "income", "Salary", dt_date(2025, 1, 2), app)
+    add_tx(40, "expense", "Food", dt_date(2025, 1, 5), app)
+
+    res = client.post(
+        "/api/export/jobs",
+        json={"format": "csv", "start_date": "2025-01-01", "end_date": "2025-01-31"},
+        headers=auth_header,
+    )
+
+    assert res.status_code == 202
+    job_id = res.json["job_id"]
+    assert res.headers["Location"] == res.json["status_url"] == f"/api/export/jobs/{job_id}"
+    job_queue.jobs[job_id].wait(timeout=10)
+
+    status = client.get(f"/api/export/jobs/{job_id}", headers=auth_header)
+    assert status.json["status"] == "finished"
+    assert status.json["progress"] == {"total": 2, "processed": 2}
+
+    download = client.get(res.json["download_url"], headers=auth_header)
+    assert download.status_code == 200
+    assert download.mimetype == "text/csv"
+    rows = parse_csv(download)
+    assert rows[-1] == ["Net Balance", "260.00"]
+    download.close()
+
+
+def test_pdf_export_job(client, auth_header, app, jobs_dir):
+    seed_user(app)
+    add_tx(40, "expense", "Food", dt_date(2025, 1, 5), app)
+
+    res = client.post(
+        "/api/export/jobs?format=pdf&start_date=2025-01-01&end_date=2025-01-31", headers=auth_header
+    )
+    job_queue.jobs[res.json["job_id"]].wait(timeout=10)
+
+    download = client.get(res.json["download_url"], headers=auth_header)
+    assert download.status_code == 200
+    assert download.data.startswith(b"%PDF")
+    download.close()
+
+
+def test_export_job_rejects_bad_input(client, auth_header, app, jobs_dir):
+    seed_user(app)
+
+    bad_format = client.post("/api/export/jobs", json={"format": "xls"}, headers=auth_header)
+    bad_date = client.post("/api/export/jobs", json={"format": "csv", "start_date": "01/01/2025"}, headers=auth_header)
+    empty = client.post(
+        "/api/export/jobs", json={"format": "csv", "start_date": "2020-01-01", "end_date": "2020-01-31"},
+        headers=auth_header,
+    )
+
+    assert bad_format.status_code == 400
+    assert bad_date.status_code == 400
+    assert empty.status_code == 404
+
+
+def test_export_job_hidden_from_other_users(client, auth_header, app, jobs_dir):
+    seed_user(app)
+    add_tx(40, "expense", "Food", dt_date(2025, 1, 5), app)
+    res = client.post(
+        "/api/export/jobs", json={"format": "csv", "start_date": "2025-01-01", "end_date": "2025-01-31"},
+        headers=auth_header,
+    )
+    job_queue.jobs[res.json["job_id"]].wait(timeout=10)
+
+    other = {"Authorization": f"Bearer {create_jwt_token(user_id=2)}"}
+    assert client.get(f"/api/export/jobs/{res.json['job_id']}", headers=other).status_code == 404
+    assert client.get("/api/export/jobs/unknown", headers=auth_header).status_code == 404
+
+
+# --------------------------------------------------------
+# REPORT CACHE / ETAG
+# --------------------------------------------------------
+@pytest.fixture()
+def report_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(report_cache, "store", DiskReportStore(str(tmp_path)))
+    return report_cache.store
+
+
+def test_pdf_repeat_download_served_from_cache(client, auth_header, app, report_store, monkeypatch):
+    seed_user(app)
+    add_tx(40, "expense", "Food", dt_date(2025, 1, 5), app)
+    renders = []
+    real_render = export_routes.render_pdf_rows
+    monkeypatch.setattr(export_routes, "render_pdf_rows", lambda *a, **kw: renders.append(1) or real_render(*a, **kw))
+    url = "/api/export/pdf?start_date=2025-01-01&end_date=2025-01-31"
+
+    first = client.get(url, headers=auth_header)
+    second = client.get(url, headers=auth_header)
+
+    assert len(renders) == 1
+    assert first.headers["ETag"] == second.headers["ETag"]
+    assert first.data == second.data
+    assert "private" in second.headers["Cache-Control"]
+
+    etag = first.headers["ETag"]
+    not_modified = client.get(url, headers={**auth_header, "If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert len(renders) == 1
+
+    # A new transaction bumps the user's data version, so the report is rebuilt
+    add_tx(60, "expense", "Food", dt_date(2025, 1, 6), app)
+    changed = client.get(url, headers={**auth_header, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(renders) == 2
+    for res in (first, second, changed):
+        res.close()
+
+
+def test_etag_not_trusted_after_local_entry_expires(client, auth_header, app, report_store, monkeypatch):
+    # Process-local versions miss other workers' writes, so a 304 needs a live local entry
+    assert not report_cache.versions.versions_shared
+    seed_user(app)
+    add_tx(40, "expense", "Food", dt_date(2025, 1, 5), app)
+    renders = []
+    real_render = export_routes.render_pdf_rows
+    monkeypatch.setattr(export_routes, "render_pdf_rows", lambda *a, **kw: renders.append(1) or real_render(*a, **kw))
+    url = "/api/export/pdf?start_date=2025-01-01&end_date=2025-01-31"
+
+    first = client.get(url, headers=auth_header)
+    etag = first.headers["ETag"]
+    report_store.ttl = 0
+
+    revalidated = client.get(url, headers={**auth_header, "If-None-Match": etag})
+
+    assert revalidated.status_code == 200
+    assert len(renders) == 2
+    for res in (first, revalidated):
+        res.close()
+
+
+def test_csv_cached_after_stream_and_supports_range(client, auth_header, app, report_store):
+    seed_user(app)
+    add_tx(300, "income", "Salary", dt_date(2025, 1, 2), app)
+    url = "/api/export/csv?start_date=2025-01-01&end_date=2025-01-31"
+
+    streamed = client.get(url, headers=auth_header)
+    assert "Content-Length" not in streamed.headers
+    body = streamed.get_data()
+
+    # Served from the cached file this time, so the length is known up front
+    cached = client.get(url, headers=auth_header)
+    assert cached.headers["Content-Length"] == str(len(body))
+    assert cached.headers["ETag"] == streamed.headers["ETag"]
+    assert cached.data == body
+
+    partial = client.get(url, headers={**auth_header, "Range": "bytes=0-3"})
+    assert partial.status_code == 206
+    assert partial.data == body[:4]
+    for res in (cached, partial):
+        res.close()
+
+
+# --------------------------------------------------------
+# LARGE PDF REPORTS — SPOOLED
+# --------------------------------------------------------
+@pytest.fixture()
+def large_pdf(app, monkeypatch):
+    monkeypatch.setitem(app.config, "PDF_LARGE_REPORT_ROWS", 1)
+    monkeypatch.setattr(export_routes, "render_pdf_rows", None)  # the render pool must not be used
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_large_pdf_sent_with_length_and_range(client, auth_header, app, large_pdf, tmp_path, monkeypatch, cached):
+    monkeypatch.setattr(report_cache, "store", DiskReportStore(str(tmp_path)) if cached else None)
+    seed_user(app)
+    add_tx(300, "income", "Salary", dt_date(2025, 1, 2), app)
+    add_tx(40, "expense", "Food", dt_date(2025, 1, 5), app)
+    url = "/api/export/pdf?start_date=2025-01-01&end_date=2025-01-31"
+
+    full = client.get(url, headers=auth_header)
+    assert full.status_code == 200
+    assert full.data.startswith(b"%PDF")
+    assert full.headers["Content-Length"] == str(len(full.data))
+    assert full.headers["Accept-Ranges"] == "bytes"
+    assert ("ETag" in full.headers) == cached
+
+    partial = client.get(url, headers={**auth_header, "Range": "bytes=0-3"})
+    assert partial.status_code == 206
+    assert partial.data == b"%PDF"
+    assert partial.headers["Content-Range"] == f"bytes 0-3/{len(full.data)}"
+    for res in (full, partial):
+        res.close()
+
+
+def test_large_pdf_export_job(client, auth_header, app, jobs_dir, large_pdf):
+    seed_user(app)
+    add_tx(300, "income", "Salary", dt_date(2025, 1, 2), app)
+    add_tx(40, "expense", "Food", dt_date(2025, 1, 5), app)
+
+    res = client.post(
+        "/api/export/jobs?format=pdf&start_date=2025-01-01&end_date=2025-01-31", headers=auth_header
+    )
+    job = job_queue.jobs[res.json["job_id"]].wait(timeout=10)
+
+    assert job.status == "finished"
+    assert job.progress == {"total": 2, "processed": 2}
+    download = client.get(res.json["download_url"], headers=auth_header)
+    assert download.data.startswith(b"%PDF")
+    download.close()
+
+
+# --------------------------------------------------------
+# COLUMNAR EXPORT — PARQUET / ARROW
+# --------------------------------------------------------
+def test_columnar_export_without_pyarrow(client, auth_header, app, jobs_dir, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)  # import pyarrow now raises ImportError
+    seed_user(app)
+    add_tx(40, "expense", "Food", dt_date(2025, 1, 5), app)
+
+    res = client.get("/api/export/parquet?start_date=2025-01-01&end_date=2025-01-31", headers=auth_header)
+    job = client.post("/api/export/jobs", json={"format": "arrow"}, headers=auth_header)
+
+    assert res.status_code == 501
+    assert "pyarrow" in res.json["message"]
+    assert job.status_code == 501
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_columnar_export_round_trip(client, auth_header, app, monkeypatch, fmt):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    monkeypatch.setitem(app.config, "EXPORT_ROW_GROUP_ROWS", 2)
+    monkeypatch.setattr(report_cache, "store", None)
+    seed_user(app)
+    add_tx(300, "income", "Salary", dt_date(2025, 1, 2), app)
+    add_tx(40, "expense", "Food", dt_date(2025, 1, 5), app)
+    add_tx(15.5, "expense", "Food", dt_date(2025, 1, 9), app)
+
+    res = client.get(f"/api/export/{fmt}?start_date=2025-01-01&end_date=2025-01-31", headers=auth_header)
+    assert res.status_code == 200
+    assert res.headers["Content-Length"] == str(len(res.data))
+
+    source = pa.BufferReader(res.data)
+    if fmt == "parquet":
+        parquet = pa.parquet.ParquetFile(source)
+        assert parquet.num_row_groups == 2
+        table = parquet.read()
+    else:
+        reader = pa.ipc.open_file(source)
+        assert reader.num_record_batches == 2
+        table = reader.read_all()
+
+    assert pa.types.is_dictionary(table.schema.field("category").type)
+    assert table.column("category").to_pylist() == ["Salary", "Food", "Food"]
+    assert table.column("type").to_pylist() == ["income", "expense", "expense"]
+    assert table.column("amount").to_pylist() == [Decimal("300.00"), Decimal("40.00"), Decimal("15.50")]
+    assert table.column("date").to_pylist() == [dt_date(2025, 1, 2), dt_date(2025, 1, 5), dt_date(2025, 1, 9)]
+    res.close()
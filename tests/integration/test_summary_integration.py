@@ -1,7 +1,9 @@
 from datetime import date as dt_date
 from decimal import Decimal
 
-from app.extensions import db
+from sqlalchemy import event
+
+from app.extensions import db, result_cache
 from app.models.category import Category
 from app.models.transaction import Transaction
 
@@ -109,3 +111,82 @@ def test_dashboard_summary_integration(client, auth_header, app):
     assert data["total_income"] == 500.0
     assert data["total_expense"] == 200.0
     assert data["net_difference"] == 300.0
+
+
+# --------------------------------------------------------
+# ROLLUP AND RAW PATHS AGREE
+# --------------------------------------------------------
+def test_summary_rollups_match_raw_scan(client, auth_header, app):
+    add_tx(1, 500, "income", "Salary", dt_date(2025, 1, 1), app)
+    add_tx(1, 200, "expense", "Food", dt_date(2025, 2, 2), app)
+    add_tx(1, 80, "expense", "Food", dt_date(2025, 2, 28), app)
+
+    urls = [
+        "/api/summary/dashboard",
+        "/api/summary/period?period_type=date&start=2025-01-01&end=2025-02-28",
+        "/api/summary/subcategory?period_type=year&start=2025&end=2025",
+    ]
+
+    responses = {}
+    for use_rollups in (True, False):
+        app.config["SUMMARY_USE_ROLLUPS"] = use_rollups
+        result_cache.clear()
+        responses[use_rollups] = [client.get(url, headers=auth_header).json for url in urls]
+
+    assert responses[True] == responses[False]
+    assert responses[True][1]["expense_transaction_total"] == 280.0
+
+
+# --------------------------------------------------------
+# DASHBOARD — TWO STATEMENTS PER CALL
+# --------------------------------------------------------
+def test_dashboard_statement_count(client, auth_header, app):
+    for day in range(1, 6):
+        add_tx(1, 100 * day, "income", "Salary", dt_date(2025, 1, day), app)
+        add_tx(1, 10 * day, "expense", f"Cat {day}", dt_date(2025, day, 1), app)
+
+    statements = []
+
+    def count(*args, **kwargs):
+        statements.append(1)
+
+    for use_rollups in (True, False):
+        app.config["SUMMARY_USE_ROLLUPS"] = use_rollups
+        result_cache.clear()
+        statements.clear()
+        event.listen(db.engine, "before_cursor_execute", count)
+        res = client.get("/api/summary/dashboard", headers=auth_header)
+        event.remove(db.engine, "before_cursor_execute", count)
+
+        assert res.status_code == 200
+        assert len(statements) == 2
+        assert [t["amount"] for t in res.json["top_3_income"]] == [500.0, 400.0, 300.0]
+        assert res.json["overall_highest_expense"]["category"] == "Cat 5"
+
+
+# --------------------------------------------------------
+# RESULT CACHE — HITS UNTIL THE USER WRITES
+# --------------------------------------------------------
+def test_summary_cache_invalidated_by_writes(client, auth_header, app):
+    add_tx(1, 500, "income", "Salary", dt_date(2025, 1, 1), app)
+    result_cache.reset_stats()
+
+    first = client.get("/api/summary/dashboard", headers=auth_header).json
+    second = client.get("/api/summary/dashboard", headers=auth_header).json
+    assert first == second
+    assert result_cache.stats()["endpoints"]["summary.dashboard"] == {"hits": 1, "misses": 1}
+
+    # A write through the API bumps the user's version, so the next read recomputes
+    res = client.post(
+        "/api/transactions/log-transaction",
+        json={"amount": "120", "type": "expense", "category_name": "Food", "date": "2025-01-03"},
+        headers=auth_header,
+    )
+    assert res.status_code == 201
+
+    third = client.get("/api/summary/dashboard", headers=auth_header).json
+    assert third["total_expense"] == 120.0
+    assert result_cache.stats()["endpoints"]["summary.dashboard"] == {"hits": 1, "misses": 2}
+
+    health = client.get("/api/health").json["result_cache"]
+    assert (health["hits"], health["misses"], health["versions_shared"]) == (1, 2, False)
@@ -2,6 +2,7 @@ from app.models.category import Category
 from app.models.transaction import Transaction
 from app.extensions import db
 from datetime import datetime
+from sqlalchemy import event
 
 def to_date(s: str):
     return datetime.strptime(s, "%Y-%m-%d").date()
@@ -148,4 +149,180 @@ def test_delete_transaction(client, auth_header):
     assert res.json["message"] == "Transaction deleted successfully"
 
     # Verify deletion
-    assert Transaction.query.get(tr.id) is None
\ No newline at end of file
+    assert Transaction.query.get(tr.id) is None
+
+# -----------------------------------------
+# GET TRANSACTIONS — CURSOR PAGINATION
+# -----------------------------------------
+def test_get_transactions_cursor_pagination(client, auth_header):
+    category = seed_category(name="Snacks")
+
+    # Two rows share a date so the id tie-breaker is exercised
+    for i, day in enumerate(["2025-10-01", "2025-10-02", "2025-10-02", "2025-10-03", "2025-10-04"]):
+        db.session.add(Transaction(
+            user_id=1,
+            category_id=category.id,
+            amount=10 + i,
+            description=f"Snack {i}",
+            created_date=to_date(day),
+            updated_at=to_date(day),
+            type="expense"
+        ))
+    db.session.commit()
+
+    res = client.get("/api/transactions/?cursor=&per_page=2&include_total=true", headers=auth_header)
+    assert res.status_code == 200
+    assert res.json["total_items"] == 5
+    assert res.json["has_more"] is True
+
+    seen = [t["id"] for t in res.json["transactions"]]
+    cursor = res.json["next_cursor"]
+    while cursor:
+        res = client.get(f"/api/transactions/?cursor={cursor}&per_page=2", headers=auth_header)
+        assert res.status_code == 200
+        assert "total_items" not in res.json
+        seen += [t["id"] for t in res.json["transactions"]]
+        cursor = res.json["next_cursor"]
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+    dates = [db.session.get(Transaction, i).created_date for i in seen]
+    assert dates == sorted(dates, reverse=True)
+
+
+def test_get_transactions_invalid_cursor(client, auth_header):
+    res = client.get("/api/transactions/?cursor=not-a-cursor", headers=auth_header)
+    assert res.status_code == 400
+    assert "cursor" in res.json["error"].lower()
+
+
+# -----------------------------------------
+# QUERY COUNT — NO N+1 ON CATEGORY
+# -----------------------------------------
+class StatementCounter:
+    """Counts SQL statements sent to the engine while active."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+def seed_many_transactions(count, categories=10):
+    cats = [seed_category(name=f"Cat {i}") for i in range(categories)]
+    for i in range(count):
+        db.session.add(Transaction(
+            user_id=1,
+            category_id=cats[i % categories].id,
+            amount=i + 1,
+            description=f"Row {i}",
+            created_date=to_date("2025-10-01"),
+            updated_at=to_date("2025-10-01"),
+            type="expense"
+        ))
+    db.session.commit()
+    db.session.expunge_all()
+
+
+def test_get_transactions_constant_query_count(client, auth_header):
+    seed_many_transactions(100)
+
+    counts = {}
+    for per_page in (10, 100):
+        with StatementCounter(db.engine) as counter:
+            res = client.get(f"/api/transactions/?per_page={per_page}", headers=auth_header)
+        assert res.status_code == 200
+        assert len(res.json["transactions"]) == per_page
+        counts[per_page] = counter.count
+
+    assert counts[10] == counts[100]
+    assert counts[100] <= 2  # page SELECT + COUNT(*)
+
+    with StatementCounter(db.engine) as counter:
+        res = client.get("/api/transactions/?cursor=&per_page=100", headers=auth_header)
+    assert len(res.json["transactions"]) == 100
+    assert counter.count == 1
+
+
+def test_single_transaction_query_count(client, auth_header):
+    seed_many_transactions(3, categories=3)
+    tr_id = Transaction.query.first().id
+    db.session.expunge_all()
+
+    with StatementCounter(db.engine) as counter:
+        res = client.get(f"/api/transactions/{tr_id}", headers=auth_header)
+    assert res.status_code == 200
+    assert counter.count == 1
+
+    db.session.expunge_all()
+    with StatementCounter(db.engine) as counter:
+        res = client.put(f"/api/transactions/{tr_id}", json={"amount": "9"}, headers=auth_header)
+    assert res.status_code == 200
+    # SELECT, UPDATE, rollup upsert, reload after commit
+    assert counter.count <= 4
+
+
+# -----------------------------------------
+# BULK CREATE TRANSACTIONS
+# -----------------------------------------
+def test_bulk_create_transactions(client, auth_header):
+    existing = seed_category(name="Rent")
+
+    payload = [
+        {"amount": "1000", "type": "expense", "category_id": existing.id, "date": "2025-10-01"},
+        {"amount": "25.50", "type": "expense", "category_name": "Coffee"},
+        {"amount": "12", "type": "expense", "category_name": "Coffee"},
+        {"amount": "5000", "type": "income", "category_name": "Salary"},
+        {"amount": "abc", "type": "expense", "category_name": "Coffee"},
+        {"amount": "10", "type": "expense", "category_id": 9999},
+        {"amount": "10", "type": "expense"},
+    ]
+
+    res = client.post("/api/transactions/bulk", json=payload, headers=auth_header)
+    assert res.status_code == 201
+    data = res.json
+
+    assert data["success_count"] == 4
+    assert data["failed_count"] == 3
+    assert [r["status"] for r in data["results"]] == [
+        "success", "success", "success", "success", "failed", "failed", "failed"
+    ]
+    assert data["results"][4]["error"].startswith("amount")
+
+    assert Transaction.query.filter_by(user_id=1).count() == 4
+    assert Category.query.filter_by(user_id=1, name="Coffee").count() == 1
+
+
+def test_bulk_create_transactions_ndjson_constant_queries(client, auth_header):
+    lines = "\n".join(
+        f'{{"amount": "{i + 1}", "type": "expense", "category_name": "Cat {i % 5}"}}'
+        for i in range(200)
+    ) + "\nnot json\n"
+
+    with StatementCounter(db.engine) as counter:
+        res = client.post(
+            "/api/transactions/bulk",
+            data=lines,
+            headers={**auth_header, "Content-Type": "application/x-ndjson"},
+        )
+
+    assert res.status_code == 201
+    assert res.json["success_count"] == 200
+    assert res.json["results"][-1]["status"] == "failed"
+    # category lookup, category insert, category re-select, transaction insert, rollup upsert
+    assert counter.count <= 5
+    assert Transaction.query.count() == 200
+
+
+def test_bulk_create_transactions_rejects_non_list(client, auth_header):
+    res = client.post("/api/transactions/bulk", json={"amount": "1"}, headers=auth_header)
+    assert res.status_code == 400
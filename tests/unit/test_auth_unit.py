@@ -44,8 +44,12 @@ def test_register_user_already_exists(mock_user):
 # -----------------------------------
 @patch("app.services.auth_services.User")
 @patch("app.services.auth_services.verify_password", return_value=True)
-@patch("app.services.auth_services.create_jwt_token", return_value="fake.jwt.token")
-def test_login_success(mock_jwt, mock_verify, mock_user):
+@patch("app.services.auth_services.db")
+@patch(
+    "app.services.auth_services.issue_token_pair",
+    return_value={"token": "fake.jwt.token", "refresh_token": "fake-refresh", "expires_in": 3600},
+)
+def test_login_success(mock_tokens, mock_db, mock_verify, mock_user):
     mock_user.query.filter_by.return_value.first.return_value = MagicMock(
         id=1, username="tejas", email="test@mail.com", password_hash="hashed"
     )
@@ -0,0 +1,59 @@
+from io import BytesIO
+
+import pandas as pd
+
+from app.services.csv_services import detect_date_format, iter_validated_chunks, parse_csv_row
+
+
+def chunks(text, chunk_rows=10000):
+    return list(iter_validated_chunks(BytesIO(text.encode("utf-8")), chunk_rows))
+
+
+# --------------------------------------------------------
+# VECTORIZED VALIDATION
+# --------------------------------------------------------
+def test_detect_date_format_prefers_majority():
+    assert detect_date_format(pd.Series(["2025-10-01", "2025-10-02", "10/03/2025"])) == "%Y-%m-%d"
+    assert detect_date_format(pd.Series(["10/01/2025", "", "10/02/2025"])) == "%m/%d/%Y"
+
+
+def test_frame_validation_matches_row_parser():
+    text = (
+        "category_name,type,amount,description,date\n"
+        " Food ,Expense,250.50, Lunch ,10/18/2025\n"
+        "Food,expense,abc,Bad amount,10/18/2025\n"
+        "Salary,income,5000,,2025-10-01\n"
+        "Food,expense,12,Bad date,18.10.2025\n"
+        "Food,transfer,12,Bad type,10/18/2025\n"
+        ",expense,12,No category,\n"
+    )
+
+    [(valid, failures)] = chunks(text)
+
+    assert list(valid["row"]) == [1, 3]
+    first, salary = valid.to_dict("records")
+    expected = parse_csv_row({"category_name": " Food ", "type": "Expense", "amount": "250.50",
+                              "description": " Lunch ", "date": "10/18/2025"})
+    assert (first["category_name"], first["type"], first["description"], first["date"]) == (
+        expected.category_name, expected.type, expected.description, expected.date
+    )
+    assert salary["description"] is None
+
+    assert [(f["row"], f["error"]) for f in failures] == [
+        (2, "Invalid amount: abc"),
+        (4, "Invalid date format: 18.10.2025"),
+        (5, "type: Value error, type must be either 'income' or 'expense'"),
+        (6, "Category not found or provided."),
+    ]
+    assert failures[0]["data"]["description"] == "Bad amount"
+
+
+def test_frame_validation_row_numbers_span_chunks():
+    text = "category_name,type,amount,description,date\n" + "".join(
+        f"Food,expense,{'x' if i == 5 else i},,\n" for i in range(1, 8)
+    )
+
+    results = chunks(text, chunk_rows=3)
+
+    assert [len(valid) for valid, _ in results] == [3, 2, 1]
+    assert [f["row"] for _, failures in results for f in failures] == [5]
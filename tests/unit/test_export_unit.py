@@ -0,0 +1,90 @@
+from datetime import date as dt_date
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.services import export_services
+from app.services.export_services import _pages, generate_csv_report, iter_csv_report
+
+
+def fake_tx(i, amount, tx_type):
+    return SimpleNamespace(
+        id=i,
+        created_date=dt_date(2025, 1, 1),
+        type=tx_type,
+        category=SimpleNamespace(name="Food"),
+        amount=Decimal(amount),
+        description=None,
+    )
+
+
+# --------------------------------------------------------
+# CSV — CHUNKED OUTPUT
+# --------------------------------------------------------
+def test_iter_csv_report_flushes_in_chunks():
+    def rows():
+        for i in range(1, 11):
+            yield fake_tx(i, "10.00", "expense" if i % 2 else "income")
+
+    chunks = list(iter_csv_report(1, "tejas", "t@example.com", rows(), flush_rows=4))
+
+    # 10 rows flushed every 4 -> two row chunks plus the final summary chunk
+    assert len(chunks) == 3
+    text = "".join(chunks)
+    assert "TX-10 (ID:10)" in text
+    assert text.rstrip().endswith("Net Balance,0.00")
+
+
+def test_generate_csv_report_matches_stream():
+    txs = [fake_tx(1, "5.50", "income"), fake_tx(2, "2.25", "expense")]
+
+    text = generate_csv_report(1, "tejas", "t@example.com", txs)
+
+    assert text == "".join(iter_csv_report(1, "tejas", "t@example.com", txs))
+    assert "Total Income,5.50" in text
+    assert "Net Balance,3.25" in text
+
+
+# --------------------------------------------------------
+# PDF — LAYOUT BUILT ONCE
+# --------------------------------------------------------
+def test_pdf_pages_split_any_iterable():
+    pages = list(_pages((fake_tx(i, "1.00", "expense") for i in range(1, 26)), 10))
+
+    assert [len(p) for p in pages] == [10, 10, 5]
+    assert pages[2][0].id == 21
+
+
+def test_pdf_report_does_not_create_styles_per_call(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("styles must be built once at import")
+
+    monkeypatch.setattr(export_services, "ParagraphStyle", fail)
+    monkeypatch.setattr(export_services, "getSampleStyleSheet", fail)
+
+    rows = (fake_tx(i, "3.00", "income") for i in range(1, export_services.ROWS_PER_PAGE * 2 + 2))
+    pdf = export_services.generate_pdf_report(1, "tejas", "t@example.com", rows)
+
+    assert pdf.startswith(b"%PDF")
+
+
+def test_lazy_story_pulls_pages_on_demand():
+    pulled = []
+
+    def pages():
+        for i in range(5):
+            pulled.append(i)
+            yield [f"table-{i}", "spacer"]
+
+    story = export_services._LazyStory(["title"], pages())
+
+    assert story[0] == "title"
+    assert pulled == [0]           # one page buffered behind the heading
+
+    del story[0]
+    assert story[0] == "table-0" and pulled == [0]
+
+    consumed = []
+    while len(story):
+        consumed.append(story.pop(0))
+        assert len(pulled) <= len(consumed) // 2 + 2
+    assert pulled == [0, 1, 2, 3, 4]
@@ -0,0 +1,69 @@
+import threading
+import time
+
+import pytest
+
+from app.utils.auth_exceptions import PasswordHashingBusyError
+from app.utils.hash_pool import HashPool
+from app.utils.security import hash_password, password_needs_rehash
+
+
+@pytest.fixture()
+def pool(app):
+    app.config.update(PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_MAX_PENDING=1, PASSWORD_HASH_TIMEOUT=5)
+    pool = HashPool(app)
+    yield pool
+    pool.shutdown()
+
+
+# --------------------------------------------------------
+# RUN
+# --------------------------------------------------------
+def test_runs_inline_before_init_app():
+    assert HashPool().run(threading.get_ident) == threading.get_ident()
+
+
+def test_runs_on_worker_thread(pool):
+    assert pool.run(threading.get_ident) != threading.get_ident()
+
+
+# --------------------------------------------------------
+# SATURATION / TIMEOUT
+# --------------------------------------------------------
+def test_rejects_calls_beyond_workers_and_pending(pool):
+    release = threading.Event()
+    callers = [threading.Thread(target=pool.run, args=(release.wait, 5)) for _ in range(2)]
+    for caller in callers:
+        caller.start()
+    while pool._slots._value:
+        time.sleep(0.01)
+
+    with pytest.raises(PasswordHashingBusyError):
+        pool.run(int)
+
+    release.set()
+    for caller in callers:
+        caller.join(timeout=5)
+    assert pool.run(int) == 0
+
+
+def test_times_out_waiting_for_a_worker(pool):
+    pool.timeout = 0.2
+    release = threading.Event()
+    pool._get_executor().submit(release.wait, 5)  # occupies the only worker
+
+    with pytest.raises(PasswordHashingBusyError):
+        pool.run(int)
+    release.set()
+
+
+# --------------------------------------------------------
+# REHASH DETECTION
+# --------------------------------------------------------
+def test_password_needs_rehash():
+    hashed = hash_password("secret", 4)
+
+    assert hashed.startswith("$2b$04$")
+    assert not password_needs_rehash(hashed, 4)
+    assert password_needs_rehash(hashed, 12)
+    assert not password_needs_rehash("not-a-bcrypt-hash", 12)
@@ -0,0 +1,185 @@
+import pytest
+
+from app.services.importers import (
+    IMPORTERS,
+    get_importer,
+    importer_for,
+    parse_ndjson,
+    parse_ofx,
+    parse_ofx_amount,
+    parse_qif,
+    parse_qif_date,
+)
+from app.utils.csv_exceptions import UnsupportedImportFormatError
+
+
+OFX_SGML = """OFXHEADER:100
+DATA:OFXSGML
+VERSION:102
+
+<OFX>
+<BANKMSGSRSV1><STMTTRNRS><STMTRS>
+<BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20251018120000.000[-5:EST]
+<TRNAMT>-25.50
+<FITID>1
+<NAME>Corner Cafe
+<MEMO>Lunch &amp; coffee
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>CREDIT
+<DTPOSTED>20251001
+<TRNAMT>5000.00
+<FITID>2
+<NAME>ACME PAYROLL
+</STMTTRN>
+</BANKTRANLIST>
+</STMTRS></STMTTRNRS></BANKMSGSRSV1>
+</OFX>
+"""
+
+
+# --------------------------------------------------------
+# REGISTRY
+# --------------------------------------------------------
+def test_registry_resolves_by_name_and_extension():
+    assert {"csv", "ofx", "qif", "ndjson"} <= set(IMPORTERS)
+    assert importer_for("statement.QFX").name == "ofx"
+    assert importer_for("sync.jsonl").name == "ndjson"
+    assert importer_for("export.txt").name == "csv"
+    assert importer_for("statement.csv", "qif").name == "qif"
+
+    with pytest.raises(UnsupportedImportFormatError):
+        get_importer("xlsx")
+
+
+# --------------------------------------------------------
+# OFX / QFX
+# --------------------------------------------------------
+def test_ofx_sgml_records():
+    records = list(parse_ofx(OFX_SGML.splitlines(keepends=True)))
+
+    assert records == [
+        {"category_name": "Uncategorized", "type": "expense", "amount": "25.50",
+         "description": "Corner Cafe - Lunch & coffee", "date": "2025-10-18"},
+        {"category_name": "Uncategorized", "type": "income", "amount": "5000.00",
+         "description": "ACME PAYROLL", "date": "2025-10-01"},
+    ]
+    schema = get_importer("ofx").parse_row(records[0])
+    assert (schema.type, str(schema.amount), schema.date.isoformat()) == ("expense", "25.50", "2025-10-18")
+
+
+def test_ofx_xml_on_one_line_split_mid_tag():
+    body = ('<?xml version="1.0"?><OFX><BANKTRANLIST><STMTTRN><DTPOSTED>20251018</DTPOSTED>'
+            '<TRNAMT>-3</TRNAMT><NAME>Bus</NAME></STMTTRN></BANKTRANLIST></OFX>')
+    pieces = [body[i:i + 7] for i in range(0, len(body), 7)]
+
+    [record] = parse_ofx(pieces)
+
+    assert (record["type"], record["amount"], record["description"], record["date"]) == ("expense", "3", "Bus", "2025-10-18")
+
+
+def test_ofx_comma_decimal_amount():
+    body = "<OFX><STMTTRN><DTPOSTED>20251018<TRNAMT>-12,50<NAME>Bakery</STMTTRN></OFX>"
+
+    [record] = parse_ofx([body])
+
+    assert (record["type"], record["amount"]) == ("expense", "12.50")
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("-12,50", "-12.50"),
+    ("1250.00", "1250.00"),
+    ("1,250.00", "1,250.00"),      # not OFX; left for validation to reject
+    (None, None),
+])
+def test_ofx_amounts(value, expected):
+    assert parse_ofx_amount(value) == expected
+
+
+def test_ofx_records_are_yielded_incrementally():
+    consumed = []
+
+    def lines():
+        for line in OFX_SGML.splitlines(keepends=True):
+            consumed.append(line)
+            yield line
+
+    first = next(parse_ofx(lines()))
+
+    assert first["description"].startswith("Corner Cafe")
+    assert len(consumed) < len(OFX_SGML.splitlines())
+
+
+# --------------------------------------------------------
+# QIF
+# --------------------------------------------------------
+def test_qif_records_skip_accounts_and_splits():
+    text = """!Account
+NChecking
+TBank
+^
+!Type:Bank
+D10/18'25
+T-1,250.00
+PLandlord
+LRent/Home
+SRent
+$-1250.00
+^
+D10/01/2025
+T5000
+PACME
+LSalary
+^
+D10/02/2025
+T-100
+L[Savings]
+^
+D13/40/2025
+TX
+^
+!Type:Cat
+NFood
+E
+^
+"""
+    records = list(parse_qif(text.splitlines(keepends=True)))
+
+    assert [(r["category_name"], r["type"], r["amount"], r["date"]) for r in records] == [
+        ("Rent", "expense", "1250.00", "2025-10-18"),
+        ("Salary", "income", "5000", "2025-10-01"),
+        ("Transfer", "expense", "100", "2025-10-02"),
+        ("Uncategorized", None, "X", "13/40/2025"),
+    ]
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("10/18/2025", "2025-10-18"),
+    ("1/ 5'25", "2025-01-05"),
+    ("10/18/99", "1999-10-18"),
+    ("2025-10-18", "2025-10-18"),
+    ("18.10.2025", "18.10.2025"),
+])
+def test_qif_dates(value, expected):
+    assert parse_qif_date(value) == expected
+
+
+# --------------------------------------------------------
+# NDJSON
+# --------------------------------------------------------
+def test_ndjson_records_and_malformed_lines():
+    lines = [
+        '{"category_name": "Food", "type": "expense", "amount": 12.10, "date": "2025-10-18"}\n',
+        "\n",
+        "{not json\n",
+    ]
+    importer = get_importer("ndjson")
+
+    good, bad = parse_ndjson(lines)
+
+    assert str(importer.parse_row(good).amount) == "12.10"
+    with pytest.raises(ValueError, match="Invalid JSON object"):
+        importer.parse_row(bad)
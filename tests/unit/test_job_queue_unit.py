@@ -0,0 +1,83 @@
+import os
+import threading
+
+import pytest
+
+from app.utils.job_exceptions import JobNotFoundError, JobQueueFullError
+from app.utils.job_queue import JobQueue
+
+
+@pytest.fixture()
+def queue(app, tmp_path):
+    app.config.update(JOB_WORKERS=1, JOB_MAX_PENDING=2, JOB_RESULT_TTL=60, JOB_ARTIFACT_DIR=str(tmp_path))
+    q = JobQueue(app)
+    yield q
+    q.shutdown()
+
+
+# --------------------------------------------------------
+# RUN / RESULT
+# --------------------------------------------------------
+def test_job_runs_and_reports_progress(app, queue):
+    def work(job, n):
+        for i in range(n):
+            job.progress["processed"] = i + 1
+        return {"rows": n}
+
+    job = queue.submit(app, 1, "test", work, 5).wait(timeout=5)
+
+    assert job.status == "finished"
+    assert job.result == {"rows": 5}
+    assert job.to_dict()["progress"] == {"processed": 5}
+    assert job.expires_at == job.finished_at + 60
+
+
+def test_job_failure_is_recorded(app, queue):
+    def work(job):
+        raise ValueError("boom")
+
+    job = queue.submit(app, 1, "test", work).wait(timeout=5)
+
+    assert job.status == "failed"
+    assert job.error == "boom"
+
+
+# --------------------------------------------------------
+# BOUNDS / OWNERSHIP / EXPIRY
+# --------------------------------------------------------
+def test_queue_rejects_work_beyond_max_pending(app, queue):
+    release = threading.Event()
+    jobs = [queue.submit(app, 1, "test", lambda job: release.wait(5)) for _ in range(2)]
+
+    with pytest.raises(JobQueueFullError):
+        queue.submit(app, 1, "test", lambda job: None)
+
+    release.set()
+    for job in jobs:
+        job.wait(timeout=5)
+    queue.submit(app, 1, "test", lambda job: None).wait(timeout=5)
+
+
+def test_jobs_are_private_to_their_user(app, queue):
+    job = queue.submit(app, 1, "test", lambda job: None).wait(timeout=5)
+
+    assert queue.get(job.id, 1) is job
+    with pytest.raises(JobNotFoundError):
+        queue.get(job.id, 2)
+
+
+def test_expired_jobs_and_artifacts_are_purged(app, queue):
+    def work(job):
+        path = queue.artifact_path(job, "csv")
+        with open(path, "w") as f:
+            f.write("x")
+        job.artifact = (path, "text/csv", "report.csv")
+
+    job = queue.submit(app, 1, "test", work).wait(timeout=5)
+    path = job.artifact[0]
+
+    queue.purge_expired(now=job.expires_at + 1)
+
+    with pytest.raises(JobNotFoundError):
+        queue.get(job.id, 1)
+    assert not os.path.exists(path)
@@ -0,0 +1,50 @@
+import os
+import time
+from datetime import date as dt_date
+from decimal import Decimal
+
+import pytest
+
+from app.services.export_services import render_pdf_rows
+from app.utils.export_exceptions import RenderTimeoutError
+from app.utils.render_pool import RenderPool
+
+
+@pytest.fixture()
+def process_pool(app):
+    app.config.update(PDF_RENDER_MODE="process", PDF_RENDER_WORKERS=1, PDF_RENDER_TIMEOUT=30)
+    pool = RenderPool(app)
+    yield pool
+    pool.shutdown(wait=False)
+
+
+# --------------------------------------------------------
+# INLINE (TESTING DEFAULT)
+# --------------------------------------------------------
+def test_inline_mode_runs_in_calling_process(app):
+    pool = RenderPool(app)
+
+    assert pool.mode == "inline"
+    assert pool.run(os.getpid) == os.getpid()
+
+
+# --------------------------------------------------------
+# PROCESS POOL
+# --------------------------------------------------------
+def test_process_mode_renders_pdf_from_plain_rows(process_pool):
+    rows = [(i, dt_date(2025, 1, 1), "expense", "Food", Decimal("2.50"), None) for i in range(1, 40)]
+
+    assert process_pool.run(os.getpid) != os.getpid()
+
+    pdf = process_pool.run(
+        render_pdf_rows, rows, user_id=1, user_name="tejas", user_email="t@example.com",
+        start_date=dt_date(2025, 1, 1), end_date=dt_date(2025, 1, 31),
+    )
+    assert pdf.startswith(b"%PDF")
+
+
+def test_process_mode_times_out(process_pool):
+    process_pool.timeout = 0.5
+
+    with pytest.raises(RenderTimeoutError):
+        process_pool.run(time.sleep, 2)
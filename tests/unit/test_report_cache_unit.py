@@ -0,0 +1,110 @@
+import tempfile
+
+from app.extensions import result_cache
+from app.utils.report_cache import DiskReportStore, ReportCache
+
+
+# --------------------------------------------------------
+# DISK STORE — LRU BY SIZE
+# --------------------------------------------------------
+def test_disk_store_evicts_least_recently_used(tmp_path):
+    store = DiskReportStore(str(tmp_path), max_bytes=10, ttl=60)
+    store.put("a", b"1234")
+    store.put("b", b"1234")
+    assert store.get("a")          # "a" becomes most recently used
+
+    store.put("c", b"1234")        # 12 bytes > 10: evict "b"
+
+    assert store.get("b") is None
+    assert open(store.get("a"), "rb").read() == b"1234"
+    assert store.get("c")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a", "c"]
+
+
+def test_disk_store_expires_entries(tmp_path):
+    store = DiskReportStore(str(tmp_path), ttl=0)
+    store.put("a", b"x")
+
+    assert store.get("a") is None
+    assert not (tmp_path / "a").exists()
+
+
+def test_disk_store_reindexes_existing_files(tmp_path):
+    DiskReportStore(str(tmp_path)).put("a", b"abc")
+
+    assert DiskReportStore(str(tmp_path)).get("a")
+
+
+def test_disk_store_limit_covers_shared_directory(tmp_path):
+    # Two workers sharing REPORT_CACHE_DIR: a rescan picks up the other's files
+    first = DiskReportStore(str(tmp_path), max_bytes=10, ttl=60, rescan_interval=0)
+    second = DiskReportStore(str(tmp_path), max_bytes=10, ttl=60, rescan_interval=0)
+    first.put("a", b"1234")
+    second.put("b", b"1234")
+    first.put("c", b"1234")        # 12 bytes in the directory > 10: evict "a"
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b", "c"]
+    assert first.get("a") is None
+
+
+def test_put_stream_commits_only_when_exhausted(tmp_path):
+    store = DiskReportStore(str(tmp_path))
+
+    assert "".join(store.put_stream("full", iter(["a,b\n", "c,d\n"]))) == "a,b\nc,d\n"
+    assert open(store.get("full")).read() == "a,b\nc,d\n"
+
+    partial = store.put_stream("partial", iter(["a,b\n", "c,d\n"]))
+    next(partial)
+    partial.close()                # client went away mid-download
+
+    assert store.get("partial") is None
+    assert list(tmp_path.iterdir()) == [tmp_path / "full"]
+
+
+def test_put_file_copies_from_start(tmp_path):
+    store = DiskReportStore(str(tmp_path))
+    spooled = tempfile.SpooledTemporaryFile()
+    spooled.write(b"%PDF-report")
+
+    path = store.put_file("a", spooled)
+
+    assert open(path, "rb").read() == b"%PDF-report"
+    assert store._total == len(b"%PDF-report")
+
+
+# --------------------------------------------------------
+# KEYS FOLLOW THE USER'S DATA VERSION
+# --------------------------------------------------------
+def test_report_key_changes_with_data_version(app, tmp_path):
+    cache = ReportCache()
+    cache.init_app(app, store=DiskReportStore(str(tmp_path)))
+
+    key = cache.key_for(1, "pdf", "2025-01-01", "2025-01-31", "all")
+    assert key == cache.key_for(1, "pdf", "2025-01-01", "2025-01-31", "all")
+    assert key != cache.key_for(1, "csv", "2025-01-01", "2025-01-31", "all")
+    assert key != cache.key_for(2, "pdf", "2025-01-01", "2025-01-31", "all")
+
+    result_cache.bump_version(1)
+    assert key != cache.key_for(1, "pdf", "2025-01-01", "2025-01-31", "all")
+
+
+def test_report_ttl_capped_without_shared_versions(app, tmp_path, monkeypatch):
+    # Other workers' writes do not bump lru versions, so files expire with the summary cache
+    monkeypatch.setitem(app.config, "REPORT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setitem(app.config, "REPORT_CACHE_TTL", 300)
+    monkeypatch.setitem(app.config, "CACHE_LOCAL_TTL", 15)
+    cache = ReportCache()
+    cache.init_app(app)
+
+    assert not result_cache.versions_shared
+    assert cache.store.ttl == 15
+
+
+def test_report_key_is_none_without_version_tracking(app, tmp_path):
+    cache = ReportCache()
+    cache.init_app(app, store=DiskReportStore(str(tmp_path)))
+    backend, result_cache.backend = result_cache.backend, None
+    try:
+        assert cache.key_for(1, "pdf", "2025-01-01", "2025-01-31", "all") is None
+    finally:
+        result_cache.backend = backend
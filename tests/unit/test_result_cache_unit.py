@@ -0,0 +1,139 @@
+import fnmatch
+import time
+from decimal import Decimal
+
+from app.extensions import db, result_cache
+from app.models.category import Category
+from app.services.category_service import CategoryService
+from app.utils.result_cache import LRUCacheBackend, RedisCacheBackend, ResultCache
+
+
+# --------------------------------------------------------
+# HELPER: in-memory stand-in for a Redis client
+# --------------------------------------------------------
+class FakeRedis:
+    """Implements the handful of Redis commands the cache backend uses."""
+
+    def __init__(self):
+        self.store = {}
+
+    def _alive(self, key):
+        value, expires_at = self.store.get(key, (None, None))
+        if expires_at is not None and expires_at < time.monotonic():
+            del self.store[key]
+            return None
+        return value
+
+    def get(self, key):
+        value = self._alive(key)
+        return value.encode() if value is not None else None
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and self._alive(key) is not None:
+            return None
+        self.store[key] = (str(value), time.monotonic() + ex if ex else None)
+        return True
+
+    def incr(self, key):
+        value = int(self._alive(key) or 0) + 1
+        self.store[key] = (str(value), None)
+        return value
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+    def scan_iter(self, pattern):
+        return [key for key in list(self.store) if fnmatch.fnmatch(key, pattern)]
+
+
+# --------------------------------------------------------
+# LRU BACKEND
+# --------------------------------------------------------
+def test_lru_backend_evicts_least_recently_used():
+    backend = LRUCacheBackend(max_entries=2, ttl=60)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    assert backend.get("a") == 1  # "a" is now most recent
+    backend.set("c", 3)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+    assert backend.get("c") == 3
+
+
+def test_lru_backend_expires_entries():
+    backend = LRUCacheBackend(max_entries=10, ttl=-1)
+    backend.set("a", 1)
+    assert backend.get("a") is None
+
+
+# --------------------------------------------------------
+# VERSIONED LOOKUPS + METRICS
+# --------------------------------------------------------
+def test_result_cache_versions_and_stats(app):
+    cache = ResultCache()
+    cache.init_app(app, backend=LRUCacheBackend())
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"total": len(calls)}
+
+    assert cache.get_or_compute(1, "summary.dashboard", {"a": 1, "b": 2}, compute) == {"total": 1}
+    # Param order does not matter
+    assert cache.get_or_compute(1, "summary.dashboard", {"b": 2, "a": 1}, compute) == {"total": 1}
+    # Other users never see this entry
+    assert cache.get_or_compute(2, "summary.dashboard", {"a": 1, "b": 2}, compute) == {"total": 2}
+
+    cache.bump_version(1)
+    assert cache.get_or_compute(1, "summary.dashboard", {"a": 1, "b": 2}, compute) == {"total": 3}
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["hit_ratio"] == 0.25
+
+
+def test_lru_backend_uses_short_local_ttl():
+    backend = ResultCache._backend_from_config({"CACHE_BACKEND": "lru", "CACHE_TTL": 300, "CACHE_LOCAL_TTL": 15})
+
+    assert isinstance(backend, LRUCacheBackend)
+    assert backend.ttl == 15
+
+
+# --------------------------------------------------------
+# REDIS BACKEND (FAKE CLIENT)
+# --------------------------------------------------------
+def test_redis_backend_round_trip(app):
+    client = FakeRedis()
+    cache = ResultCache()
+    cache.init_app(app, backend=RedisCacheBackend(client, ttl=60))
+
+    value = cache.get_or_compute(1, "summary.period", {"start": "2025"}, lambda: {"total": Decimal("10.50")})
+    assert value == {"total": Decimal("10.50")}
+
+    # Hits come back JSON-decoded, the same shape Flask would serialize
+    assert cache.get_or_compute(1, "summary.period", {"start": "2025"}, lambda: None) == {"total": "10.50"}
+
+    version = cache.get_version(1)
+    cache.bump_version(1)
+    assert cache.get_version(1) == version + 1
+    assert cache.get_or_compute(1, "summary.period", {"start": "2025"}, lambda: {"total": 0}) == {"total": 0}
+
+    cache.clear()
+    assert client.store == {}
+
+
+# --------------------------------------------------------
+# WRITES BUMP THE USER'S VERSION ON COMMIT ONLY
+# --------------------------------------------------------
+def test_category_writes_bump_version(app):
+    before = result_cache.get_version(1)
+    CategoryService.create_category(name="Rent", type="expense", user_id=1)
+    assert result_cache.get_version(1) == before + 1
+    assert result_cache.get_version(2) == 0
+
+    db.session.add(Category(name="Draft", type="expense", user_id=1))
+    db.session.flush()
+    db.session.rollback()
+    assert result_cache.get_version(1) == before + 1
@@ -0,0 +1,104 @@
+import time
+
+import pytest
+
+from app.extensions import db
+from app.models.revoked_token import RevokedToken
+from app.services.token_service import DatabaseRevocationStore
+from app.utils.revocation_list import MemoryRevocationStore, RevocationList
+
+
+@pytest.fixture()
+def store():
+    return MemoryRevocationStore()
+
+
+def make_list(app, store, sync_seconds=5):
+    app.config.update(TOKEN_REVOCATION_SYNC_SECONDS=sync_seconds)
+    revocations = RevocationList()
+    revocations.init_app(app, store=store)
+    return revocations
+
+
+# --------------------------------------------------------
+# IN-MEMORY LOOKUP / SYNC
+# --------------------------------------------------------
+def test_local_revocation_applies_at_once(app, store):
+    revocations = make_list(app, store)
+    exp = time.time() + 60
+
+    assert not revocations.is_revoked("a")
+    revocations.revoke("a", exp)
+
+    assert revocations.is_revoked("a")
+    assert not revocations.is_revoked("b")
+    assert not revocations.is_revoked(None)
+
+
+def test_other_process_revocations_arrive_on_sync(app, store, monkeypatch):
+    web1, web2 = make_list(app, store), make_list(app, store)
+    assert not web2.is_revoked("a")                  # first call syncs
+
+    web1.revoke("a", time.time() + 60)
+    calls = []
+    real_since = store.since
+    monkeypatch.setattr(store, "since", lambda cursor: calls.append(cursor) or real_since(cursor))
+
+    assert not web2.is_revoked("a")                  # within the sync interval: no store read
+    assert calls == []
+
+    web2._synced_at -= 5
+    assert web2.is_revoked("a")
+    assert calls == [0]                              # only entries after the last cursor are read
+
+
+def test_expired_entries_are_dropped_on_sync(app, store):
+    revocations = make_list(app, store, sync_seconds=0)
+    revocations.revoke("old", 1000)
+    revocations.revoke("new", 5000)
+
+    assert not revocations.is_revoked("old", now=2000)
+    assert len(revocations) == 1
+
+
+def test_sync_failure_keeps_previous_list(app, store, monkeypatch):
+    revocations = make_list(app, store, sync_seconds=0)
+    revocations.revoke("a", time.time() + 60)
+
+    def broken(cursor):
+        raise ConnectionError("store down")
+
+    monkeypatch.setattr(store, "since", broken)
+    assert revocations.is_revoked("a")
+
+
+# --------------------------------------------------------
+# DATABASE STORE
+# --------------------------------------------------------
+def test_database_store_reads_after_cursor(app):
+    store = DatabaseRevocationStore(overlap=0)
+    now = time.time()
+    store.add("expired", now - 1)
+    store.add("a", now + 60)
+
+    entries, cursor = store.since(None)
+    assert entries == [("a", int(now + 60))]
+
+    store.add("b", now + 60)
+    entries, _ = store.since(cursor)
+    assert [jti for jti, _ in entries] == ["b"]
+
+
+def test_database_store_rereads_rows_committed_below_cursor(app):
+    store = DatabaseRevocationStore(overlap=10)
+    now = time.time()
+    store.add("a", now + 60)
+    _, cursor = store.since(None)
+
+    # A row whose id was assigned before "a" but committed after it was read
+    db.session.add(RevokedToken(id=cursor - 1, jti="late", expires_at=int(now + 60)))
+    db.session.commit()
+
+    entries, next_cursor = store.since(cursor)
+    assert "late" in [jti for jti, _ in entries]
+    assert next_cursor == cursor
@@ -0,0 +1,106 @@
+from datetime import date as dt_date
+from decimal import Decimal
+
+from app.commands import rollups_cli
+from app.extensions import db
+from app.models.category import Category
+from app.models.monthly_rollup import MonthlyRollup
+from app.models.transaction import Transaction
+from app.schemas.transaction_schemas import TransactionCreateSchema, TransactionUpdateSchema
+from app.services.rollup_service import month_span, rebuild_rollups
+from app.services.transaction_service import (
+    bulk_create_transactions,
+    create_transaction,
+    delete_transaction,
+    update_transaction,
+)
+
+
+# --------------------------------------------------------
+# HELPER: snapshot of the rollup table
+# --------------------------------------------------------
+def rollup_snapshot():
+    return {
+        (r.user_id, r.year, r.month, r.category_id, r.type): (r.transaction_count, Decimal(r.total_amount))
+        for r in MonthlyRollup.query.all()
+    }
+
+
+def rebuilt_snapshot():
+    rebuild_rollups()
+    return rollup_snapshot()
+
+
+# --------------------------------------------------------
+# CREATE / UPDATE / DELETE KEEP ROLLUPS IN SYNC
+# --------------------------------------------------------
+def test_rollups_follow_transaction_writes(app):
+    food = create_transaction(1, TransactionCreateSchema(
+        amount=Decimal("100.00"), type="expense", category_name="Food", date=dt_date(2025, 1, 10)
+    ))
+    create_transaction(1, TransactionCreateSchema(
+        amount=Decimal("50.00"), type="expense", category_name="Food", date=dt_date(2025, 1, 20)
+    ))
+    salary = create_transaction(1, TransactionCreateSchema(
+        amount=Decimal("900.00"), type="income", category_name="Salary", date=dt_date(2025, 2, 1)
+    ))
+
+    food_id = Category.query.filter_by(name="Food").first().id
+    assert rollup_snapshot()[(1, 2025, 1, food_id, "expense")] == (2, Decimal("150.00"))
+
+    # Moving a transaction to another month and amount shifts both buckets
+    update_transaction(food.id, TransactionUpdateSchema(amount=Decimal("70"), date=dt_date(2025, 3, 5)), 1)
+    snapshot = rollup_snapshot()
+    assert snapshot[(1, 2025, 1, food_id, "expense")] == (1, Decimal("50.00"))
+    assert snapshot[(1, 2025, 3, food_id, "expense")] == (1, Decimal("70.00"))
+
+    # Emptied buckets are removed rather than left at zero
+    delete_transaction(salary.id, 1)
+    assert not any(key[2] == 2 for key in rollup_snapshot())
+
+    assert rollup_snapshot() == rebuilt_snapshot()
+
+
+def test_rollups_follow_bulk_insert(app):
+    bulk_create_transactions(1, [
+        {"amount": "10", "type": "expense", "category_name": "Coffee", "date": "2024-12-30"},
+        {"amount": "15", "type": "expense", "category_name": "Coffee", "date": "2024-12-31"},
+        {"amount": "20", "type": "expense", "category_name": "Coffee", "date": "2025-01-01"},
+    ])
+
+    snapshot = rollup_snapshot()
+    assert sorted(v for v in snapshot.values()) == [(1, Decimal("20.00")), (2, Decimal("25.00"))]
+    assert snapshot == rebuilt_snapshot()
+
+
+# --------------------------------------------------------
+# REBUILD COMMAND
+# --------------------------------------------------------
+def test_rollups_rebuild_command(app):
+    category = Category(name="Rent", type="expense", user_id=1)
+    db.session.add(category)
+    db.session.commit()
+    db.session.add(Transaction(
+        user_id=1, category_id=category.id, amount=Decimal("1200"), type="expense",
+        created_date=dt_date(2025, 4, 1), updated_at=dt_date(2025, 4, 1),
+    ))
+    db.session.commit()
+
+    MonthlyRollup.query.delete()
+    db.session.commit()
+    assert rollup_snapshot() == {}
+
+    result = app.test_cli_runner().invoke(rollups_cli, ["rebuild"])
+    assert result.exit_code == 0
+    assert "1 rows written" in result.output
+    assert rollup_snapshot() == {(1, 2025, 4, category.id, "expense"): (1, Decimal("1200.00"))}
+
+
+# --------------------------------------------------------
+# MONTH ALIGNMENT
+# --------------------------------------------------------
+def test_month_span_alignment():
+    assert month_span(dt_date(2024, 11, 1), dt_date(2025, 3, 1)) == (2024 * 12 + 10, 2025 * 12 + 1)
+    assert month_span(dt_date(2024, 11, 2), dt_date(2025, 3, 1)) is None
+    assert month_span(dt_date(2024, 11, 1), dt_date(2025, 2, 28)) is None
+    assert month_span(dt_date(2025, 3, 1), dt_date(2025, 3, 1)) is None
@@ -1,10 +1,14 @@
+import os
 import pytest
 from datetime import date as dt_date
 from decimal import Decimal
 
+from sqlalchemy import create_engine, text
+
 from app.extensions import db
 from app.models.category import Category
 from app.models.transaction import Transaction
+from app.models.user import User
 from app.services.summary_services import SummaryService
 from app.utils.summary_exceptions import SummaryNotFoundError, InvalidPeriodTypeError
 
@@ -130,3 +134,85 @@ def test_summary_by_subcategory_no_data(app):
             end="2020",
             subcategory="Food",
         )
+
+
+# --------------------------------------------------------
+# PERIOD FILTER — HALF-OPEN RANGES
+# --------------------------------------------------------
+@pytest.mark.parametrize("use_rollups", [True, False])
+def test_summary_month_range_across_year_boundary(app, use_rollups):
+    app.config["SUMMARY_USE_ROLLUPS"] = use_rollups
+    for created in (dt_date(2024, 10, 31), dt_date(2024, 11, 1), dt_date(2024, 12, 15),
+                    dt_date(2025, 1, 5), dt_date(2025, 2, 28), dt_date(2025, 3, 1)):
+        seed_transaction(app=app, amount=10, created=created)
+
+    data = SummaryService.get_summary_by_period(
+        user_id=1, period_type="month", start="2024-11", end="2025-02"
+    ).model_dump()
+
+    # Nov, Dec, Jan and Feb only; the old extract(month) BETWEEN 11 AND 2 matched nothing
+    assert data["transactions_count"] == 4
+    assert data["expense_transaction_total"] == 40.0
+    assert data["range_start"] == "2024-11-01"
+    assert data["range_end"] == "2025-02-28"
+
+
+def test_summary_date_range_includes_end_day(app):
+    seed_transaction(app=app, amount=10, created=dt_date(2024, 12, 31))
+    seed_transaction(app=app, amount=20, created=dt_date(2025, 1, 1))
+
+    data = SummaryService.get_summary_by_period(
+        user_id=1, period_type="date", start="2024-12-20", end="2024-12-31"
+    ).model_dump()
+
+    assert data["transactions_count"] == 1
+    assert data["range_end"] == "2024-12-31"
+
+
+def test_period_filter_bounds_are_half_open():
+    _, start, end = SummaryService._build_period_filter("year", "2024", "2025")
+    assert (start, end) == (dt_date(2024, 1, 1), dt_date(2026, 1, 1))
+
+    _, start, end = SummaryService._build_period_filter("month", "2024-11", "2024-12")
+    assert (start, end) == (dt_date(2024, 11, 1), dt_date(2025, 1, 1))
+
+    _, start, end = SummaryService._build_period_filter("date", "2025-01-01", "2025-01-31")
+    assert (start, end) == (dt_date(2025, 1, 1), dt_date(2025, 2, 1))
+
+
+def _period_query(period_type, start, end):
+    condition, _, _ = SummaryService._build_period_filter(period_type, start, end)
+    return db.session.query(Transaction.id).filter(Transaction.user_id == 1).filter(condition)
+
+
+@pytest.mark.parametrize("period_type,start,end", [
+    ("year", "2024", "2025"),
+    ("month", "2024-11", "2025-02"),
+    ("date", "2025-01-01", "2025-01-31"),
+])
+def test_period_filter_uses_date_index_sqlite(app, period_type, start, end):
+    sql = str(_period_query(period_type, start, end).statement.compile(
+        db.engine, compile_kwargs={"literal_binds": True}
+    ))
+    plan = " ".join(row[-1] for row in db.session.execute(text("EXPLAIN QUERY PLAN " + sql)))
+
+    assert "ix_transactions_user_date_id" in plan
+    assert "created_date>" in plan and "created_date<" in plan
+
+
+@pytest.mark.skipif(not os.environ.get("MYSQL_TEST_URL"), reason="MYSQL_TEST_URL not set")
+def test_period_filter_uses_date_index_mysql(app):
+    engine = create_engine(os.environ["MYSQL_TEST_URL"])
+    tables = [User.__table__, Category.__table__, Transaction.__table__]
+    db.metadata.create_all(engine, tables=tables)
+    try:
+        with engine.connect() as conn:
+            sql = str(_period_query("month", "2024-11", "2025-02").statement.compile(
+                engine, compile_kwargs={"literal_binds": True}
+            ))
+            plan = conn.execute(text("EXPLAIN " + sql)).mappings().all()
+        assert plan[0]["type"] == "range"
+        assert plan[0]["key"] == "ix_transactions_user_date_id"
+    finally:
+        db.metadata.drop_all(engine, tables=tables)
+        engine.dispose()
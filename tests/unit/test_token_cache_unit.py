@@ -0,0 +1,62 @@
+import pytest
+
+from app.utils import protected
+from app.utils.security import create_jwt_token
+from app.utils.token_cache import TokenCache
+
+
+@pytest.fixture()
+def cache(app):
+    app.config.update(JWT_CACHE_MAX_ENTRIES=2, JWT_CACHE_TTL=60)
+    return TokenCache(app)
+
+
+# --------------------------------------------------------
+# EXPIRY / BOUNDS
+# --------------------------------------------------------
+def test_entries_end_at_exp_or_ttl(cache):
+    cache.put("short", {"sub": "1", "exp": 1030}, now=1000)
+    cache.put("long", {"sub": "2", "exp": 5000}, now=1000)
+
+    assert cache.get("short", now=1029) == {"sub": "1", "exp": 1030}
+    assert cache.get("short", now=1030) is None      # token expired
+    assert cache.get("long", now=1059)["sub"] == "2"
+    assert cache.get("long", now=1060) is None       # re-verified after JWT_CACHE_TTL
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    cache.put("a", {"sub": "1"}, now=0)
+    cache.put("b", {"sub": "2"}, now=0)
+    cache.get("a", now=1)
+    cache.put("c", {"sub": "3"}, now=1)
+
+    assert len(cache) == 2
+    assert cache.get("b", now=1) is None
+    assert cache.get("a", now=1) is not None
+
+
+def test_zero_entries_disables_cache(app):
+    app.config.update(JWT_CACHE_MAX_ENTRIES=0)
+    cache = TokenCache(app)
+
+    cache.put("a", {"sub": "1"})
+    assert cache.get("a") is None
+
+
+# --------------------------------------------------------
+# DECORATOR
+# --------------------------------------------------------
+def test_auth_required_verifies_each_token_once(client, monkeypatch):
+    calls = []
+    real_decode = protected.decode_jwt_token
+    monkeypatch.setattr(protected, "decode_jwt_token", lambda token: calls.append(token) or real_decode(token))
+    headers = {"Authorization": f"Bearer {create_jwt_token(user_id=1)}"}
+
+    for _ in range(3):
+        client.get("/api/auth/me", headers=headers)
+    assert len(calls) == 1
+
+    bad = {"Authorization": "Bearer not.a.token"}
+    assert client.get("/api/auth/me", headers=bad).status_code == 401
+    assert client.get("/api/auth/me", headers=bad).status_code == 401
+    assert len(calls) == 3                            # failures are never cached
@@ -4,8 +4,10 @@ from decimal import Decimal
 from datetime import date as dt_date
 
 from app.services.transaction_service import (
+    _fingerprint_rows,
     create_transaction,
     get_transaction_by_id,
+    transaction_fingerprint,
     update_transaction,
     delete_transaction
 )
@@ -182,3 +184,19 @@ def test_delete_transaction_not_found(mock_transaction):
 
     with pytest.raises(TransactionNotFoundError):
         delete_transaction(999, 1)
+
+
+# ---------------------------------------
+# IMPORT FINGERPRINTS
+# ---------------------------------------
+def test_bulk_fingerprints_match_transaction_fingerprint():
+    row = {"user_id": 1, "created_date": dt_date(2025, 10, 18), "amount": Decimal("4.5"),
+           "description": "  Corner  CAFE ", "type": "expense"}
+    rows = [dict(row), dict(row)]
+
+    _fingerprint_rows(rows, {})
+
+    assert [r["fingerprint"] for r in rows] == [
+        transaction_fingerprint(1, dt_date(2025, 10, 18), "4.50", "corner cafe", "expense", occurrence)
+        for occurrence in (0, 1)
+    ]